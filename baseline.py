@@ -127,7 +127,8 @@ def analyze_file(path):
     text = Path(path).read_text(encoding='utf-8', errors='replace')
 
     t0 = time.time()
-    tree, warnings = parse_with_diagnostics(text, filename=str(path))
+    tree, warnings, suppressed = parse_with_diagnostics(
+        text, filename=str(path))
     elapsed = time.time() - t0
 
     n_stmts = len(tree.statements)
@@ -148,7 +149,7 @@ def analyze_file(path):
         "statements": n_stmts,
         "svrf_nodes": svrf_count,
         "svrf_ratio": round(ratio, 4),
-        "total_warnings": len(warnings),
+        "total_warnings": len(warnings) + suppressed,
         "warning_categories": categorize_warnings(warnings),
         "node_type_distribution": dict(type_counts.most_common()),
     }
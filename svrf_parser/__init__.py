@@ -14,14 +14,15 @@ def parse(text, filename="<input>"):
 
 
 def parse_with_diagnostics(text, filename="<input>"):
-    """Parse SVRF source text and return (Program, warnings).
+    """Parse SVRF source text and return (Program, warnings, suppressed).
 
-    Like ``parse()`` but also returns the list of parser warning strings.
+    Like ``parse()`` but also returns the list of parser warning strings
+    and the number of further warnings dropped once that list was full.
     """
     lexer = Lexer(text, filename=filename)
     parser = Parser(lexer.tokens())
     tree = parser.parse()
-    return tree, parser.warnings
+    return tree, parser.warnings, parser.suppressed_warnings
 
 
 def parse_file(path):
@@ -32,7 +33,7 @@ def parse_file(path):
 
 
 def parse_file_with_diagnostics(path):
-    """Parse an SVRF file and return (Program, warnings)."""
+    """Parse an SVRF file and return (Program, warnings, suppressed)."""
     with open(path, 'r', encoding='utf-8', errors='replace') as f:
         text = f.read()
     return parse_with_diagnostics(text, filename=path)
@@ -60,12 +61,14 @@ _MIN_SVRF_NODE_RATIO = 0.2
 class ValidationResult:
     """Result of SVRF validation, containing validity status and diagnostics."""
 
-    __slots__ = ('valid', 'errors', 'warnings')
+    __slots__ = ('valid', 'errors', 'warnings', 'suppressed_warnings')
 
-    def __init__(self, valid, errors=None, warnings=None):
+    def __init__(self, valid, errors=None, warnings=None,
+                 suppressed_warnings=0):
         self.valid = valid
         self.errors = errors or []
         self.warnings = warnings or []
+        self.suppressed_warnings = suppressed_warnings
 
     def __bool__(self):
         return self.valid
@@ -82,7 +85,8 @@ def validate_svrf(text, filename="<input>"):
     Returns a ``ValidationResult`` whose boolean value indicates validity.
     The ``errors`` attribute contains diagnostic strings when validation
     fails.  The ``warnings`` attribute contains informational parser
-    warnings (available regardless of validity).
+    warnings (available regardless of validity), and
+    ``suppressed_warnings`` counts those dropped past the parser's cap.
 
     Validation is based on syntax analysis: the file is tokenized and
     parsed, then the ratio of SVRF-characteristic AST nodes to total
@@ -121,7 +125,8 @@ def validate_svrf(text, filename="<input>"):
     #    (directives, layer definitions, rule check blocks, etc.).
     if not program.statements:
         errors.append("Parsed file contains no statements")
-        return ValidationResult(False, errors, parser.warnings)
+        return ValidationResult(False, errors, parser.warnings,
+                                parser.suppressed_warnings)
 
     total = len(program.statements)
     svrf_count = sum(
@@ -133,7 +138,8 @@ def validate_svrf(text, filename="<input>"):
             "Parsed file contains no recognizable SVRF constructs "
             "(e.g. LAYER, directive, rule check, CONNECT, DEVICE)"
         )
-        return ValidationResult(False, errors, parser.warnings)
+        return ValidationResult(False, errors, parser.warnings,
+                                parser.suppressed_warnings)
 
     ratio = svrf_count / total
     if ratio < _MIN_SVRF_NODE_RATIO:
@@ -141,9 +147,11 @@ def validate_svrf(text, filename="<input>"):
             f"Only {svrf_count}/{total} ({ratio:.0%}) of top-level statements "
             f"are SVRF constructs (need >= {_MIN_SVRF_NODE_RATIO:.0%})"
         )
-        return ValidationResult(False, errors, parser.warnings)
+        return ValidationResult(False, errors, parser.warnings,
+                                parser.suppressed_warnings)
 
-    return ValidationResult(True, warnings=parser.warnings)
+    return ValidationResult(True, warnings=parser.warnings,
+                            suppressed_warnings=parser.suppressed_warnings)
 
 
 def is_valid_svrf(text, filename="<input>"):
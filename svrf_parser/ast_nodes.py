@@ -19,9 +19,10 @@ class AstNode:
 class Program(AstNode):
     __slots__ = ('statements',)
 
-    def __init__(self, statements=None, **kw):
-        super().__init__(**kw)
-        self.statements = statements or []
+    def __init__(self, statements=None, line=0, col=0):
+        self.line = line
+        self.col = col
+        self.statements = [] if statements is None else statements
 
 
 # ---- Preprocessor ----
@@ -29,8 +30,9 @@ class Program(AstNode):
 class Define(AstNode):
     __slots__ = ('name', 'value')
 
-    def __init__(self, name='', value=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', value=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
         self.value = value
 
@@ -39,28 +41,31 @@ class IfDef(AstNode):
     __slots__ = ('name', 'value', 'negated', 'then_body', 'else_body')
 
     def __init__(self, name='', value=None, negated=False,
-                 then_body=None, else_body=None, **kw):
-        super().__init__(**kw)
+                 then_body=None, else_body=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
         self.value = value
         self.negated = negated
-        self.then_body = then_body or []
-        self.else_body = else_body or []
+        self.then_body = [] if then_body is None else then_body
+        self.else_body = [] if else_body is None else else_body
 
 
 class Include(AstNode):
     __slots__ = ('path',)
 
-    def __init__(self, path='', **kw):
-        super().__init__(**kw)
+    def __init__(self, path='', line=0, col=0):
+        self.line = line
+        self.col = col
         self.path = path
 
 
 class EncryptedBlock(AstNode):
     __slots__ = ('content',)
 
-    def __init__(self, content='', **kw):
-        super().__init__(**kw)
+    def __init__(self, content='', line=0, col=0):
+        self.line = line
+        self.col = col
         self.content = content
 
 
@@ -69,18 +74,20 @@ class EncryptedBlock(AstNode):
 class LayerDef(AstNode):
     __slots__ = ('name', 'numbers')
 
-    def __init__(self, name='', numbers=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', numbers=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
-        self.numbers = numbers or []
+        self.numbers = [] if numbers is None else numbers
 
 
 class LayerMap(AstNode):
     __slots__ = ('gds_num', 'map_type', 'type_num', 'internal_num')
 
     def __init__(self, gds_num=0, map_type='DATATYPE',
-                 type_num=0, internal_num=0, **kw):
-        super().__init__(**kw)
+                 type_num=0, internal_num=0, line=0, col=0):
+        self.line = line
+        self.col = col
         self.gds_num = gds_num
         self.map_type = map_type
         self.type_num = type_num
@@ -92,8 +99,9 @@ class LayerMap(AstNode):
 class VariableDef(AstNode):
     __slots__ = ('name', 'expr')
 
-    def __init__(self, name='', expr=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', expr=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
         self.expr = expr
 
@@ -104,10 +112,11 @@ class Directive(AstNode):
     __slots__ = ('keywords', 'arguments', 'property_block')
 
     def __init__(self, keywords=None, arguments=None,
-                 property_block=None, **kw):
-        super().__init__(**kw)
-        self.keywords = keywords or []
-        self.arguments = arguments or []
+                 property_block=None, line=0, col=0):
+        self.line = line
+        self.col = col
+        self.keywords = [] if keywords is None else keywords
+        self.arguments = [] if arguments is None else arguments
         self.property_block = property_block
 
 
@@ -116,8 +125,9 @@ class Directive(AstNode):
 class LayerAssignment(AstNode):
     __slots__ = ('name', 'expression')
 
-    def __init__(self, name='', expression=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', expression=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
         self.expression = expression
 
@@ -127,11 +137,12 @@ class LayerAssignment(AstNode):
 class RuleCheckBlock(AstNode):
     __slots__ = ('name', 'description', 'body')
 
-    def __init__(self, name='', description=None, body=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', description=None, body=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
         self.description = description
-        self.body = body or []
+        self.body = [] if body is None else body
 
 
 # ---- CONNECT / SCONNECT ----
@@ -139,10 +150,11 @@ class RuleCheckBlock(AstNode):
 class Connect(AstNode):
     __slots__ = ('soft', 'layers', 'via_layer')
 
-    def __init__(self, soft=False, layers=None, via_layer=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, soft=False, layers=None, via_layer=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.soft = soft
-        self.layers = layers or []
+        self.layers = [] if layers is None else layers
         self.via_layer = via_layer
 
 
@@ -154,15 +166,16 @@ class Device(AstNode):
 
     def __init__(self, device_type=None, device_name=None,
                  seed_layer='', pins=None, aux_layers=None,
-                 cmacro=None, cmacro_args=None, **kw):
-        super().__init__(**kw)
+                 cmacro=None, cmacro_args=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.device_type = device_type
         self.device_name = device_name
         self.seed_layer = seed_layer
-        self.pins = pins or []
-        self.aux_layers = aux_layers or []
+        self.pins = [] if pins is None else pins
+        self.aux_layers = [] if aux_layers is None else aux_layers
         self.cmacro = cmacro
-        self.cmacro_args = cmacro_args or []
+        self.cmacro_args = [] if cmacro_args is None else cmacro_args
 
 
 # ---- DMACRO ----
@@ -170,20 +183,22 @@ class Device(AstNode):
 class DMacro(AstNode):
     __slots__ = ('name', 'params', 'body')
 
-    def __init__(self, name='', params=None, body=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', params=None, body=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
-        self.params = params or []
-        self.body = body or []
+        self.params = [] if params is None else params
+        self.body = [] if body is None else body
 
 
 class PropertyBlock(AstNode):
     __slots__ = ('properties', 'body')
 
-    def __init__(self, properties=None, body=None, **kw):
-        super().__init__(**kw)
-        self.properties = properties or []
-        self.body = body or []
+    def __init__(self, properties=None, body=None, line=0, col=0):
+        self.line = line
+        self.col = col
+        self.properties = [] if properties is None else properties
+        self.body = [] if body is None else body
 
 
 # ---- Miscellaneous Statements ----
@@ -191,8 +206,9 @@ class PropertyBlock(AstNode):
 class Group(AstNode):
     __slots__ = ('name', 'pattern')
 
-    def __init__(self, name='', pattern='', **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', pattern='', line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
         self.pattern = pattern
 
@@ -200,8 +216,9 @@ class Group(AstNode):
 class Attach(AstNode):
     __slots__ = ('layer', 'net')
 
-    def __init__(self, layer='', net='', **kw):
-        super().__init__(**kw)
+    def __init__(self, layer='', net='', line=0, col=0):
+        self.line = line
+        self.col = col
         self.layer = layer
         self.net = net
 
@@ -209,24 +226,27 @@ class Attach(AstNode):
 class TraceProperty(AstNode):
     __slots__ = ('device', 'args')
 
-    def __init__(self, device='', args=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, device='', args=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.device = device
-        self.args = args or []
+        self.args = [] if args is None else args
 
 
 # ---- Expression Nodes ----
 
 class Expression(AstNode):
     """Base class for expression nodes."""
-    pass
+    # Empty, so subclasses keep the slot-only layout (no per-node __dict__)
+    __slots__ = ()
 
 
 class BinaryOp(Expression):
     __slots__ = ('op', 'left', 'right')
 
-    def __init__(self, op='', left=None, right=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, op='', left=None, right=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.op = op
         self.left = left
         self.right = right
@@ -235,8 +255,9 @@ class BinaryOp(Expression):
 class UnaryOp(Expression):
     __slots__ = ('op', 'operand')
 
-    def __init__(self, op='', operand=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, op='', operand=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.op = op
         self.operand = operand
 
@@ -244,41 +265,46 @@ class UnaryOp(Expression):
 class LayerRef(Expression):
     __slots__ = ('name',)
 
-    def __init__(self, name='', **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
 
 
 class NumberLiteral(Expression):
     __slots__ = ('value',)
 
-    def __init__(self, value=0, **kw):
-        super().__init__(**kw)
+    def __init__(self, value=0, line=0, col=0):
+        self.line = line
+        self.col = col
         self.value = value
 
 
 class StringLiteral(Expression):
     __slots__ = ('value',)
 
-    def __init__(self, value='', **kw):
-        super().__init__(**kw)
+    def __init__(self, value='', line=0, col=0):
+        self.line = line
+        self.col = col
         self.value = value
 
 
 class FuncCall(Expression):
     __slots__ = ('name', 'args')
 
-    def __init__(self, name='', args=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', args=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
-        self.args = args or []
+        self.args = [] if args is None else args
 
 
 class Constraint(AstNode):
     __slots__ = ('op', 'value')
 
-    def __init__(self, op='', value=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, op='', value=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.op = op
         self.value = value
 
@@ -286,31 +312,35 @@ class Constraint(AstNode):
 class ConstrainedExpr(Expression):
     __slots__ = ('expr', 'constraints', 'modifiers')
 
-    def __init__(self, expr=None, constraints=None, modifiers=None, **kw):
-        super().__init__(**kw)
+    def __init__(self, expr=None, constraints=None, modifiers=None,
+                 line=0, col=0):
+        self.line = line
+        self.col = col
         self.expr = expr
-        self.constraints = constraints or []
-        self.modifiers = modifiers or []
+        self.constraints = [] if constraints is None else constraints
+        self.modifiers = [] if modifiers is None else modifiers
 
 
 class DRCOp(Expression):
     __slots__ = ('op', 'operands', 'constraints', 'modifiers')
 
     def __init__(self, op='', operands=None,
-                 constraints=None, modifiers=None, **kw):
-        super().__init__(**kw)
+                 constraints=None, modifiers=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.op = op
-        self.operands = operands or []
-        self.constraints = constraints or []
-        self.modifiers = modifiers or []
+        self.operands = [] if operands is None else operands
+        self.constraints = [] if constraints is None else constraints
+        self.modifiers = [] if modifiers is None else modifiers
 
 
 class VarRef(AstNode):
     """Variable reference in description text: ^VARNAME."""
     __slots__ = ('name',)
 
-    def __init__(self, name='', **kw):
-        super().__init__(**kw)
+    def __init__(self, name='', line=0, col=0):
+        self.line = line
+        self.col = col
         self.name = name
 
 
@@ -318,8 +348,9 @@ class ErrorNode(AstNode):
     """Represents an unrecognized or erroneous construct in the source."""
     __slots__ = ('message', 'skipped_text')
 
-    def __init__(self, message='', skipped_text='', **kw):
-        super().__init__(**kw)
+    def __init__(self, message='', skipped_text='', line=0, col=0):
+        self.line = line
+        self.col = col
         self.message = message
         self.skipped_text = skipped_text
 
@@ -328,9 +359,10 @@ class IfExpr(AstNode):
     __slots__ = ('condition', 'then_body', 'elseifs', 'else_body')
 
     def __init__(self, condition=None, then_body=None,
-                 elseifs=None, else_body=None, **kw):
-        super().__init__(**kw)
+                 elseifs=None, else_body=None, line=0, col=0):
+        self.line = line
+        self.col = col
         self.condition = condition
-        self.then_body = then_body or []
-        self.elseifs = elseifs or []
-        self.else_body = else_body or []
+        self.then_body = [] if then_body is None else then_body
+        self.elseifs = [] if elseifs is None else elseifs
+        self.else_body = [] if else_body is None else else_body
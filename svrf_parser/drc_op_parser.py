@@ -1,15 +1,65 @@
 """DRC operation parsing mixin for the SVRF parser."""
 
-from .tokens import TokenType, Token
+from .tokens import Token, TT
 from . import ast_nodes as ast
-from .parser_base import _DRC_OPS, _DRC_MODIFIERS, _DIRECTIVE_HEADS, _SVRF_KEYWORDS
-
-TT = TokenType
+from .parser_base import (
+    _DRC_OPS, _DRC_MODIFIERS, _SVRF_KEYWORDS, _CMP_TYPES, _NUMBER_TYPES,
+    _RECTANGLE_MODS,
+)
+
+# Infix arithmetic operators kept verbatim inside DRC operand text
+_ARITH_OP_TYPES = frozenset((TT.PLUS, TT.STAR, TT.SLASH, TT.CARET))
+_EOL_TYPES = frozenset((TT.NEWLINE, TT.EOF))
+# ABUT<angle> / ABUT>angle<angle>: tokens opening and forming the angle spec
+_ANGLE_BRACKET_TYPES = frozenset((TT.LT, TT.GT_OP))
+_ANGLE_SPEC_TYPES = _ANGLE_BRACKET_TYPES | {TT.INTEGER, TT.FLOAT}
+# Punctuation kept verbatim among DRC modifiers
+_BANG_COMMA_TYPES = frozenset((TT.BANG, TT.COMMA))
+# Tokens starting an operand of WITH NEIGHBOR and of prefix WITH
+_NEIGHBOR_OPERAND_TYPES = frozenset((TT.IDENT, TT.LPAREN))
+_WITH_OPERAND_TYPES = frozenset((TT.IDENT, TT.STRING))
+
+# Modifier words folded into one set each, so the loops below do a single
+# membership test per token.
+# Words ending a DFM PROPERTY continuation line of operands
+_DFM_PROPERTY_STOP = _DRC_MODIFIERS | {
+    'NOT', 'MEASURE', 'ANNOTATE', 'NODAL', 'MULTI', 'PRIMARY',
+    'OVERLAP', 'ABUT', 'ALSO', 'ACCUMULATE',
+    'GOOD', 'EVEN', 'ODD', 'ALL',
+    'PROPERTY', 'NUMBER', 'INVALID'}
+# WITH NEIGHBOR: words ending the operand list, and trailing modifiers
+_NEIGHBOR_OPERAND_STOP = _DRC_MODIFIERS | {
+    'SPACE', 'NOTCH', 'PRIMARY', 'MULTI', 'INSIDE', 'OUTSIDE'}
+_NEIGHBOR_MODS = _DRC_MODIFIERS | {
+    'SPACE', 'NOTCH', 'INSIDE', 'OUTSIDE', 'OF', 'LAYER'}
+# Prefix WITH ...: words ending the operand list, and trailing modifiers
+_WITH_OPERAND_STOP = _DRC_MODIFIERS | {
+    'PRIMARY', 'MULTI', 'ACCUMULATE', 'NOT', 'MEASURE', 'ANNOTATE', 'NODAL'}
+_WITH_MODS = _NEIGHBOR_MODS | {'EVEN', 'ODD'}
+# SIZE/SHIFT modifier words, classified once by what follows them: nothing,
+# an optional integer, or a value/layer expression (see _parse_size_op)
+_SIZE_MOD_BARE, _SIZE_MOD_INT, _SIZE_MOD_EXPR = 1, 2, 3
+_SIZE_MOD_KIND = {
+    **dict.fromkeys(('UNDEROVER', 'OVERUNDER', 'INSIDE', 'OUTSIDE',
+                     'GROW', 'SHRINK'), _SIZE_MOD_BARE),
+    **dict.fromkeys(('BEVEL', 'CORNER', 'ACUTE', 'OBTUSE', 'CONVEX'),
+                    _SIZE_MOD_INT),
+    **dict.fromkeys(('OF', 'STEP', 'LAYER', 'TRUNCATE'), _SIZE_MOD_EXPR),
+}
+# [NOT] ENCLOSE RECTANGLE: words starting a modifier continuation line
+_RECT_ENC_CONTINUATION = frozenset({
+    'SINGULAR', 'GOOD', 'OPPOSITE', 'PARALLEL', 'PERPENDICULAR',
+    'REGION', 'ABUT', 'ALSO', 'ONLY', 'ENDPOINT', 'CENTERS',
+    'MEASURE', 'ANNOTATE', 'NODAL', 'MULTI', 'PRIMARY',
+    'EVEN', 'ODD', 'ALL', 'CONNECTED', 'ACCUMULATE',
+})
 
 
 class DRCOpMixin:
     """Mixin providing DRC operation parsing for the SVRF parser."""
 
+    __slots__ = ()
+
     # Known keywords that can start a DRC modifier continuation line
     _MOD_CONTINUATION = frozenset({
         'RDB', 'PRINT', 'POLYGON', 'ACCUMULATE', 'ALSO', 'ONLY',
@@ -17,44 +67,52 @@ class DRCOpMixin:
 
     def _parse_drc_modifiers(self, modifiers):
         """Consume DRC modifiers (greedy until EOL) and append to list."""
-        while not self._at_eol():
-            t = self._cur()
-            # ABUT<angle> or ABUT>angle<angle> — consume as single modifier string
-            if t.type == TT.IDENT and t.value.upper() == 'ABUT':
-                abut_str = self._advance().value.upper()  # ABUT
-                # Check for <angle> or >angle<angle>
-                if not self._at_eol() and self._cur().type in (TT.LT, TT.GT_OP):
-                    while not self._at_eol() and self._cur().type in (
-                            TT.LT, TT.GT_OP, TT.INTEGER, TT.FLOAT):
-                        abut_str += str(self._advance().value)
-                    modifiers.append(abut_str)
+        # The current token is read straight from the (EOF-padded) stream
+        # and stepped over with pos += 1 once classified, instead of going
+        # through _at_eol/_cur/_advance for each decision.
+        tokens = self.tokens
+        append = modifiers.append
+        while True:
+            t = tokens[self.pos]
+            tt = t.type
+            if tt in _EOL_TYPES:
+                break
+            if tt is TT.IDENT:
+                self.pos += 1
+                # ABUT<angle> or ABUT>angle<angle> — consume as single modifier string
+                if t.upper == 'ABUT':
+                    abut_str = t.upper
+                    if tokens[self.pos].type in _ANGLE_BRACKET_TYPES:
+                        while tokens[self.pos].type in _ANGLE_SPEC_TYPES:
+                            abut_str += tokens[self.pos].raw
+                            self.pos += 1
+                    append(abut_str)
                 else:
-                    modifiers.append(abut_str)
-                continue
-            if t.type == TT.IDENT:
-                modifiers.append(self._advance().value)
-            elif t.type in (TT.INTEGER, TT.FLOAT):
-                modifiers.append(str(self._advance().value))
-            elif t.type == TT.STRING:
-                modifiers.append(self._advance().value)
-            elif t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+                    append(t.value)
+            elif tt in _NUMBER_TYPES:
+                self.pos += 1
+                append(t.raw)
+            elif tt is TT.STRING:
+                self.pos += 1
+                append(t.value)
+            elif tt in _CMP_TYPES:
                 for c in self._parse_constraints():
-                    modifiers.append(f"{c.op}{c.value}")
-            elif t.type == TT.LBRACKET:
-                be = self._parse_bracket_expr()
-                modifiers.append(be)
-            elif t.type == TT.MINUS:
-                self._advance()
-                if self._at(TT.INTEGER):
-                    modifiers.append(str(-self._advance().value))
-                elif self._at(TT.FLOAT):
-                    modifiers.append(str(-self._advance().value))
+                    append(f"{c.op}{c.value}")
+            elif tt is TT.LBRACKET:
+                append(self._parse_bracket_expr())
+            elif tt is TT.MINUS:
+                self.pos += 1  # -
+                nt = tokens[self.pos]
+                if nt.type in _NUMBER_TYPES:
+                    self.pos += 1
+                    append('-' + nt.raw)
                 else:
-                    modifiers.append('-')
-            elif t.type in (TT.PLUS, TT.STAR, TT.SLASH, TT.CARET):
+                    append('-')
+            elif tt in _ARITH_OP_TYPES:
                 # Arithmetic operators in modifier values (e.g. 0.079+TOLERANCE)
-                modifiers.append(str(self._advance().value))
-            elif t.type == TT.LPAREN:
+                self.pos += 1
+                append(t.raw)
+            elif tt is TT.LPAREN:
                 # Balanced parenthesized sub-expression in modifiers
                 # e.g. (OPPOSITE 0) or (value+offset)
                 self._advance()  # (
@@ -70,14 +128,13 @@ class DRCOpMixin:
                             self._advance()
                             parts.append(')')
                             break
-                    parts.append(str(self._advance().value))
-                modifiers.append(' '.join(parts))
-            elif t.type == TT.BANG:
-                # ! used in modifier context (e.g. !CONNECTED)
-                modifiers.append(str(self._advance().value))
-            elif t.type == TT.COMMA:
-                # Comma separating modifier values
-                modifiers.append(str(self._advance().value))
+                    parts.append(self._advance().raw)
+                append(' '.join(parts))
+            elif tt in _BANG_COMMA_TYPES:
+                # ! used in modifier context (e.g. !CONNECTED), or a comma
+                # separating modifier values
+                self.pos += 1
+                append(t.raw)
             else:
                 # Stop at true expression boundary tokens (RPAREN, RBRACE, etc.)
                 break
@@ -103,7 +160,7 @@ class DRCOpMixin:
                 modifiers.append(bracket_str)
                 self._parse_drc_modifiers(modifiers)
             elif (self._at(TT.IDENT) and
-                  self._cur().value.upper() in self._MOD_CONTINUATION):
+                  self._cur().upper in self._MOD_CONTINUATION):
                 # Modifier continuation line (e.g. RDB ... BY LAYER)
                 self._parse_drc_modifiers(modifiers)
             else:
@@ -114,11 +171,11 @@ class DRCOpMixin:
     # DRC operations: INT/EXT/ENC/DENSITY layer [layer] constraints mods
     # ------------------------------------------------------------------
     def _parse_drc_op(self):
-        loc = self._loc()
-        op = self._advance().value.upper()  # INT/EXT/ENC/DENSITY
+        line, col = self._loc()
+        op = self._advance().upper  # INT/EXT/ENC/DENSITY
         # ENCLOSE RECTANGLE / ENC RECTANGLE: two-word DRC op
         if op in ('ENC', 'ENCLOSE') and self._at(TT.IDENT) and \
-                self._cur().value.upper() == 'RECTANGLE':
+                self._cur().upper == 'RECTANGLE':
             op = op + ' RECTANGLE'
             self._advance()
         operands = []
@@ -126,17 +183,18 @@ class DRCOpMixin:
         modifiers = []
 
         # Collect operands (layer refs, bracket exprs)
-        while not self._at_eol():
-            t = self._cur()
-            if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        tokens = self.tokens
+        while True:
+            t = tokens[self.pos]
+            if t.type in _EOL_TYPES or t.type in _CMP_TYPES:
                 break
-            if t.type == TT.IDENT and t.value.upper() in _DRC_MODIFIERS:
+            if t.upper in _DRC_MODIFIERS:
                 break
             if t.type == TT.LBRACKET:
                 # Bracket exprs may contain special syntax (!,  -=, function calls)
                 # that the Pratt parser can't handle; consume as string
                 content = self._consume_bracket_block()
-                operands.append(ast.StringLiteral(value=content, **self._loc()))
+                operands.append(ast.StringLiteral(value=content, line=t.line, col=t.col))
                 continue
             if t.type == TT.LPAREN:
                 self._advance()
@@ -146,13 +204,14 @@ class DRCOpMixin:
                 operands.append(expr)
                 continue
             if t.type == TT.IDENT:
-                operands.append(ast.LayerRef(name=self._advance().value,
-                                             **self._loc()))
+                self.pos += 1
+                operands.append(ast.LayerRef(name=t.value,
+                                             line=t.line, col=t.col))
                 continue
             break
 
         # Constraints
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if tokens[self.pos].type in _CMP_TYPES:
             constraints = self._parse_constraints()
 
         # Modifiers (greedy until EOL)
@@ -160,24 +219,24 @@ class DRCOpMixin:
         self._parse_drc_multiline_continuation(modifiers)
 
         return ast.DRCOp(op=op, operands=operands,
-                         constraints=constraints, modifiers=modifiers, **loc)
+                         constraints=constraints, modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # DFM operations: DFM PROPERTY/DV/SPACE/COPY/TEXT/DP ...
     # ------------------------------------------------------------------
     def _parse_dfm_op(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # DFM
         sub_op = ''
         if self._at(TT.IDENT):
-            sub_op = self._advance().value.upper()
+            sub_op = self._advance().upper
         op = 'DFM ' + sub_op if sub_op else 'DFM'
         # DFM DP has a sub-sub-op (CONFLICT, RING, WARNING, MASK0, MASK1)
         if sub_op == 'DP' and self._at(TT.IDENT):
-            dp_sub = self._advance().value.upper()
+            dp_sub = self._advance().upper
             op = 'DFM DP ' + dp_sub
         # DFM PROPERTY NET is a sub-command for net-level properties
-        if sub_op == 'PROPERTY' and self._at(TT.IDENT) and self._cur().value.upper() == 'NET':
+        if sub_op == 'PROPERTY' and self._at(TT.IDENT) and self._cur().upper == 'NET':
             self._advance()  # NET
             op = 'DFM PROPERTY NET'
         operands = []
@@ -186,13 +245,13 @@ class DRCOpMixin:
         # Collect operands (layer refs, bracket exprs, paren exprs)
         while not self._at_eol():
             t = self._cur()
-            if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+            if t.type in _CMP_TYPES:
                 break
-            if t.type == TT.IDENT and t.value.upper() in _DRC_MODIFIERS:
+            if t.type == TT.IDENT and t.upper in _DRC_MODIFIERS:
                 break
-            if t.type == TT.IDENT and t.value.upper() == 'DVPARAMS':
+            if t.type == TT.IDENT and t.upper == 'DVPARAMS':
                 break
-            if t.type == TT.IDENT and t.value.upper() in ('NOT', 'MEASURE',
+            if t.type == TT.IDENT and t.upper in ('NOT', 'MEASURE',
                     'ANNOTATE', 'NODAL', 'MULTI', 'PRIMARY',
                     'OVERLAP', 'ABUT', 'ALSO', 'ACCUMULATE',
                     'GOOD', 'EVEN', 'ODD', 'ALL',
@@ -201,23 +260,23 @@ class DRCOpMixin:
             if t.type == TT.LBRACKET:
                 # Bracket exprs may contain special syntax (-=, +=, function calls)
                 content = self._consume_bracket_block()
-                operands.append(ast.StringLiteral(value=content, **self._loc()))
+                operands.append(ast.StringLiteral(value=content, line=t.line, col=t.col))
                 continue
             if t.type == TT.LPAREN:
                 # Check for parenthesized modifier like (OPPOSITE 0)
-                nxt = self._peek()
-                if nxt.type == TT.IDENT and nxt.value.upper() in (
+                nxt = self._peek1()
+                if nxt.type == TT.IDENT and nxt.upper in (
                         'OPPOSITE', 'PARALLEL', 'PERPENDICULAR'):
                     self._advance()  # (
                     while not self._at(TT.RPAREN) and not self._at_eol():
                         if self._at(TT.IDENT):
                             modifiers.append(self._advance().value)
                         elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                            modifiers.append(str(self._advance().value))
+                            modifiers.append(self._advance().raw)
                         else:
                             _st = self._cur()
-                            self.warnings.append(
-                                f"L{_st.line}:{_st.col}: Unexpected token {_st.type.name} "
+                            self._warn(_st,
+                                f"Unexpected token {_st.type.name} "
                                 f"({_st.value!r}) in DFM parenthesized modifier, skipping")
                             self._advance()
                     if self._at(TT.RPAREN):
@@ -231,7 +290,7 @@ class DRCOpMixin:
                 continue
             if t.type == TT.IDENT:
                 operands.append(ast.LayerRef(name=self._advance().value,
-                                             **self._loc()))
+                                             line=t.line, col=t.col))
                 continue
             break
 
@@ -253,16 +312,16 @@ class DRCOpMixin:
                     continue
                 # Bare layer ref on next line (not a new statement)
                 if t.type == TT.IDENT:
-                    nxt_t = self._peek().type
+                    nxt_t = self._peek1().type
                     # Stop if it looks like a new statement
                     if nxt_t == TT.EQUALS or nxt_t == TT.LBRACE:
                         self.pos = saved
                         break
-                    if t.value.upper() in _DIRECTIVE_HEADS or t.value.upper() in _SVRF_KEYWORDS:
+                    if t.upper in _SVRF_KEYWORDS:  # includes directive heads
                         self.pos = saved
                         break
                     operands.append(ast.LayerRef(name=self._advance().value,
-                                                 **self._loc()))
+                                                 line=t.line, col=t.col))
                     continue
                 # Anything else — not a continuation
                 self.pos = saved
@@ -270,12 +329,6 @@ class DRCOpMixin:
 
         # DFM PROPERTY multiline continuation: operand lists can span lines
         if sub_op == 'PROPERTY':
-            _dfm_mod_stop = frozenset({
-                'NOT', 'MEASURE', 'ANNOTATE', 'NODAL', 'MULTI', 'PRIMARY',
-                'OVERLAP', 'ABUT', 'ALSO', 'ACCUMULATE',
-                'GOOD', 'EVEN', 'ODD', 'ALL',
-                'PROPERTY', 'NUMBER', 'INVALID',
-            })
             while self._at_eol():
                 saved = self.pos
                 self._consume_eol()
@@ -286,12 +339,12 @@ class DRCOpMixin:
                 looks_like_operands = False
                 while scan < self.length:
                     st = self.tokens[scan]
-                    if st.type in (TT.NEWLINE, TT.EOF):
+                    if st.type in _EOL_TYPES:
                         looks_like_operands = ident_count > 0
                         break
                     if st.type == TT.IDENT:
-                        u = st.value.upper()
-                        if u in _dfm_mod_stop or u in _DRC_MODIFIERS:
+                        u = st.upper
+                        if u in _DFM_PROPERTY_STOP:
                             looks_like_operands = ident_count > 0
                             break
                         ident_count += 1
@@ -304,34 +357,32 @@ class DRCOpMixin:
                 # Consume operands from this continuation line
                 while not self._at_eol():
                     t = self._cur()
-                    if t.type == TT.IDENT and t.value.upper() in _DRC_MODIFIERS:
-                        break
-                    if t.type == TT.IDENT and t.value.upper() in _dfm_mod_stop:
+                    if t.upper in _DFM_PROPERTY_STOP:
                         break
                     if t.type == TT.IDENT:
                         operands.append(ast.LayerRef(
-                            name=self._advance().value, **self._loc()))
+                            name=self._advance().value, line=t.line, col=t.col))
                     else:
                         break
 
         # Constraints
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         # Modifiers (greedy until EOL)
         while not self._at_eol():
             t = self._cur()
             if t.type == TT.IDENT:
                 modifiers.append(self._advance().value)
-            elif t.type in (TT.INTEGER, TT.FLOAT):
-                modifiers.append(str(self._advance().value))
+            elif t.type in _NUMBER_TYPES:
+                modifiers.append(self._advance().raw)
             elif t.type == TT.STRING:
                 modifiers.append(self._advance().value)
-            elif t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+            elif t.type in _CMP_TYPES:
                 for c in self._parse_constraints():
                     modifiers.append(f"{c.op}{c.value}")
             elif t.type == TT.LBRACKET:
                 content = self._consume_bracket_block()
-                modifiers.append(ast.StringLiteral(value=content, **self._loc()))
+                modifiers.append(ast.StringLiteral(value=content, line=t.line, col=t.col))
             elif t.type == TT.LPAREN:
                 self._advance()
                 expr = self._parse_layer_expr(0)
@@ -339,28 +390,26 @@ class DRCOpMixin:
                     self._advance()
                 modifiers.append(expr)
             elif t.type == TT.MINUS:
-                self._advance()
-                if self._at(TT.INTEGER):
-                    modifiers.append(str(-self._advance().value))
-                elif self._at(TT.FLOAT):
-                    modifiers.append(str(-self._advance().value))
+                self._advance()  # -
+                if self._cur().type in _NUMBER_TYPES:
+                    modifiers.append('-' + self._advance().raw)
                 else:
                     modifiers.append('-')
-            elif t.type in (TT.PLUS, TT.STAR, TT.SLASH, TT.CARET):
-                modifiers.append(str(self._advance().value))
-            elif t.type in (TT.BANG, TT.COMMA):
-                modifiers.append(str(self._advance().value))
+            elif t.type in _ARITH_OP_TYPES:
+                modifiers.append(self._advance().raw)
+            elif t.type in _BANG_COMMA_TYPES:
+                modifiers.append(self._advance().raw)
             else:
                 break
         return ast.DRCOp(op=op, operands=operands,
-                         constraints=constraints, modifiers=modifiers, **loc)
+                         constraints=constraints, modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # SIZE layer BY value [UNDEROVER|OVERUNDER]
     # ------------------------------------------------------------------
     def _parse_size_op(self):
-        loc = self._loc()
-        op = self._advance().value.upper()  # SIZE or SHIFT
+        line, col = self._loc()
+        op = self._advance().upper  # SIZE or SHIFT
         operand = self._parse_layer_expr(50)
         modifiers = []
         if self._at_val('BY'):
@@ -370,101 +419,89 @@ class DRCOpMixin:
             by_expr = self._parse_layer_expr(35)
             modifiers.append(('BY', by_expr))
         # Optional modifiers: INSIDE OF layer, STEP value, UNDEROVER, etc.
-        while not self._at_eol():
-            if self._at(TT.IDENT):
-                upper = self._cur().value.upper()
-                if upper in ('UNDEROVER', 'OVERUNDER', 'INSIDE', 'OUTSIDE',
-                             'GROW', 'SHRINK'):
-                    modifiers.append(self._advance().value)
-                elif upper in ('BEVEL', 'CORNER', 'ACUTE', 'OBTUSE', 'CONVEX'):
-                    modifiers.append(self._advance().value)
+        tokens = self.tokens
+        while True:
+            t = tokens[self.pos]
+            tt = t.type
+            if tt in _EOL_TYPES:
+                break
+            if tt is TT.IDENT:
+                # One lookup classifies the word (None for non-modifiers)
+                kind = _SIZE_MOD_KIND.get(t.upper)
+                if kind is None:
+                    break
+                self.pos += 1
+                modifiers.append(t.value)
+                if kind == _SIZE_MOD_INT:
                     # These modifiers can take a numeric argument
-                    if not self._at_eol() and self._at(TT.INTEGER):
+                    if self._at(TT.INTEGER):
                         modifiers.append(self._advance().value)
-                elif upper in ('OF', 'STEP', 'LAYER', 'TRUNCATE'):
-                    modifiers.append(self._advance().value)
+                elif kind == _SIZE_MOD_EXPR:
                     # Consume the following value/layer as expression
                     if not self._at_eol():
                         modifiers.append(self._parse_layer_expr(50))
-                else:
-                    break
-            elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                modifiers.append(self._parse_layer_expr(50))
-            elif self._at(TT.LPAREN):
+            elif tt in _NUMBER_TYPES or tt is TT.LPAREN:
                 modifiers.append(self._parse_layer_expr(50))
-            elif self._at(TT.STAR):
+            elif tt is TT.STAR:
                 # e.g. STEP M13_S_1*0.7
                 self._advance()
                 modifiers.append('*')
             else:
                 break
         return ast.DRCOp(op=op, operands=[operand],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # AREA layer constraints
     # ------------------------------------------------------------------
     def _parse_area_op(self):
-        loc = self._loc()
-        op = self._advance().value.upper()  # AREA or PERIMETER
+        line, col = self._loc()
+        op = self._advance().upper  # AREA or PERIMETER
         operand = self._parse_layer_expr(50)
         constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         if constraints:
             return ast.ConstrainedExpr(
-                expr=ast.UnaryOp(op=op, operand=operand, **loc),
-                constraints=constraints, **loc)
-        return ast.UnaryOp(op=op, operand=operand, **loc)
+                expr=ast.UnaryOp(op=op, operand=operand, line=line, col=col),
+                constraints=constraints, line=line, col=col)
+        return ast.UnaryOp(op=op, operand=operand, line=line, col=col)
 
     def _parse_unary_constrained_op(self):
-        """Generic: OP operand [constraints] — e.g. VERTEX layer >= 8"""
-        loc = self._loc()
-        op = self._advance().value.upper()
+        """Generic: OP operand [constraints] — e.g. VERTEX layer >= 8,
+        ANGLE layer == 45"""
+        line, col = self._loc()
+        op = self._advance().upper
         operand = self._parse_layer_expr(50)
         constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         return ast.ConstrainedExpr(
-            expr=ast.UnaryOp(op=op, operand=operand, **loc),
-            constraints=constraints, **loc)
-
-    # ------------------------------------------------------------------
-    # ANGLE operation
-    # ------------------------------------------------------------------
-    def _parse_angle_op(self):
-        loc = self._loc()
-        self._advance()  # ANGLE
-        operand = self._parse_layer_expr(50)
-        constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-            constraints = self._parse_constraints()
-        return ast.ConstrainedExpr(
-            expr=ast.UnaryOp(op='ANGLE', operand=operand, **loc),
-            constraints=constraints, **loc)
+            expr=ast.UnaryOp(op=op, operand=operand, line=line, col=col),
+            constraints=constraints, line=line, col=col)
 
     # ------------------------------------------------------------------
     # LENGTH operation (prefix)
     # ------------------------------------------------------------------
     def _parse_length_op(self, op_name='LENGTH'):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # LENGTH (or second word of PATH LENGTH)
         # Two syntaxes: LENGTH layer < value  OR  LENGTH < value layer
         constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         operand = self._parse_layer_expr(50)
-        if not constraints and self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if not constraints and self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         return ast.ConstrainedExpr(
-            expr=ast.UnaryOp(op=op_name, operand=operand, **loc),
-            constraints=constraints, **loc)
+            expr=ast.UnaryOp(op=op_name, operand=operand, line=line, col=col),
+            constraints=constraints, line=line, col=col)
 
     # ------------------------------------------------------------------
     # CONVEX EDGE layer ANGLE/LENGTH modifiers
     # ------------------------------------------------------------------
     def _parse_convex_edge_op(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # CONVEX
         self._advance()  # EDGE
         operand = self._parse_layer_expr(50)
@@ -472,12 +509,11 @@ class DRCOpMixin:
         while not self._at_eol():
             t = self._cur()
             if t.type == TT.IDENT:
-                upper = t.value.upper()
+                upper = t.upper
                 if upper in ('ANGLE1', 'ANGLE2', 'LENGTH1', 'LENGTH2',
                              'ANGLE', 'LENGTH', 'WITH'):
                     modifiers.append(self._advance().value)
-                    while self._cur().type in (TT.LT, TT.GT_OP, TT.LE,
-                                               TT.GE, TT.EQEQ, TT.BANGEQ):
+                    while self._cur().type in _CMP_TYPES:
                         op_tok = self._advance().value
                         val = None
                         if self._at(TT.INTEGER) or self._at(TT.FLOAT):
@@ -491,13 +527,13 @@ class DRCOpMixin:
             else:
                 break
         return ast.DRCOp(op='CONVEX EDGE', operands=[operand],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # EXPAND EDGE layer INSIDE|OUTSIDE BY value
     # ------------------------------------------------------------------
     def _parse_expand_edge_op(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # EXPAND
         self._advance()  # EDGE
         operand = self._parse_layer_expr(50)
@@ -505,7 +541,7 @@ class DRCOpMixin:
         # Pattern: [INSIDE|OUTSIDE BY expr]...
         while not self._at_eol():
             if self._at(TT.IDENT):
-                upper_cur = self._cur().value.upper()
+                upper_cur = self._cur().upper
                 if upper_cur in ('INSIDE', 'OUTSIDE', 'IN', 'OUT'):
                     modifiers.append(self._advance().value)
                     if self._at_val('BY'):
@@ -517,20 +553,20 @@ class DRCOpMixin:
                 else:
                     modifiers.append(self._advance().value)
             elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                modifiers.append(str(self._advance().value))
+                modifiers.append(self._advance().raw)
             else:
                 break
         return ast.DRCOp(op='EXPAND EDGE', operands=[operand],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # OFFGRID layer (grid) (offset) [INSIDE OF LAYER ref] [modifiers]
     # ------------------------------------------------------------------
     def _parse_offgrid_op(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # OFFGRID
         # Check for DIRECTIONAL variant
-        if self._at(TT.IDENT) and self._cur().value.upper() == 'DIRECTIONAL':
+        if self._at(TT.IDENT) and self._cur().upper == 'DIRECTIONAL':
             self._advance()  # DIRECTIONAL
         operands = []
         # Collect operands (layer refs and parenthesized expressions)
@@ -539,7 +575,7 @@ class DRCOpMixin:
             if self._at(TT.LPAREN):
                 operands.append(self._parse_layer_expr(50))
             elif self._at(TT.IDENT):
-                upper_cur = self._cur().value.upper()
+                upper_cur = self._cur().upper
                 if upper_cur in ('INSIDE', 'OUTSIDE', 'ABSOLUTE',
                                  'HINT', 'RDB', 'PRINT', 'ACCUMULATE'):
                     break
@@ -554,13 +590,13 @@ class DRCOpMixin:
             saved = self.pos
             self._consume_eol()
             self._skip_newlines()
-            if self._at(TT.IDENT) and self._cur().value.upper() in (
+            if self._at(TT.IDENT) and self._cur().upper in (
                     'TOP', 'BOTTOM', 'LEFT', 'RIGHT'):
                 modifiers.append(self._advance().value)
                 # Consume values on this line (expr expr FACE/NOFACE)
                 while not self._at_eol():
                     if self._at(TT.IDENT):
-                        mod_u = self._cur().value.upper()
+                        mod_u = self._cur().upper
                         if mod_u in ('FACE', 'NOFACE', 'DRCGRID'):
                             modifiers.append(self._advance().value)
                         else:
@@ -577,16 +613,16 @@ class DRCOpMixin:
             self.pos = saved
             break
         return ast.DRCOp(op='OFFGRID', operands=operands,
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # RECTANGLE layer [constraints] [ORTHOGONAL ONLY]
     # ------------------------------------------------------------------
     def _parse_rectangle_op(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # RECTANGLE
         # RECTANGLE ENCLOSURE: two-word DRC op like INT/EXT/ENC
-        if self._at(TT.IDENT) and self._cur().value.upper() == 'ENCLOSURE':
+        if self._at(TT.IDENT) and self._cur().upper == 'ENCLOSURE':
             self._advance()  # ENCLOSURE
             op = 'RECTANGLE ENCLOSURE'
             operands = []
@@ -595,9 +631,9 @@ class DRCOpMixin:
             # Collect operands
             while not self._at_eol():
                 t = self._cur()
-                if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+                if t.type in _CMP_TYPES:
                     break
-                if t.type == TT.IDENT and t.value.upper() in _DRC_MODIFIERS:
+                if t.type == TT.IDENT and t.upper in _DRC_MODIFIERS:
                     break
                 if t.type == TT.LBRACKET:
                     operands.append(self._parse_bracket_expr())
@@ -611,37 +647,35 @@ class DRCOpMixin:
                     continue
                 if t.type == TT.IDENT:
                     operands.append(ast.LayerRef(name=self._advance().value,
-                                                 **self._loc()))
+                                                 line=t.line, col=t.col))
                     continue
                 break
             # Constraints
-            if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+            if self._cur().type in _CMP_TYPES:
                 constraints = self._parse_constraints()
             # Modifiers (greedy until EOL)
             while not self._at_eol():
                 t = self._cur()
                 if t.type == TT.IDENT:
                     modifiers.append(self._advance().value)
-                elif t.type in (TT.INTEGER, TT.FLOAT):
-                    modifiers.append(str(self._advance().value))
+                elif t.type in _NUMBER_TYPES:
+                    modifiers.append(self._advance().raw)
                 elif t.type == TT.STRING:
                     modifiers.append(self._advance().value)
-                elif t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+                elif t.type in _CMP_TYPES:
                     for c in self._parse_constraints():
                         modifiers.append(f"{c.op}{c.value}")
                 elif t.type == TT.LBRACKET:
                     be = self._parse_bracket_expr()
                     modifiers.append(be)
                 elif t.type == TT.MINUS:
-                    self._advance()
-                    if self._at(TT.INTEGER):
-                        modifiers.append(str(-self._advance().value))
-                    elif self._at(TT.FLOAT):
-                        modifiers.append(str(-self._advance().value))
+                    self._advance()  # -
+                    if self._cur().type in _NUMBER_TYPES:
+                        modifiers.append('-' + self._advance().raw)
                     else:
                         modifiers.append('-')
-                elif t.type in (TT.PLUS, TT.STAR, TT.SLASH, TT.CARET):
-                    modifiers.append(str(self._advance().value))
+                elif t.type in _ARITH_OP_TYPES:
+                    modifiers.append(self._advance().raw)
                 elif t.type == TT.LPAREN:
                     self._advance()
                     depth = 1
@@ -655,29 +689,23 @@ class DRCOpMixin:
                                 self._advance()
                                 parts.append(')')
                                 break
-                        parts.append(str(self._advance().value))
+                        parts.append(self._advance().raw)
                     modifiers.append(' '.join(parts))
                 else:
                     break
             # Multiline continuation: next line starts with a modifier keyword
-            _rect_enc_mods = frozenset({
-                'SINGULAR', 'GOOD', 'OPPOSITE', 'PARALLEL', 'PERPENDICULAR',
-                'REGION', 'ABUT', 'ALSO', 'ONLY', 'ENDPOINT', 'CENTERS',
-                'MEASURE', 'ANNOTATE', 'NODAL', 'MULTI', 'PRIMARY',
-                'EVEN', 'ODD', 'ALL', 'CONNECTED', 'ACCUMULATE',
-            })
             while self._at_eol():
                 saved = self.pos
                 self._consume_eol()
                 self._skip_newlines()
-                if self._at(TT.IDENT) and self._cur().value.upper() in _rect_enc_mods:
+                if self._at(TT.IDENT) and self._cur().upper in _RECT_ENC_CONTINUATION:
                     while not self._at_eol():
                         t = self._cur()
                         if t.type == TT.IDENT:
                             modifiers.append(self._advance().value)
-                        elif t.type in (TT.INTEGER, TT.FLOAT):
-                            modifiers.append(str(self._advance().value))
-                        elif t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+                        elif t.type in _NUMBER_TYPES:
+                            modifiers.append(self._advance().raw)
+                        elif t.type in _CMP_TYPES:
                             for c in self._parse_constraints():
                                 modifiers.append(f"{c.op}{c.value}")
                         else:
@@ -686,49 +714,46 @@ class DRCOpMixin:
                     self.pos = saved
                     break
             return ast.DRCOp(op=op, operands=operands,
-                             constraints=constraints, modifiers=modifiers, **loc)
+                             constraints=constraints, modifiers=modifiers, line=line, col=col)
         operands = []
         # Only parse operand if next token is NOT a constraint operator
         # and NOT a modifier keyword (ORTHOGONAL, ONLY, etc.)
-        if not self._at_eol() and self._cur().type not in (
-                TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-            if not (self._at(TT.IDENT) and self._cur().value.upper() in (
-                    _DRC_MODIFIERS | {'ASPECT'})):
+        if not self._at_eol() and self._cur().type not in _CMP_TYPES:
+            if self._cur().upper not in _RECTANGLE_MODS:
                 operands.append(self._parse_layer_expr(50))
         constraints = []
         modifiers = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         # BY == value (second dimension constraint)
         if self._at_val('BY'):
             self._advance()  # BY
             by_constraints = []
-            if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+            if self._cur().type in _CMP_TYPES:
                 by_constraints = self._parse_constraints()
             # Store BY constraints with a BY marker constraint
-            constraints.append(ast.Constraint(op='BY', value=None, **loc))
+            constraints.append(ast.Constraint(op='BY', value=None, line=line, col=col))
             constraints.extend(by_constraints)
         # Trailing modifiers: ORTHOGONAL, ONLY, ASPECT, etc.
         while not self._at_eol() and self._at(TT.IDENT):
-            upper = self._cur().value.upper()
-            if upper in _DRC_MODIFIERS or upper == 'ASPECT':
+            upper = self._cur().upper
+            if upper in _RECTANGLE_MODS:
                 modifiers.append(self._advance().value)
                 # ASPECT may be followed by a constraint: ASPECT > 1
                 if upper == 'ASPECT' and not self._at_eol() and \
-                        self._cur().type in (TT.LT, TT.GT_OP, TT.LE,
-                                             TT.GE, TT.EQEQ, TT.BANGEQ):
+                        self._cur().type in _CMP_TYPES:
                     constraints.extend(self._parse_constraints())
             else:
                 break
         return ast.DRCOp(op='RECTANGLE', operands=operands,
-                         constraints=constraints, modifiers=modifiers, **loc)
+                         constraints=constraints, modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # RECTANGLES w h dx dy INSIDE OF LAYER layer
     # ------------------------------------------------------------------
     def _parse_rectangles_op(self):
-        loc = self._loc()
-        op = self._advance().value.upper()  # RECTANGLES or EXTENTS
+        line, col = self._loc()
+        op = self._advance().upper  # RECTANGLES or EXTENTS
         args = []
         modifiers = []
         while not self._at_eol() and self._can_start_layer_expr():
@@ -743,17 +768,17 @@ class DRCOpMixin:
             else:
                 break
         return ast.DRCOp(op=op, operands=args,
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # EXTENT [DRAWN] [ORIGINAL] [CELL cellname ...]
     # ------------------------------------------------------------------
     def _parse_extent_op(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # EXTENT
         modifiers = []
         while self._at(TT.IDENT) and not self._at_eol():
-            upper = self._cur().value.upper()
+            upper = self._cur().upper
             if upper in ('DRAWN', 'ORIGINAL'):
                 modifiers.append(self._advance().value)
             elif upper == 'CELL':
@@ -768,18 +793,18 @@ class DRCOpMixin:
         while not self._at_eol() and self._can_start_layer_expr():
             operands.append(self._parse_layer_expr(50))
         return ast.DRCOp(op='EXTENT', operands=operands,
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # GROW/SHRINK operand [TOP|BOTTOM|LEFT|RIGHT BY value]...
     # ------------------------------------------------------------------
     def _parse_grow_shrink_op(self):
-        loc = self._loc()
-        op = self._advance().value.upper()  # GROW or SHRINK
+        line, col = self._loc()
+        op = self._advance().upper  # GROW or SHRINK
         operand = self._parse_layer_expr(50)
         modifiers = []
         while not self._at_eol() and self._at(TT.IDENT):
-            upper = self._cur().value.upper()
+            upper = self._cur().upper
             if upper in ('TOP', 'BOTTOM', 'LEFT', 'RIGHT'):
                 modifiers.append(self._advance().value)
                 if self._at_val('BY'):
@@ -796,13 +821,13 @@ class DRCOpMixin:
             else:
                 break
         return ast.DRCOp(op=op, operands=[operand],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=line, col=col)
 
     # ------------------------------------------------------------------
     # STAMP layer BY layer
     # ------------------------------------------------------------------
     def _parse_stamp_op(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # STAMP
         operand = self._parse_layer_expr(50)
         target = None
@@ -810,86 +835,85 @@ class DRCOpMixin:
             self._advance()
             target = self._parse_layer_expr(50)
         return ast.BinaryOp(op='STAMP', left=operand,
-                            right=target, **loc)
+                            right=target, line=line, col=col)
 
     # ------------------------------------------------------------------
     # WITH WIDTH/EDGE/LENGTH constraint
     # ------------------------------------------------------------------
     def _parse_with_op(self, left):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # WITH
         modifier = ''
         if self._at(TT.IDENT):
-            upper_mod = self._cur().value.upper()
+            upper_mod = self._cur().upper
             if upper_mod in ('EDGE', 'WIDTH', 'LENGTH', 'AREA', 'TEXT', 'NEIGHBOR'):
-                modifier = self._advance().value.upper()
+                modifier = self._advance().upper
         # WITH TEXT / WITH NEIGHBOR take multiple operands + modifiers -> use DRCOp
         if modifier == 'TEXT':
             operands = [left]
             while not self._at_eol():
                 t = self._cur()
-                if t.type == TT.IDENT and t.value.upper() in _DRC_MODIFIERS:
+                if t.type == TT.IDENT and t.upper in _DRC_MODIFIERS:
                     break
-                if t.type == TT.IDENT and t.value.upper() in ('PRIMARY', 'MULTI',
+                if t.type == TT.IDENT and t.upper in ('PRIMARY', 'MULTI',
                         'ACCUMULATE', 'NOT', 'MEASURE', 'ANNOTATE', 'NODAL'):
                     break
-                if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+                if t.type in _CMP_TYPES:
                     break
                 if t.type == TT.IDENT:
-                    operands.append(ast.LayerRef(name=self._advance().value, **self._loc()))
+                    operands.append(ast.LayerRef(name=self._advance().value, line=t.line, col=t.col))
                 elif t.type == TT.STRING:
-                    operands.append(ast.StringLiteral(value=self._advance().value, **self._loc()))
+                    tok = self._advance()
+                    operands.append(ast.StringLiteral(value=tok.value, line=tok.line, col=tok.col))
                 else:
                     break
             constraints = []
-            if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+            if self._cur().type in _CMP_TYPES:
                 constraints = self._parse_constraints()
             modifiers = []
             while not self._at_eol() and self._at(TT.IDENT):
                 modifiers.append(self._advance().value)
             return ast.DRCOp(op='WITH TEXT', operands=operands,
-                             constraints=constraints, modifiers=modifiers, **loc)
+                             constraints=constraints, modifiers=modifiers, line=line, col=col)
         # WITH NEIGHBOR layer >= N SPACE <= val [INSIDE OF LAYER (...)]
         if modifier == 'NEIGHBOR':
             operands = [left]
             while not self._at_eol():
                 t = self._cur()
-                if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+                if t.type in _CMP_TYPES:
                     break
-                if t.type == TT.IDENT and t.value.upper() in _DRC_MODIFIERS:
+                if t.upper in _NEIGHBOR_OPERAND_STOP:
                     break
-                if t.type == TT.IDENT and t.value.upper() in ('SPACE', 'NOTCH',
-                        'PRIMARY', 'MULTI', 'INSIDE', 'OUTSIDE'):
-                    break
-                if t.type in (TT.IDENT, TT.LPAREN):
+                if t.type in _NEIGHBOR_OPERAND_TYPES:
                     operands.append(self._parse_layer_expr(50))
-                elif t.type in (TT.INTEGER, TT.FLOAT):
-                    operands.append(ast.NumberLiteral(value=self._advance().value, **self._loc()))
+                elif t.type in _NUMBER_TYPES:
+                    tok = self._advance()
+                    operands.append(ast.NumberLiteral(value=tok.value, line=tok.line, col=tok.col))
                 else:
                     break
             constraints = []
-            if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+            if self._cur().type in _CMP_TYPES:
                 constraints = self._parse_constraints()
             mod_list = []
             # Consume modifier+constraint pairs (e.g. SPACE <= 0.5 INSIDE OF LAYER (...))
             while not self._at_eol():
                 if self._at(TT.IDENT):
-                    mod_u = self._cur().value.upper()
-                    if mod_u in ('SPACE', 'NOTCH', 'INSIDE', 'OUTSIDE',
-                                 'OF', 'LAYER') or mod_u in _DRC_MODIFIERS:
+                    mod_u = self._cur().upper
+                    if mod_u in _NEIGHBOR_MODS:
                         mod_list.append(self._advance().value)
                     else:
                         break
-                elif self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+                elif self._cur().type in _CMP_TYPES:
                     mod_list.extend(self._parse_constraints())
                 elif self._at(TT.LPAREN):
                     mod_list.append(self._parse_layer_expr(0))
                 elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                    mod_list.append(ast.NumberLiteral(value=self._advance().value, **self._loc()))
+                    tok = self._advance()
+                    mod_list.append(ast.NumberLiteral(value=tok.value, line=tok.line, col=tok.col))
                 else:
                     break
             return ast.DRCOp(op='WITH NEIGHBOR', operands=operands,
-                             constraints=constraints, modifiers=mod_list, **loc)
+                             constraints=constraints, modifiers=mod_list, line=line, col=col)
         # After WITH EDGE/WIDTH/LENGTH, there may be a parenthesized expression
         # (e.g. WITH EDGE (LENGTH (...) == 0) == 0.040) or direct expression
         # (e.g. WITH WIDTH SR_POLY == value) or direct constraints.
@@ -899,67 +923,65 @@ class DRCOpMixin:
         elif self._at(TT.IDENT) and not self._at_eol():
             sub_expr = self._parse_layer_expr(50)
         constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         op_name = 'WITH ' + modifier if modifier else 'WITH'
         if sub_expr:
             right = sub_expr
         elif not modifier:
-            right = ast.LayerRef(name='', **loc)
+            right = ast.LayerRef(name='', line=line, col=col)
         else:
             right = None
         return ast.ConstrainedExpr(
-            expr=ast.BinaryOp(op=op_name, left=left, right=right, **loc),
-            constraints=constraints, **loc)
+            expr=ast.BinaryOp(op=op_name, left=left, right=right, line=line, col=col),
+            constraints=constraints, line=line, col=col)
 
     def _parse_with_prefix_op(self):
         """Parse WITH in prefix/NUD position (e.g. NOT WITH EDGE layer)."""
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # WITH
         modifier = ''
         if self._at(TT.IDENT):
-            upper_mod = self._cur().value.upper()
+            upper_mod = self._cur().upper
             if upper_mod in ('EDGE', 'WIDTH', 'LENGTH', 'AREA', 'TEXT', 'NEIGHBOR'):
-                modifier = self._advance().value.upper()
+                modifier = self._advance().upper
         op_name = 'WITH ' + modifier if modifier else 'WITH'
         operands = []
         while not self._at_eol():
             t = self._cur()
-            if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-                break
-            if t.type == TT.IDENT and t.value.upper() in _DRC_MODIFIERS:
+            if t.type in _CMP_TYPES:
                 break
-            if t.type == TT.IDENT and t.value.upper() in ('PRIMARY', 'MULTI',
-                    'ACCUMULATE', 'NOT', 'MEASURE', 'ANNOTATE', 'NODAL'):
+            if t.upper in _WITH_OPERAND_STOP:
                 break
-            if t.type in (TT.IDENT, TT.STRING):
+            if t.type in _WITH_OPERAND_TYPES:
                 operands.append(self._parse_layer_expr(50))
             elif t.type == TT.LPAREN:
                 operands.append(self._parse_layer_expr(0))
-            elif t.type in (TT.INTEGER, TT.FLOAT):
-                operands.append(ast.NumberLiteral(value=self._advance().value, **self._loc()))
+            elif t.type in _NUMBER_TYPES:
+                tok = self._advance()
+                operands.append(ast.NumberLiteral(value=tok.value, line=tok.line, col=tok.col))
             else:
                 break
         constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         modifiers = []
         # Consume modifier+constraint pairs in a loop (e.g. SPACE < value CENTERS)
         while not self._at_eol():
             if self._at(TT.IDENT):
-                mod_u = self._cur().value.upper()
-                if mod_u in _DRC_MODIFIERS or mod_u in ('SPACE', 'NOTCH',
-                        'EVEN', 'ODD', 'INSIDE', 'OUTSIDE', 'OF', 'LAYER'):
+                mod_u = self._cur().upper
+                if mod_u in _WITH_MODS:
                     modifiers.append(self._advance().value)
                 else:
                     break
-            elif self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+            elif self._cur().type in _CMP_TYPES:
                 modifiers.extend(self._parse_constraints())
             elif self._at(TT.LPAREN):
                 modifiers.append(self._parse_layer_expr(0))
             elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                modifiers.append(ast.NumberLiteral(value=self._advance().value, **self._loc()))
+                tok = self._advance()
+                modifiers.append(ast.NumberLiteral(value=tok.value, line=tok.line, col=tok.col))
             else:
                 break
         return ast.DRCOp(op=op_name, operands=operands,
-                         constraints=constraints, modifiers=modifiers, **loc)
+                         constraints=constraints, modifiers=modifiers, line=line, col=col)
@@ -1,67 +1,210 @@
 """Expression parsing mixin: Pratt parser for layer and arithmetic expressions."""
 
-from .tokens import TokenType, Token
+from .tokens import TokenType, Token, TT
 from . import ast_nodes as ast
 from .parser_base import (
     SVRFParseError,
     _BINARY_OPS, _LAYER_BP, _UNARY_OPS,
-    _DRC_OPS, _DRC_MODIFIERS, _EXPR_STARTERS, _SVRF_KEYWORDS,
-    _DIRECTIVE_HEADS,
+    _DRC_MODIFIERS, _EXPR_STARTERS, _SVRF_KEYWORDS,
+    _CMP_TYPES, _NUMBER_TYPES, _RECTANGLE_MODS,
 )
 
-TT = TokenType
+# Token types bound at module level: the Pratt loops compare token types
+# on every step, and a global load is cheaper than TT.<name>.
+_IDENT, _INTEGER, _FLOAT = TT.IDENT, TT.INTEGER, TT.FLOAT
+_STRING, _PP_IFDEF, _PP_IFNDEF = TT.STRING, TT.PP_IFDEF, TT.PP_IFNDEF
+_PP_ELSE, _PP_ENDIF, _EQUALS = TT.PP_ELSE, TT.PP_ENDIF, TT.EQUALS
+_EQEQ, _BANGEQ, _LT = TT.EQEQ, TT.BANGEQ, TT.LT
+_GT_OP, _LE, _GE = TT.GT_OP, TT.LE, TT.GE
+_BANG, _AMPAMP, _PIPEPIPE = TT.BANG, TT.AMPAMP, TT.PIPEPIPE
+_PLUS, _MINUS, _STAR = TT.PLUS, TT.MINUS, TT.STAR
+_SLASH, _CARET, _COLONCOLON = TT.SLASH, TT.CARET, TT.COLONCOLON
+_QUESTION, _COLON, _LPAREN = TT.QUESTION, TT.COLON, TT.LPAREN
+_RPAREN, _LBRACE, _RBRACE = TT.RPAREN, TT.LBRACE, TT.RBRACE
+_LBRACKET, _RBRACKET, _COMMA = TT.LBRACKET, TT.RBRACKET, TT.COMMA
+_NEWLINE, _EOF = TT.NEWLINE, TT.EOF
+
+# Prefix '-' / '!' in arithmetic expressions, and #IFDEF/#IFNDEF openers
+_SIGN_TYPES = frozenset((_MINUS, _BANG))
+_PP_IF_TYPES = frozenset((_PP_IFDEF, _PP_IFNDEF))
+# Non-IDENT tokens that can start a layer expression
+_LAYER_START_TYPES = frozenset((
+    _LPAREN, _LBRACKET, _INTEGER, _FLOAT, _STRING, _MINUS, _BANG))
+# Tokens after OR/XOR/AND that make it an n-ary line op (_nud_or etc.)
+_LINE_OPERAND_TYPES = frozenset((_IDENT, _LPAREN, _INTEGER, _FLOAT))
+# [NOT] ENCLOSE RECTANGLE operand starts
+_RECT_OPERAND_TYPES = _LINE_OPERAND_TYPES | {_LBRACKET}
+# Constraint values taken as a single token (see _parse_constraints)
+_CONSTRAINT_VALUE_TYPES = frozenset((_INTEGER, _FLOAT, _IDENT))
+# Tokens ending a function-call argument, so that a lone name or number
+# before one is the whole argument (see _parse_func_call)
+_ARG_END_TYPES = frozenset((_COMMA, _RPAREN, _NEWLINE, _EOF))
+
+# SVRF keywords that end an operand list (see _can_start_layer_expr)
+_NON_OPERAND_KEYWORDS = _SVRF_KEYWORDS - _EXPR_STARTERS
+
+# Modifier words accepted after an operation: _DRC_MODIFIERS plus a few
+# context-specific ones.  Consumed by _consume_modifiers.
+# After a constrained expression: layer < 0.1 EVEN ...
+_CONSTRAINT_MODS = _DRC_MODIFIERS | {
+    'EVEN', 'ODD', 'PRIMARY', 'MULTI', 'NOT', 'MEASURE', 'ALL',
+    'ANNOTATE', 'NODAL', 'GOOD'}
+# After an infix measurement: layer AREA > 1 SINGULAR ...
+_MEASUREMENT_MODS = _DRC_MODIFIERS | {
+    'SINGULAR', 'ALSO', 'EVEN', 'ODD', 'PRIMARY', 'MULTI', 'NODAL', 'GOOD'}
+# After a binary spatial op (_maybe_trailing_modifiers)
+_TRAILING_MODS = _MEASUREMENT_MODS | {
+    'CONNECTED', 'NOT', 'MEASURE', 'ALL', 'ANNOTATE', 'ENDPOINT', 'ONLY'}
+# Words after postfix RECTANGLE that make it an infix operator
+_RECTANGLE_FOLLOW_WORDS = frozenset((
+    'ORTHOGONAL', 'ONLY', 'ASPECT', 'BY', 'SINGULAR', 'ALSO', 'CENTERS'))
+# SIZE modifiers: bare words, and words that take a value
+_SIZE_MODS = frozenset((
+    'UNDEROVER', 'OVERUNDER', 'INSIDE', 'OUTSIDE', 'GROW', 'SHRINK'))
+_SIZE_SUB_KEYWORDS = frozenset(('OF', 'STEP', 'LAYER', 'TRUNCATE'))
+# NET: words extending the op name, and words ending the operand list
+_NET_OP_WORDS = frozenset(('INTERACT', 'AREA', 'RATIO'))
+_NET_STOP = frozenset(('ACCUMULATE', 'RDB', 'PRINT', 'BY'))
+# Words forming a compound infix op after NOT, and those that may
+# additionally take an EDGE suffix (NOT IN EDGE is not an op)
+_NOT_RHS = frozenset((
+    'TOUCH', 'INSIDE', 'INTERACT', 'ENCLOSE', 'CUT', 'IN', 'OUT', 'OUTSIDE'))
+_NOT_EDGE_RHS = _NOT_RHS - {'IN'}
+
+
+def _tt_table(bps):
+    """List of binding powers indexed by TokenType (absent = 0)."""
+    table = [0] * (max(TokenType) + 1)
+    for tt, bp in bps.items():
+        table[tt] = bp
+    return table
+
+
+# Binding powers of non-IDENT tokens in layer expressions.
+_LAYER_BP_BY_TT = _tt_table({
+    _QUESTION: 1,       # ternary has lowest precedence
+    _LT: 5, _GT_OP: 5, _LE: 5, _GE: 5, _EQEQ: 5, _BANGEQ: 5,
+    # Arithmetic operators as infix in layer expressions (e.g. AA*GT)
+    _CARET: 45,
+    _STAR: 40,
+    _SLASH: 40,
+    _MINUS: 38,
+    _PLUS: 36,
+})
+
+# Binding powers in arithmetic (property block / VARIABLE) expressions.
+_TERNARY_BP = 1
+_ARITH_BP_BY_TT = _tt_table({
+    _QUESTION: _TERNARY_BP,     # ternary has lowest precedence
+    _PIPEPIPE: 2,
+    _AMPAMP: 3,
+    _LT: 5, _GT_OP: 5, _LE: 5, _GE: 5, _EQEQ: 5, _BANGEQ: 5,
+    _PLUS: 10, _MINUS: 10,
+    _STAR: 20, _SLASH: 20,
+    _CARET: 25,
+    _COLONCOLON: 35,    # scope resolution, highest precedence
+})
+
+
+# Prefix operators whose operand is a single atom (see
+# _parse_layer_prefix_chain); '!' and '-' are handled alongside them.
+_LAYER_PREFIX_OPS = frozenset(('NOT', 'COPY', 'MERGE', 'DONUT', 'HOLES'))
+
+# Token.role values for IDENT tokens: 0 is a plain name, and roles
+# >= _ROLE_HANDLER index the handler-name list built by _nud_roles().
+_ROLE_PREFIX = 1
+_ROLE_HANDLER = 2
+
+
+def _nud_roles(dispatch):
+    """Number the NUD handlers and map each keyword to its role."""
+    handlers = [None] * _ROLE_HANDLER
+    roles = dict.fromkeys(_LAYER_PREFIX_OPS, _ROLE_PREFIX)
+    for kw, name in dispatch.items():
+        if name not in handlers:
+            handlers.append(name)
+        roles[kw] = handlers.index(name)
+    return roles, handlers
 
 
 class ExpressionMixin:
     """Mixin providing expression parsing (Pratt parser) for the SVRF parser."""
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------
     # Arithmetic Pratt parser (for property block expressions)
     # ------------------------------------------------------------------
-    def _parse_arith_expr(self, bp):
-        left = self._arith_nud()
+    def _parse_arith_expr(self, bp: int):
+        """Precedence-climbing loop for arithmetic expressions.
+
+        Binary operators are all left-associative, so instead of recursing
+        for each right operand the pending (left, operator, bp) triples are
+        kept on a local stack and folded once a weaker operator arrives.
+        Only the ternary and prefix operators recurse.
+        """
+        tokens = self.tokens
+        arith_nud = self._arith_nud
+        left = arith_nud()
+        stack = []
+        top_bp = bp
         while True:
-            nbp = self._arith_led_bp()
-            if nbp <= bp:
-                break
-            left = self._arith_led(left, nbp)
-        return left
+            nbp = _ARITH_BP_BY_TT[tokens[self.pos].type]
+            while nbp <= top_bp:
+                if not stack:
+                    return left
+                pleft, op, _ = stack.pop()
+                left = ast.BinaryOp(op=op.value, left=pleft, right=left,
+                                    line=op.line, col=op.col)
+                top_bp = stack[-1][2] if stack else bp
+            if nbp == _TERNARY_BP:
+                left = self._arith_ternary(left)
+                continue
+            # nbp > 0, so op is a real token rather than EOF padding
+            op = tokens[self.pos]
+            self.pos += 1
+            if tokens[self.pos].type is _NEWLINE:
+                self._skip_newlines()
+            stack.append((left, op, nbp))
+            top_bp = nbp
+            left = arith_nud()
 
     def _arith_nud(self):
         t = self._cur()
-        loc = self._loc()
-        if t.type == TT.LPAREN:
+        if t.type is _LPAREN:
             self._advance()
             self._skip_newlines()
             expr = self._parse_arith_expr(0)
             self._skip_newlines()
-            if self._at(TT.RPAREN):
+            if self._at(_RPAREN):
                 self._advance()
             return expr
-        if t.type == TT.MINUS:
-            self._advance()
-            operand = self._parse_arith_expr(30)
-            return ast.UnaryOp(op='-', operand=operand, **loc)
-        if t.type == TT.BANG:
-            self._advance()
-            operand = self._parse_arith_expr(30)
-            return ast.UnaryOp(op='!', operand=operand, **loc)
-        if t.type == TT.INTEGER:
-            return ast.NumberLiteral(value=self._advance().value, **loc)
-        if t.type == TT.FLOAT:
-            return ast.NumberLiteral(value=self._advance().value, **loc)
-        if t.type == TT.STRING:
-            return ast.StringLiteral(value=self._advance().value, **loc)
-        if t.type == TT.IDENT:
+        if t.type is _MINUS or t.type is _BANG:
+            # Collect a run of prefix -/! and parse their operand once.
+            ops = []
+            while self._cur().type in _SIGN_TYPES:
+                ops.append(self._advance())
+            expr = self._parse_arith_expr(30)
+            for op in reversed(ops):
+                expr = ast.UnaryOp(op='-' if op.type is _MINUS else '!',
+                                   operand=expr, line=op.line, col=op.col)
+            return expr
+        if t.type in _NUMBER_TYPES:
+            self.pos += 1
+            return ast.NumberLiteral(value=t.value, line=t.line, col=t.col)
+        if t.type is _STRING:
+            self.pos += 1
+            return ast.StringLiteral(value=t.value, line=t.line, col=t.col)
+        if t.type is _IDENT:
             name = t.value
             # Function call: IDENT(args...)
-            if self._peek().type == TT.LPAREN:
+            if self._peek1().type is _LPAREN:
                 return self._parse_func_call()
             self._advance()
-            return ast.LayerRef(name=name, **loc)
+            return ast.LayerRef(name=name, line=t.line, col=t.col)
         # #IFDEF/#IFNDEF inside arithmetic expressions — skip the preprocessor
         # block and parse the then-body as the expression value.
-        if t.type in (TT.PP_IFDEF, TT.PP_IFNDEF):
+        if t.type in _PP_IF_TYPES:
             self._advance()  # #IFDEF/#IFNDEF
             while not self._at_eol():
                 self._advance()
@@ -71,100 +214,88 @@ class ExpressionMixin:
             expr = self._parse_arith_expr(0)
             self._skip_newlines()
             # Skip #ELSE body if present
-            if self._at(TT.PP_ELSE):
+            if self._at(_PP_ELSE):
                 self._advance()
                 self._consume_eol()
                 self._skip_newlines()
                 depth = 1
-                while not self._at(TT.EOF) and depth > 0:
-                    if self._cur().type in (TT.PP_IFDEF, TT.PP_IFNDEF):
+                while not self._at(_EOF) and depth > 0:
+                    if self._cur().type in _PP_IF_TYPES:
                         depth += 1
-                    elif self._cur().type == TT.PP_ENDIF:
+                    elif self._cur().type is _PP_ENDIF:
                         depth -= 1
                         if depth == 0:
                             break
                     self._advance()
-            if self._at(TT.PP_ENDIF):
+            if self._at(_PP_ENDIF):
                 self._advance()
                 self._consume_eol()
             self._skip_newlines()
             return expr
         # Fallback
-        self.warnings.append(
-            f"L{t.line}:{t.col}: Unexpected token {t.type.name} ({t.value!r}) "
+        self._warn(t,
+            f"Unexpected token {t.type.name} ({t.value!r}) "
             f"in arithmetic expression, substituting 0")
         self._advance()
-        return ast.NumberLiteral(value=0, **loc)
-
-    def _arith_led_bp(self):
-        t = self._cur()
-        if t.type == TT.QUESTION:
-            return 1  # ternary has lowest precedence
-        if t.type == TT.PIPEPIPE:
-            return 2
-        if t.type == TT.AMPAMP:
-            return 3
-        if t.type in (TT.EQEQ, TT.BANGEQ, TT.LT, TT.GT_OP, TT.LE, TT.GE):
-            return 5
-        if t.type in (TT.PLUS, TT.MINUS):
-            return 10
-        if t.type in (TT.STAR, TT.SLASH):
-            return 20
-        if t.type == TT.CARET:
-            return 25
-        if t.type == TT.COLONCOLON:
-            return 35  # scope resolution, highest precedence
-        return 0
+        return ast.NumberLiteral(value=0, line=t.line, col=t.col)
 
-    def _arith_led(self, left, nbp):
-        t = self._cur()
-        loc = self._loc()
-        # Ternary: cond ? then_expr : else_expr
-        if t.type == TT.QUESTION:
-            self._advance()  # ?
-            self._skip_newlines()
-            then_expr = self._parse_arith_expr(0)
-            self._skip_newlines()
-            if self._at(TT.COLON):
-                self._advance()  # :
-            self._skip_newlines()
-            else_expr = self._parse_arith_expr(0)
-            return ast.BinaryOp(op='?:', left=left,
-                                right=ast.BinaryOp(op=':',
-                                                   left=then_expr,
-                                                   right=else_expr,
-                                                   **loc), **loc)
-        op = self._advance().value
+    def _arith_ternary(self, left):
+        """cond ? then_expr : else_expr, with *left* as the condition."""
+        t = self._advance()  # ?
         self._skip_newlines()
-        right = self._parse_arith_expr(nbp)
-        return ast.BinaryOp(op=op, left=left, right=right, **loc)
+        then_expr = self._parse_arith_expr(0)
+        self._skip_newlines()
+        if self._at(_COLON):
+            self._advance()  # :
+        self._skip_newlines()
+        else_expr = self._parse_arith_expr(0)
+        return ast.BinaryOp(op='?:', left=left,
+                            right=ast.BinaryOp(op=':',
+                                               left=then_expr,
+                                               right=else_expr,
+                                               line=t.line, col=t.col),
+                            line=t.line, col=t.col)
 
     # ------------------------------------------------------------------
     # Function call: IDENT(args...)
     # ------------------------------------------------------------------
     def _parse_func_call(self):
-        loc = self._loc()
+        line, col = self._loc()
         name = self._advance().value
         self._advance()  # (
         args = []
-        while not self._at(TT.RPAREN) and not self._at(TT.EOF):
-            if self._at(TT.NEWLINE):
-                self._advance()
-                continue
-            if self._at(TT.COMMA):
-                self._advance()
+        append = args.append
+        tokens = self.tokens
+        while True:
+            t = tokens[self.pos]
+            tt = t.type
+            if tt is _RPAREN or tt is _EOF:
+                break
+            if tt is _NEWLINE or tt is _COMMA:
+                self.pos += 1
                 continue
-            args.append(self._parse_arith_expr(0))
-        if self._at(TT.RPAREN):
-            self._advance()
-        return ast.FuncCall(name=name, args=args, **loc)
+            # Most arguments are a single layer name or number; build
+            # those directly instead of entering the arithmetic parser.
+            if tokens[self.pos + 1].type in _ARG_END_TYPES:
+                if tt is _IDENT:
+                    self.pos += 1
+                    append(ast.LayerRef(name=t.value, line=t.line, col=t.col))
+                    continue
+                if tt is _INTEGER or tt is _FLOAT:
+                    self.pos += 1
+                    append(ast.NumberLiteral(value=t.value,
+                                             line=t.line, col=t.col))
+                    continue
+            append(self._parse_arith_expr(0))
+        if tt is _RPAREN:
+            self.pos += 1
+        return ast.FuncCall(name=name, args=args, line=line, col=col)
 
     # ------------------------------------------------------------------
     # Line expression (for VARIABLE values)
     # ------------------------------------------------------------------
     def _parse_line_expression(self):
         """Parse a simple expression on the rest of the line."""
-        loc = self._loc()
         if self._at_eol():
             return None
         # Try to parse as arithmetic expression (handles 0.036+GRID etc.)
@@ -174,24 +305,28 @@ class ExpressionMixin:
     # Bare expression (fallback for unknown statements in blocks)
     # ------------------------------------------------------------------
     def _parse_bare_expression(self):
-        loc = self._loc()
         try:
             expr = self._parse_layer_expr(0)
-            self._consume_eol()
-            return expr
-        except (SVRFParseError, Exception) as e:
+        except (SVRFParseError, RecursionError) as e:
             t = self._cur()
-            self.warnings.append(
-                f"L{t.line}:{t.col}: Exception in bare expression parse: {e}")
-            self._skip_to_eol()
-            self._consume_eol()
+            self._warn(t,
+                f"Exception in bare expression parse: {e}")
+            self._skip_line()
             return None
+        self._consume_eol()
+        return expr
 
     # ==================================================================
     # Layer Expression Pratt Parser (CORE)
     # ==================================================================
-    def _parse_layer_expr(self, bp):
-        """Main Pratt loop for layer expressions."""
+    def _parse_layer_expr(self, bp: int):
+        """Main Pratt loop for layer expressions.
+
+        The parser never backtracks over an expression: callers that
+        rewind (``self.pos = saved``) only do so after peeking at tokens,
+        before any sub-expression is parsed, so each (position, bp) pair
+        is parsed at most once and results are not memoized.
+        """
         left = self._layer_nud()
         while True:
             nbp = self._layer_led_bp()
@@ -200,27 +335,21 @@ class ExpressionMixin:
             left = self._layer_led(left)
         return left
 
-    def _can_start_layer_expr(self):
+    def _can_start_layer_expr(self) -> bool:
         """Check if current token can begin a layer expression.
 
         Uses the prescan symbol table to distinguish layer names from
         SVRF keywords that should terminate operand consumption.
         """
         t = self._cur()
-        if t.type in (TT.LPAREN, TT.LBRACKET, TT.INTEGER,
-                       TT.FLOAT, TT.STRING, TT.MINUS, TT.BANG):
-            return True
-        if t.type != TT.IDENT:
-            return False
-        upper = t.value.upper()
-        if upper in self._known_layers:
-            return True
-        if upper in _EXPR_STARTERS:
+        if t.type in _LAYER_START_TYPES:
             return True
-        if upper in _SVRF_KEYWORDS:
+        if t.type is not _IDENT:
             return False
-        # Unknown identifier — assume layer name (conservative)
-        return True
+        # Known names and expression starters can; other SVRF keywords
+        # can't; an unknown identifier is assumed to be a layer name
+        upper = t.upper
+        return upper in self._known_layers or upper not in _NON_OPERAND_KEYWORDS
 
     # ------------------------------------------------------------------
     # NUD dispatch table: keyword -> handler method name
@@ -237,20 +366,15 @@ class ExpressionMixin:
         'SHIFT': '_nud_size',
         'AREA': '_nud_area',
         'PERIMETER': '_nud_area',
-        'VERTEX': '_nud_vertex',
-        'ANGLE': '_nud_angle',
+        'VERTEX': '_nud_unary_constrained',
+        'ANGLE': '_nud_unary_constrained',
         'LENGTH': '_nud_length',
         'RECTANGLE': '_nud_rectangle',
         'RECTANGLES': '_nud_rectangles',
         'EXTENTS': '_nud_rectangles',
-        'NOT': '_nud_not',
-        'COPY': '_nud_copy',
         'PUSH': '_nud_push',
-        'MERGE': '_nud_merge',
         'GROW': '_nud_grow_shrink',
         'SHRINK': '_nud_grow_shrink',
-        'HOLES': '_nud_holes',
-        'DONUT': '_nud_donut',
         'EXTENT': '_nud_extent',
         'STAMP': '_nud_stamp',
         'OFFGRID': '_nud_offgrid',
@@ -276,335 +400,326 @@ class ExpressionMixin:
         'CONVEX': '_nud_convex',
         'EXPAND': '_nud_expand',
     }
+    _NUD_ROLES, _NUD_HANDLERS = _nud_roles(_NUD_DISPATCH)
 
     # ------------------------------------------------------------------
     # NUD (prefix / atom)
     # ------------------------------------------------------------------
     def _layer_nud(self):
         t = self._cur()
-        loc = self._loc()
+        tt = t.type
+
+        # Names and keywords are most operands, so they are tested first;
+        # keywords dispatch on the role the prescan stored on the token.
+        if tt is _IDENT:
+            role = t.role
+            if role:
+                if role == _ROLE_PREFIX:
+                    return self._parse_layer_prefix_chain()
+                result = self._nud_funcs[role](self, t)
+                if result is not None:
+                    return result
+
+            # Function call check
+            nxt = self._peek1()
+            if nxt.type is _LPAREN and nxt.col == t.col + len(t.value):
+                return self._parse_func_call()
+
+            # Fallback: treat as layer reference.
+            # (The _can_start_layer_expr() guard in greedy loops prevents
+            # keywords like OF/BY/LAYER from reaching here in those contexts.)
+            self._advance()
+            return ast.LayerRef(name=t.value, line=t.line, col=t.col)
 
-        if t.type == TT.LPAREN:
+        if tt is _LPAREN:
             self._advance()
             self._block_depth += 1
             expr = self._parse_layer_expr(0)
             # Skip newlines to find ) — handles multiline (OR\n...\n)
-            if self._at(TT.NEWLINE):
+            if self._at(_NEWLINE):
                 self._skip_newlines()
-            if self._at(TT.RPAREN):
+            if self._at(_RPAREN):
                 self._advance()
             self._block_depth -= 1
             return expr
 
-        if t.type == TT.LBRACKET:
+        if tt is _LBRACKET:
             return self._parse_bracket_expr()
 
-        if t.type == TT.INTEGER:
-            # Digit-prefixed layer name: 15V_GATE_CHECK (adjacent, no space)
-            nxt = self._peek()
-            if nxt.type == TT.IDENT and nxt.col == t.col + len(str(t.value)):
-                name = str(self._advance().value) + self._advance().value
-                return ast.LayerRef(name=name, **loc)
-            return ast.NumberLiteral(value=self._advance().value, **loc)
-        if t.type == TT.FLOAT:
-            return ast.NumberLiteral(value=self._advance().value, **loc)
-        if t.type == TT.STRING:
-            return ast.StringLiteral(value=self._advance().value, **loc)
-
-        if t.type == TT.MINUS:
-            self._advance()
-            if self._at(TT.INTEGER):
-                return ast.NumberLiteral(value=-self._advance().value, **loc)
-            if self._at(TT.FLOAT):
-                return ast.NumberLiteral(value=-self._advance().value, **loc)
-            operand = self._layer_nud()
-            return ast.UnaryOp(op='-', operand=operand, **loc)
-
-        if t.type == TT.BANG:
-            self._advance()
-            operand = self._parse_layer_expr(50)
-            return ast.UnaryOp(op='NOT', operand=operand, **loc)
+        if tt is _INTEGER or tt is _FLOAT:
+            self.pos += 1
+            return ast.NumberLiteral(value=t.value, line=t.line, col=t.col)
+        if tt is _STRING:
+            self.pos += 1
+            return ast.StringLiteral(value=t.value, line=t.line, col=t.col)
 
-        if t.type != TT.IDENT:
-            self.warnings.append(
-                f"L{t.line}:{t.col}: Unexpected token {t.type.name} ({t.value!r}) "
-                f"in layer expression, substituting 0")
-            self._advance()
-            return ast.NumberLiteral(value=0, **loc)
+        if tt is _MINUS:
+            if self._peek1().type in _NUMBER_TYPES:
+                self._advance()
+                return ast.NumberLiteral(value=-self._advance().value, line=t.line, col=t.col)
+            return self._parse_layer_prefix_chain()
 
-        upper = t.value.upper()
+        if tt is _BANG:
+            return self._parse_layer_prefix_chain()
 
-        handler_name = self._NUD_DISPATCH.get(upper)
-        if handler_name:
-            result = getattr(self, handler_name)(t, loc)
-            if result is not None:
-                return result
+        self._warn(t,
+            f"Unexpected token {tt.name} ({t.value!r}) "
+            f"in layer expression, substituting 0")
+        self._advance()
+        return ast.NumberLiteral(value=0, line=t.line, col=t.col)
 
-        # Function call check
-        if self._peek().type == TT.LPAREN:
-            nxt = self._peek()
-            if nxt.col == t.col + len(t.value):
-                return self._parse_func_call()
+    def _parse_layer_prefix_chain(self):
+        """Parse a run of prefix unary operators and the atom they apply to.
 
-        # Fallback: treat as layer reference.
-        # (The _can_start_layer_expr() guard in greedy loops prevents
-        # keywords like OF/BY/LAYER from reaching here in those contexts.)
-        self._advance()
-        return ast.LayerRef(name=t.value, **loc)
+        The operand of NOT/!/-/COPY/MERGE/DONUT/HOLES is a single atom, so
+        a run such as NOT NOT X or COPY !X is collected in one loop and
+        folded around one atom instead of recursing once per operator.
+        """
+        ops = []
+        while True:
+            t = self._cur()
+            if t.type is _BANG:
+                op = 'NOT'
+            elif t.type is _MINUS:
+                if self._peek1().type in _NUMBER_TYPES:
+                    break  # negative literal, parsed as the atom
+                op = '-'
+            elif t.type is _IDENT and t.role == _ROLE_PREFIX:
+                op = t.upper
+            else:
+                break
+            self._advance()
+            ops.append((op, t))
+        expr = self._layer_nud()
+        for op, t in reversed(ops):
+            expr = ast.UnaryOp(op=op, operand=expr, line=t.line, col=t.col)
+        return expr
 
     # ------------------------------------------------------------------
     # NUD handler methods (dispatched from _NUD_DISPATCH)
     # ------------------------------------------------------------------
 
-    def _nud_dfm(self, t, loc):
+    def _nud_dfm(self, t):
         return self._parse_dfm_op()
 
-    def _nud_drc_op(self, t, loc):
+    def _nud_drc_op(self, t):
         return self._parse_drc_op()
 
-    def _nud_size(self, t, loc):
+    def _nud_size(self, t):
         return self._parse_size_op()
 
-    def _nud_area(self, t, loc):
+    def _nud_area(self, t):
         return self._parse_area_op()
 
-    def _nud_vertex(self, t, loc):
+    def _nud_unary_constrained(self, t):
         return self._parse_unary_constrained_op()
 
-    def _nud_angle(self, t, loc):
-        return self._parse_angle_op()
-
-    def _nud_length(self, t, loc):
+    def _nud_length(self, t):
         return self._parse_length_op()
 
-    def _nud_rectangle(self, t, loc):
+    def _nud_rectangle(self, t):
         return self._parse_rectangle_op()
 
-    def _nud_rectangles(self, t, loc):
+    def _nud_rectangles(self, t):
         return self._parse_rectangles_op()
 
-    def _nud_grow_shrink(self, t, loc):
+    def _nud_grow_shrink(self, t):
         return self._parse_grow_shrink_op()
 
-    def _nud_extent(self, t, loc):
+    def _nud_extent(self, t):
         return self._parse_extent_op()
 
-    def _nud_stamp(self, t, loc):
+    def _nud_stamp(self, t):
         return self._parse_stamp_op()
 
-    def _nud_offgrid(self, t, loc):
+    def _nud_offgrid(self, t):
         return self._parse_offgrid_op()
 
-    def _nud_with(self, t, loc):
+    def _nud_with(self, t):
         return self._parse_with_prefix_op()
 
-    def _nud_not(self, t, loc):
-        self._advance()
-        operand = self._parse_layer_expr(50)
-        return ast.UnaryOp(op='NOT', operand=operand, **loc)
-
-    def _nud_copy(self, t, loc):
-        self._advance()
-        operand = self._parse_layer_expr(50)
-        return ast.UnaryOp(op='COPY', operand=operand, **loc)
-
-    def _nud_push(self, t, loc):
+    def _nud_push(self, t):
         self._advance()
         operand = self._parse_layer_expr(0)
-        return ast.UnaryOp(op='PUSH', operand=operand, **loc)
+        return ast.UnaryOp(op='PUSH', operand=operand, line=t.line, col=t.col)
 
-    def _nud_merge(self, t, loc):
-        self._advance()
-        operand = self._parse_layer_expr(50)
-        return ast.UnaryOp(op='MERGE', operand=operand, **loc)
-
-    def _nud_donut(self, t, loc):
-        self._advance()
-        operand = self._parse_layer_expr(50)
-        return ast.UnaryOp(op='DONUT', operand=operand, **loc)
-
-    def _nud_holes(self, t, loc):
-        self._advance()
-        operand = self._parse_layer_expr(50)
-        return ast.UnaryOp(op='HOLES', operand=operand, **loc)
-
-    def _nud_rotate(self, t, loc):
+    def _nud_rotate(self, t):
         self._advance()  # ROTATE
         operand = self._parse_layer_expr(50)
         modifiers = []
         while not self._at_eol():
-            if self._at(TT.IDENT):
+            if self._at(_IDENT):
                 modifiers.append(self._advance().value)
-            elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                modifiers.append(str(self._advance().value))
+            elif self._at(_INTEGER) or self._at(_FLOAT):
+                modifiers.append(self._advance().raw)
             else:
                 break
         return ast.DRCOp(op='ROTATE', operands=[operand],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=t.line, col=t.col)
 
-    def _nud_or(self, t, loc):
-        nxt = self._peek()
+    def _nud_or(self, t):
+        nxt = self._peek1()
         # Also trigger for multiline OR: OR at EOL inside a block
-        if nxt.type in (TT.IDENT, TT.LPAREN, TT.INTEGER, TT.FLOAT) or \
-                (nxt.type == TT.NEWLINE and self._block_depth > 0):
+        if nxt.type in _LINE_OPERAND_TYPES or \
+                (nxt.type is _NEWLINE and self._block_depth > 0):
             self._advance()  # OR
             # Check for OR EDGE variant
             or_op = 'OR'
-            if self._at(TT.IDENT) and self._cur().value.upper() == 'EDGE':
+            if self._at(_IDENT) and self._cur().upper == 'EDGE':
                 self._advance()  # EDGE
                 or_op = 'OR EDGE'
             operands = []
             while True:
-                while not self._at_eol() and not self._at(TT.RPAREN) and not self._at(TT.RBRACKET) and self._can_start_layer_expr():
-                    operands.append(self._parse_layer_expr(50))
+                self._collect_line_operands(operands)
                 # Multiline continuation: peek past newlines for more operands
                 if self._at_eol() and self._block_depth > 0:
                     saved = self.pos
                     self._consume_eol()
                     self._skip_newlines()
-                    if self._can_start_layer_expr() and not self._at(TT.RBRACE):
+                    if self._can_start_layer_expr() and not self._at(_RBRACE):
                         # Don't consume next line if it starts a new statement
-                        if self._at(TT.IDENT):
-                            nxt_t = self._peek().type
-                            if nxt_t == TT.EQUALS or nxt_t == TT.LBRACE:
+                        if self._at(_IDENT):
+                            nxt_t = self._peek1().type
+                            if nxt_t is _EQUALS or nxt_t is _LBRACE:
                                 self.pos = saved
                                 break
-                        # Digit-prefix assignment: INTEGER IDENT EQUALS
-                        if self._at(TT.INTEGER):
-                            nxt_t = self._peek()
-                            if nxt_t.type == TT.IDENT:
-                                nxt2 = self._peek(2)
-                                if nxt2.type == TT.EQUALS:
-                                    self.pos = saved
-                                    break
                         continue  # more operands on next line
                     self.pos = saved
                 break
             if len(operands) == 0:
-                return ast.LayerRef(name='OR', **loc)
+                return ast.LayerRef(name='OR', line=t.line, col=t.col)
             if len(operands) == 1:
                 return operands[0]
-            # Build left-associative chain
-            result = operands[0]
-            for op in operands[1:]:
-                result = ast.BinaryOp(op=or_op, left=result, right=op, **loc)
-            return result
+            return self._fold_left(or_op, operands, t)
         return None  # fall through to LayerRef
 
-    def _nud_xor(self, t, loc):
-        nxt = self._peek()
-        if nxt.type in (TT.IDENT, TT.LPAREN, TT.INTEGER, TT.FLOAT):
+    def _nud_xor(self, t):
+        nxt = self._peek1()
+        if nxt.type in _LINE_OPERAND_TYPES:
             self._advance()  # XOR
             operands = []
-            while not self._at_eol() and not self._at(TT.RPAREN) and not self._at(TT.RBRACKET) and self._can_start_layer_expr():
-                operands.append(self._parse_layer_expr(50))
+            self._collect_line_operands(operands)
             if len(operands) == 0:
-                return ast.LayerRef(name='XOR', **loc)
+                return ast.LayerRef(name='XOR', line=t.line, col=t.col)
             if len(operands) == 1:
                 return operands[0]
-            result = operands[0]
-            for op in operands[1:]:
-                result = ast.BinaryOp(op='XOR', left=result, right=op, **loc)
-            return result
+            return self._fold_left('XOR', operands, t)
         return None  # fall through to LayerRef
 
-    def _nud_and(self, t, loc):
-        nxt = self._peek()
-        if nxt.type in (TT.IDENT, TT.LPAREN, TT.INTEGER, TT.FLOAT):
+    def _nud_and(self, t):
+        nxt = self._peek1()
+        if nxt.type in _LINE_OPERAND_TYPES:
             self._advance()  # AND
             operands = []
-            while not self._at_eol() and not self._at(TT.RPAREN) and not self._at(TT.RBRACKET) and self._can_start_layer_expr():
-                operands.append(self._parse_layer_expr(50))
+            self._collect_line_operands(operands)
             if len(operands) == 0:
-                return ast.LayerRef(name='AND', **loc)
+                return ast.LayerRef(name='AND', line=t.line, col=t.col)
             if len(operands) == 1:
                 return operands[0]
-            result = operands[0]
-            for op in operands[1:]:
-                result = ast.BinaryOp(op='AND', left=result, right=op, **loc)
-            return result
+            return self._fold_left('AND', operands, t)
         return None  # fall through to LayerRef
 
-    def _nud_good(self, t, loc):
+    def _collect_line_operands(self, operands):
+        """Append operands up to end of line, ')' / ']' or a non-operand."""
+        append = operands.append
+        while True:
+            tt = self._cur().type
+            if tt is _NEWLINE or tt is _EOF or tt is _RPAREN or tt is _RBRACKET:
+                return
+            if not self._can_start_layer_expr():
+                return
+            append(self._parse_layer_expr(50))
+
+    def _fold_left(self, op, operands, t):
+        """Build a left-associative BinaryOp chain over two or more operands."""
+        binop = ast.BinaryOp
+        result = operands[0]
+        for i in range(1, len(operands)):
+            result = binop(op=op, left=result, right=operands[i], line=t.line, col=t.col)
+        return result
+
+    def _nud_good(self, t):
         self._advance()  # GOOD
         modifiers = []
         while not self._at_eol():
-            if self._at(TT.IDENT):
+            if self._at(_IDENT):
                 modifiers.append(self._advance().value)
-            elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                modifiers.append(str(self._advance().value))
-            elif self._at(TT.LPAREN):
+            elif self._at(_INTEGER) or self._at(_FLOAT):
+                modifiers.append(self._advance().raw)
+            elif self._at(_LPAREN):
                 modifiers.append(self._parse_layer_expr(0))
             else:
                 break
         return ast.DRCOp(op='GOOD', operands=[],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=t.line, col=t.col)
 
-    def _nud_net(self, t, loc):
-        nxt = self._peek()
-        if nxt.type == TT.IDENT and nxt.value.upper() == 'AREA':
+    def _nud_net(self, t):
+        nxt = self._peek1()
+        if nxt.type is _IDENT and nxt.upper == 'AREA':
             self._advance()  # NET
             self._advance()  # AREA
             op_name = 'NET AREA'
-            if self._at(TT.IDENT) and self._cur().value.upper() == 'RATIO':
+            if self._at(_IDENT) and self._cur().upper == 'RATIO':
                 self._advance()  # RATIO
                 op_name = 'NET AREA RATIO'
             operands = []
-            while self._at(TT.IDENT) and not self._at_eol():
-                upper_cur = self._cur().value.upper()
-                if upper_cur in ('ACCUMULATE', 'RDB', 'PRINT', 'BY'):
+            while self._at(_IDENT) and not self._at_eol():
+                upper_cur = self._cur().upper
+                if upper_cur in _NET_STOP:
                     break
                 operands.append(self._parse_layer_expr(50))
             constraints = []
-            if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+            if self._cur().type in _CMP_TYPES:
                 constraints = self._parse_constraints()
             modifiers = []
             self._parse_drc_modifiers(modifiers)
             self._parse_drc_multiline_continuation(modifiers)
             return ast.DRCOp(op=op_name, operands=operands,
-                             constraints=constraints, modifiers=modifiers, **loc)
+                             constraints=constraints, modifiers=modifiers, line=t.line, col=t.col)
         # NET layer "string" ... — generic NET operation
         else:
             self._advance()  # NET
             operands = []
             while not self._at_eol():
-                if self._at(TT.IDENT):
+                if self._at(_IDENT):
                     operands.append(self._parse_layer_expr(50))
-                elif self._at(TT.STRING):
-                    operands.append(ast.StringLiteral(value=self._advance().value, **self._loc()))
-                elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                    operands.append(ast.NumberLiteral(value=self._advance().value, **self._loc()))
-                elif self._at(TT.LPAREN):
+                elif self._at(_STRING):
+                    tok = self._advance()
+                    operands.append(ast.StringLiteral(value=tok.value, line=tok.line, col=tok.col))
+                elif self._at(_INTEGER) or self._at(_FLOAT):
+                    tok = self._advance()
+                    operands.append(ast.NumberLiteral(value=tok.value, line=tok.line, col=tok.col))
+                elif self._at(_LPAREN):
                     operands.append(self._parse_layer_expr(0))
                 else:
                     break
             return ast.DRCOp(op='NET', operands=operands,
-                             constraints=[], modifiers=[], **loc)
+                             constraints=[], modifiers=[], line=t.line, col=t.col)
 
-    def _nud_coin_in(self, t, loc):
-        upper = t.value.upper()
-        nxt = self._peek()
-        if nxt.type == TT.IDENT:
-            nxt_u = nxt.value.upper()
+    def _nud_coin_in(self, t):
+        upper = t.upper
+        nxt = self._peek1()
+        if nxt.type is _IDENT:
+            nxt_u = nxt.upper
             if nxt_u == 'EDGE':
                 self._advance()  # COIN/IN/COINCIDENT
                 self._advance()  # EDGE
                 operand = self._parse_layer_expr(50)
-                return ast.UnaryOp(op=upper + ' EDGE', operand=operand, **loc)
+                return ast.UnaryOp(op=upper + ' EDGE', operand=operand, line=t.line, col=t.col)
             if nxt_u in ('INSIDE', 'OUTSIDE'):
-                nxt2 = self._peek(2)
-                if nxt2 and nxt2.type == TT.IDENT and nxt2.value.upper() == 'EDGE':
+                nxt2 = self._peek2()
+                if nxt2 and nxt2.type is _IDENT and nxt2.upper == 'EDGE':
                     self._advance()  # COIN/IN/COINCIDENT
-                    middle = self._advance().value.upper()  # INSIDE/OUTSIDE
+                    middle = self._advance().upper  # INSIDE/OUTSIDE
                     self._advance()  # EDGE
                     operand = self._parse_layer_expr(50)
-                    return ast.UnaryOp(op=upper + ' ' + middle + ' EDGE', operand=operand, **loc)
+                    return ast.UnaryOp(op=upper + ' ' + middle + ' EDGE', operand=operand, line=t.line, col=t.col)
         return None  # fall through to LayerRef
 
-    def _nud_touch(self, t, loc):
-        nxt = self._peek()
-        if nxt.type == TT.IDENT:
-            nxt_u = nxt.value.upper()
+    def _nud_touch(self, t):
+        nxt = self._peek1()
+        if nxt.type is _IDENT:
+            nxt_u = nxt.upper
             if nxt_u == 'EDGE':
                 self._advance()  # TOUCH
                 self._advance()  # EDGE
@@ -612,27 +727,27 @@ class ExpressionMixin:
                 if self._can_start_layer_expr() and not self._at_eol():
                     right_op = self._parse_layer_expr(50)
                     return ast.BinaryOp(op='TOUCH EDGE', left=left_op,
-                                        right=right_op, **loc)
-                return ast.UnaryOp(op='TOUCH EDGE', operand=left_op, **loc)
+                                        right=right_op, line=t.line, col=t.col)
+                return ast.UnaryOp(op='TOUCH EDGE', operand=left_op, line=t.line, col=t.col)
             if nxt_u in ('INSIDE', 'OUTSIDE'):
-                nxt2 = self._peek(2)
-                if nxt2 and nxt2.type == TT.IDENT and nxt2.value.upper() == 'EDGE':
+                nxt2 = self._peek2()
+                if nxt2 and nxt2.type is _IDENT and nxt2.upper == 'EDGE':
                     self._advance()  # TOUCH
-                    middle = self._advance().value.upper()  # INSIDE/OUTSIDE
+                    middle = self._advance().upper  # INSIDE/OUTSIDE
                     self._advance()  # EDGE
                     left_op = self._parse_layer_expr(50)
                     if self._can_start_layer_expr() and not self._at_eol():
                         right_op = self._parse_layer_expr(50)
                         return ast.BinaryOp(op='TOUCH ' + middle + ' EDGE',
-                                            left=left_op, right=right_op, **loc)
+                                            left=left_op, right=right_op, line=t.line, col=t.col)
                     return ast.UnaryOp(op='TOUCH ' + middle + ' EDGE',
-                                       operand=left_op, **loc)
+                                       operand=left_op, line=t.line, col=t.col)
         return None  # fall through to LayerRef
 
-    def _nud_inside_outside(self, t, loc):
-        upper = t.value.upper()
-        nxt = self._peek()
-        if nxt.type == TT.IDENT and nxt.value.upper() == 'EDGE':
+    def _nud_inside_outside(self, t):
+        upper = t.upper
+        nxt = self._peek1()
+        if nxt.type is _IDENT and nxt.upper == 'EDGE':
             self._advance()  # INSIDE/OUTSIDE
             self._advance()  # EDGE
             left_op = self._parse_layer_expr(50)
@@ -640,221 +755,204 @@ class ExpressionMixin:
             if self._can_start_layer_expr() and not self._at_eol():
                 right_op = self._parse_layer_expr(50)
                 return ast.BinaryOp(op=upper + ' EDGE', left=left_op,
-                                    right=right_op, **loc)
-            return ast.UnaryOp(op=upper + ' EDGE', operand=left_op, **loc)
+                                    right=right_op, line=t.line, col=t.col)
+            return ast.UnaryOp(op=upper + ' EDGE', operand=left_op, line=t.line, col=t.col)
         # INSIDE CELL / OUTSIDE CELL: DRC op with cell name + pattern args
-        if nxt.type == TT.IDENT and nxt.value.upper() == 'CELL':
+        if nxt.type is _IDENT and nxt.upper == 'CELL':
             self._advance()  # INSIDE/OUTSIDE
             self._advance()  # CELL
             operands = []
             while not self._at_eol():
-                if self._at(TT.IDENT):
+                if self._at(_IDENT):
                     operands.append(self._parse_layer_expr(50))
-                elif self._at(TT.STRING):
-                    operands.append(ast.StringLiteral(value=self._advance().value, **self._loc()))
-                elif self._at(TT.LPAREN):
+                elif self._at(_STRING):
+                    tok = self._advance()
+                    operands.append(ast.StringLiteral(value=tok.value, line=tok.line, col=tok.col))
+                elif self._at(_LPAREN):
                     operands.append(self._parse_layer_expr(0))
                 else:
                     break
             return ast.DRCOp(op=upper + ' CELL', operands=operands,
-                             constraints=[], modifiers=[], **loc)
+                             constraints=[], modifiers=[], line=t.line, col=t.col)
         # INSIDE/OUTSIDE as prefix unary op (e.g. NOT INSIDE B)
         self._advance()
         operand = self._parse_layer_expr(50)
-        return ast.UnaryOp(op=upper, operand=operand, **loc)
+        return ast.UnaryOp(op=upper, operand=operand, line=t.line, col=t.col)
 
-    def _nud_prefix_unary_op(self, t, loc):
-        upper = t.value.upper()
+    def _nud_prefix_unary_op(self, t):
+        upper = t.upper
         self._advance()
         operand = self._parse_layer_expr(50)
-        return ast.UnaryOp(op=upper, operand=operand, **loc)
+        return ast.UnaryOp(op=upper, operand=operand, line=t.line, col=t.col)
 
-    def _nud_pathchk(self, t, loc):
+    def _nud_pathchk(self, t):
         self._advance()  # PATHCHK
         modifiers = []
         while not self._at_eol():
             t_cur = self._cur()
-            if t_cur.type == TT.BANG:
+            if t_cur.type is _BANG:
                 self._advance()
-                if self._at(TT.IDENT):
+                if self._at(_IDENT):
                     modifiers.append('!' + self._advance().value)
                 else:
                     modifiers.append('!')
-            elif t_cur.type == TT.AMPAMP:
+            elif t_cur.type is _AMPAMP:
                 self._advance()
                 modifiers.append('&&')
-            elif t_cur.type == TT.IDENT:
+            elif t_cur.type is _IDENT:
                 modifiers.append(self._advance().value)
-            elif t_cur.type == TT.STRING:
+            elif t_cur.type is _STRING:
                 modifiers.append(self._advance().value)
             else:
                 break
         return ast.DRCOp(op='PATHCHK', operands=[],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=t.line, col=t.col)
 
-    def _nud_drawn(self, t, loc):
+    def _nud_drawn(self, t):
         self._advance()
         keywords = ['DRAWN']
-        while self._at(TT.IDENT) and not self._at_eol():
+        while self._at(_IDENT) and not self._at_eol():
             keywords.append(self._advance().value)
-        return ast.Directive(keywords=keywords, arguments=[], **loc)
+        return ast.Directive(keywords=keywords, arguments=[], line=t.line, col=t.col)
 
-    def _nud_path(self, t, loc):
-        if self._peek().type == TT.IDENT and \
-                self._peek().value.upper() == 'LENGTH':
+    def _nud_path(self, t):
+        if self._peek1().type is _IDENT and \
+                self._peek1().upper == 'LENGTH':
             self._advance()  # PATH
             return self._parse_length_op(op_name='PATH LENGTH')
         return None  # fall through to LayerRef
 
-    def _nud_convex(self, t, loc):
-        if self._peek().type == TT.IDENT and \
-                self._peek().value.upper() == 'EDGE':
+    def _nud_convex(self, t):
+        if self._peek1().type is _IDENT and \
+                self._peek1().upper == 'EDGE':
             return self._parse_convex_edge_op()
         return None  # fall through to LayerRef
 
-    def _nud_expand(self, t, loc):
-        if self._peek().type == TT.IDENT and \
-                self._peek().value.upper() == 'EDGE':
+    def _nud_expand(self, t):
+        if self._peek1().type is _IDENT and \
+                self._peek1().upper == 'EDGE':
             return self._parse_expand_edge_op()
-        if self._peek().type == TT.IDENT and \
-                self._peek().value.upper() == 'TEXT':
+        if self._peek1().type is _IDENT and \
+                self._peek1().upper == 'TEXT':
             self._advance()  # EXPAND
             self._advance()  # TEXT
             modifiers = []
             while not self._at_eol():
-                if self._at(TT.IDENT):
+                if self._at(_IDENT):
                     modifiers.append(self._advance().value)
-                elif self._at(TT.STRING):
+                elif self._at(_STRING):
                     modifiers.append(self._advance().value)
-                elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                    modifiers.append(str(self._advance().value))
+                elif self._at(_INTEGER) or self._at(_FLOAT):
+                    modifiers.append(self._advance().raw)
                 else:
                     break
             return ast.DRCOp(op='EXPAND TEXT', operands=[],
-                             constraints=[], modifiers=modifiers, **loc)
+                             constraints=[], modifiers=modifiers, line=t.line, col=t.col)
         return None  # fall through to LayerRef
 
-    def _nud_device(self, t, loc):
-        if self._peek().type == TT.IDENT and \
-                self._peek().value.upper() == 'LAYER':
+    def _nud_device(self, t):
+        if self._peek1().type is _IDENT and \
+                self._peek1().upper == 'LAYER':
             self._advance()  # DEVICE
             self._advance()  # LAYER
             modifiers = []
             while not self._at_eol():
-                if self._at(TT.IDENT):
+                if self._at(_IDENT):
                     modifiers.append(self._advance().value)
-                elif self._at(TT.LPAREN):
+                elif self._at(_LPAREN):
                     self._advance()
                     inner = []
-                    while not self._at(TT.RPAREN) and not self._at(TT.EOF):
-                        inner.append(str(self._advance().value))
-                    if self._at(TT.RPAREN):
+                    while not self._at(_RPAREN) and not self._at(_EOF):
+                        inner.append(self._advance().raw)
+                    if self._at(_RPAREN):
                         self._advance()
                     modifiers[-1] = modifiers[-1] + '(' + ' '.join(inner) + ')' if modifiers else '(' + ' '.join(inner) + ')'
                 else:
                     break
             return ast.DRCOp(op='DEVICE LAYER', operands=[],
-                             constraints=[], modifiers=modifiers, **loc)
+                             constraints=[], modifiers=modifiers, line=t.line, col=t.col)
         return None  # fall through to LayerRef
 
 
     # ------------------------------------------------------------------
     # LED binding power
     # ------------------------------------------------------------------
-    def _layer_led_bp(self):
-        t = self._cur()
-        if t.type == TT.NEWLINE or t.type == TT.EOF:
-            return 0
-        if t.type in (TT.RBRACE, TT.RBRACKET, TT.RPAREN):
-            return 0
-        if t.type == TT.QUESTION:
-            return 1  # ternary has lowest precedence
-        if t.type == TT.COLON:
-            return 0  # colon terminates the then-branch of ternary
-        if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+    def _layer_led_bp(self) -> int:
+        t = self.tokens[self.pos]
+        if t.type is not _IDENT:
+            return _LAYER_BP_BY_TT[t.type]
+        bp = t.bp
+        if bp < 0:
+            # The lookahead helpers only read the token stream, which never
+            # changes, so the result is fixed per token and cached on it.
+            # Nested Pratt loops ask again for the same token as they unwind.
+            bp = self._LAYER_IDENT_BP.get(t.upper, 0)
+            if bp.__class__ is not int:
+                bp = bp(self, t)
+            t.bp = bp
+        return bp
+
+    # Context-dependent binding powers for keywords that only act as infix
+    # operators when a particular token follows them.
+    def _bp_coin_edge(self, t):
+        # IN EDGE / COIN EDGE, also COIN INSIDE EDGE, COIN OUTSIDE EDGE
+        nxt = self._peek1()
+        if nxt.type is _IDENT:
+            nxt_u = nxt.upper
+            if nxt_u == 'EDGE':
+                return _LAYER_BP[t.upper]
+            if nxt_u in ('INSIDE', 'OUTSIDE'):
+                nxt2 = self._peek2()
+                if nxt2.type is _IDENT and nxt2.upper == 'EDGE':
+                    return _LAYER_BP[t.upper]
+        return 0
+
+    def _bp_if_constraint_follows(self, t):
+        # layer ANGLE == 45, layer AREA < 1, ...
+        if self._peek1().type in _CMP_TYPES:
+            return 5
+        return 0
+
+    def _bp_if_edge_follows(self, t):
+        # layer CONVEX EDGE == 2, (expr) EXPAND EDGE INSIDE BY val
+        nxt = self._peek1()
+        if nxt.type is _IDENT and nxt.upper == 'EDGE':
+            return 5
+        return 0
+
+    def _bp_rectangle(self, t):
+        # Postfix RECTANGLE: layer RECTANGLE == val BY == val, and the
+        # modifier-only form layer RECTANGLE ORTHOGONAL ONLY
+        nxt = self._peek1()
+        if nxt.type in _CMP_TYPES:
+            return 5
+        if nxt.type is _IDENT and nxt.upper in _RECTANGLE_FOLLOW_WORDS:
             return 5
-        if t.type == TT.IDENT:
-            upper = t.value.upper()
-            bp = _LAYER_BP.get(upper, 0)
-            if bp:
-                # IN EDGE / COIN EDGE: only if followed by EDGE
-                # Also handles COIN INSIDE EDGE, COIN OUTSIDE EDGE, etc.
-                if upper in ('IN', 'COIN', 'COINCIDENT'):
-                    nxt = self._peek()
-                    if nxt.type == TT.IDENT:
-                        nxt_u = nxt.value.upper()
-                        if nxt_u == 'EDGE':
-                            return bp
-                        if nxt_u in ('INSIDE', 'OUTSIDE'):
-                            nxt2 = self._peek(2)
-                            if nxt2 and nxt2.type == TT.IDENT and nxt2.value.upper() == 'EDGE':
-                                return bp
-                    return 0
-                # INSIDE EDGE / OUTSIDE EDGE as two-word binary ops
-                if upper in ('INSIDE', 'OUTSIDE'):
-                    nxt = self._peek()
-                    if nxt.type == TT.IDENT and nxt.value.upper() == 'EDGE':
-                        return bp
-                return bp
-            if upper == 'WITH':
-                return 35
-            if upper == 'SIZE':
-                return 5
-            if upper in ('HOLES', 'DONUT'):
-                return 50
-            if upper == 'NET':
-                return 5  # NET INTERACT / NET AREA RATIO as infix
-            if upper in ('ANGLE', 'LENGTH', 'AREA', 'VERTEX'):
-                # Check if followed by constraint (e.g. layer ANGLE == 45)
-                nxt = self._peek()
-                if nxt.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-                    return 5
-                return 0
-            # CONVEX EDGE as infix: layer CONVEX EDGE == 2
-            if upper == 'CONVEX':
-                nxt = self._peek()
-                if nxt.type == TT.IDENT and nxt.value.upper() == 'EDGE':
-                    return 5
-                return 0
-            # CONNECTED as postfix modifier (e.g. layer1 AND layer2 CONNECTED)
-            if upper == 'CONNECTED':
-                return 5
-            # RECTANGLE as postfix DRC op (e.g. layer RECTANGLE == val BY == val)
-            # Also fires for modifier-only: layer RECTANGLE ORTHOGONAL ONLY
-            if upper == 'RECTANGLE':
-                nxt = self._peek()
-                if nxt.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-                    return 5
-                if nxt.type == TT.IDENT and nxt.value.upper() in (
-                        'ORTHOGONAL', 'ONLY', 'ASPECT', 'BY',
-                        'SINGULAR', 'ALSO', 'CENTERS'):
-                    return 5
-                return 0
-            # EXPAND EDGE as postfix: (expr) EXPAND EDGE INSIDE BY val
-            if upper == 'EXPAND':
-                nxt = self._peek()
-                if nxt.type == TT.IDENT and nxt.value.upper() == 'EDGE':
-                    return 5
-                return 0
-            # Stop words: don't treat as infix
-            if upper in _DRC_MODIFIERS or upper in _DRC_OPS or \
-                    upper in _DIRECTIVE_HEADS:
-                return 0
-            if upper in ('CMACRO', 'PROPERTY', 'IF', 'ELSE'):
-                return 0
-        # Arithmetic operators as infix in layer expressions (e.g. AA*GT)
-        if t.type == TT.CARET:
-            return 45
-        if t.type == TT.STAR:
-            return 40
-        if t.type == TT.SLASH:
-            return 40
-        if t.type == TT.MINUS:
-            return 38
-        if t.type == TT.PLUS:
-            return 36
         return 0
 
+    # IDENT binding powers: an int, or a _bp_* function that peeks ahead.
+    # Words not listed (including DRC modifiers, DRC ops and directive
+    # heads) never continue an expression.
+    _LAYER_IDENT_BP = dict(
+        _LAYER_BP,
+        IN=_bp_coin_edge,
+        COIN=_bp_coin_edge,
+        COINCIDENT=_bp_coin_edge,
+        WITH=35,
+        SIZE=5,
+        HOLES=50,
+        DONUT=50,
+        NET=5,                  # NET INTERACT / NET AREA RATIO as infix
+        CONNECTED=5,            # layer1 AND layer2 CONNECTED
+        ANGLE=_bp_if_constraint_follows,
+        LENGTH=_bp_if_constraint_follows,
+        AREA=_bp_if_constraint_follows,
+        VERTEX=_bp_if_constraint_follows,
+        CONVEX=_bp_if_edge_follows,
+        EXPAND=_bp_if_edge_follows,
+        RECTANGLE=_bp_rectangle,
+    )
+
     # ------------------------------------------------------------------
     # LED dispatch table: keyword -> handler method name
     # ------------------------------------------------------------------
@@ -894,15 +992,14 @@ class ExpressionMixin:
     # ------------------------------------------------------------------
     def _layer_led(self, left):
         t = self._cur()
-        loc = self._loc()
 
         # Ternary: cond ? then_expr : else_expr
-        if t.type == TT.QUESTION:
+        if t.type is _QUESTION:
             self._advance()  # ?
             self._skip_newlines()
             then_expr = self._parse_layer_expr(0)
             self._skip_newlines()
-            if self._at(TT.COLON):
+            if self._at(_COLON):
                 self._advance()  # :
             self._skip_newlines()
             else_expr = self._parse_layer_expr(0)
@@ -910,55 +1007,48 @@ class ExpressionMixin:
                                 right=ast.BinaryOp(op=':',
                                                    left=then_expr,
                                                    right=else_expr,
-                                                   **loc), **loc)
+                                                   line=t.line, col=t.col),
+                                line=t.line, col=t.col)
 
         # Comparison operators -> constraints + optional trailing modifiers
-        if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if t.type in _CMP_TYPES:
             constraints = self._parse_constraints()
             # Consume trailing DRC modifiers (EVEN, ODD, SINGULAR, ALSO, etc.)
-            modifiers = []
-            while not self._at_eol() and self._at(TT.IDENT):
-                mod_u = self._cur().value.upper()
-                if mod_u in _DRC_MODIFIERS or mod_u in ('EVEN', 'ODD',
-                        'PRIMARY', 'MULTI', 'NOT', 'MEASURE', 'ALL',
-                        'ANNOTATE', 'NODAL', 'GOOD'):
-                    modifiers.append(self._advance().value)
-                else:
-                    break
+            modifiers = self._consume_modifiers(_CONSTRAINT_MODS)
             return ast.ConstrainedExpr(expr=left, constraints=constraints,
-                                       modifiers=modifiers, **loc)
+                                       modifiers=modifiers, line=t.line, col=t.col)
 
         # Arithmetic infix: ^, *, /, -, +
-        if t.type == TT.CARET:
+        if t.type is _CARET:
             self._advance()
             right = self._parse_layer_expr(45)
-            return ast.BinaryOp(op='^', left=left, right=right, **loc)
-        if t.type == TT.STAR:
+            return ast.BinaryOp(op='^', left=left, right=right, line=t.line, col=t.col)
+        if t.type is _STAR:
             self._advance()
             right = self._parse_layer_expr(40)
-            return ast.BinaryOp(op='*', left=left, right=right, **loc)
-        if t.type == TT.SLASH:
+            return ast.BinaryOp(op='*', left=left, right=right, line=t.line, col=t.col)
+        if t.type is _SLASH:
             self._advance()
             right = self._parse_layer_expr(40)
-            return ast.BinaryOp(op='/', left=left, right=right, **loc)
-        if t.type == TT.MINUS:
+            return ast.BinaryOp(op='/', left=left, right=right, line=t.line, col=t.col)
+        if t.type is _MINUS:
             self._advance()
             right = self._parse_layer_expr(38)
-            return ast.BinaryOp(op='-', left=left, right=right, **loc)
-        if t.type == TT.PLUS:
+            return ast.BinaryOp(op='-', left=left, right=right, line=t.line, col=t.col)
+        if t.type is _PLUS:
             self._advance()
             right = self._parse_layer_expr(36)
-            return ast.BinaryOp(op='+', left=left, right=right, **loc)
+            return ast.BinaryOp(op='+', left=left, right=right, line=t.line, col=t.col)
 
-        if t.type == TT.IDENT:
-            upper = t.value.upper()
-            handler_name = self._LED_DISPATCH.get(upper)
-            if handler_name:
-                return getattr(self, handler_name)(left, t, loc)
+        if t.type is _IDENT:
+            upper = t.upper
+            handler = self._led_funcs.get(upper)
+            if handler is not None:
+                return handler(self, left, t)
 
         # Shouldn't reach here, but advance to avoid infinite loop
-        self.warnings.append(
-            f"L{t.line}:{t.col}: Unexpected token {t.type.name} ({t.value!r}) "
+        self._warn(t,
+            f"Unexpected token {t.type.name} ({t.value!r}) "
             f"in layer expression LED (infix position)")
         self._advance()
         return left
@@ -967,479 +1057,396 @@ class ExpressionMixin:
     # LED handler methods (dispatched from _LED_DISPATCH)
     # ------------------------------------------------------------------
 
-    def _led_coin_in_edge(self, left, t, loc):
+    def _led_coin_in_edge(self, left, t):
         """IN EDGE / COIN EDGE / COIN INSIDE EDGE / COIN OUTSIDE EDGE
         COINCIDENT EDGE / COINCIDENT INSIDE EDGE / COINCIDENT OUTSIDE EDGE"""
-        upper = t.value.upper()
         self._advance()  # IN or COIN or COINCIDENT
-        middle = ''
-        if self._at(TT.IDENT) and self._cur().value.upper() in ('INSIDE', 'OUTSIDE'):
-            middle = ' ' + self._advance().value.upper()
-        self._advance()  # EDGE
-        op = upper + middle + ' EDGE'
-        if self._at_eol() and self._block_depth > 0:
-            self._consume_eol()
-            self._skip_newlines()
-        right = self._parse_layer_expr(30)
-        result = ast.BinaryOp(op=op, left=left, right=right, **loc)
-        return self._maybe_trailing_modifiers(result, loc)
+        # _bp_coin_edge only lets us here when an EDGE suffix follows
+        return self._led_spatial_edge(left, t, t.upper + self._edge_suffix())
 
-    def _led_with(self, left, t, loc):
+    def _led_with(self, left, t):
         """WITH -> parse_with_op"""
         return self._parse_with_op(left)
 
-    def _led_touch(self, left, t, loc):
+    def _led_touch(self, left, t):
         """TOUCH / TOUCH EDGE / TOUCH INSIDE EDGE / TOUCH OUTSIDE EDGE"""
         self._advance()
-        if self._at(TT.IDENT) and self._cur().value.upper() in ('INSIDE', 'OUTSIDE'):
-            middle = self._cur().value.upper()
-            nxt = self._peek()
-            if nxt.type == TT.IDENT and nxt.value.upper() == 'EDGE':
-                self._advance()  # INSIDE/OUTSIDE
-                self._advance()  # EDGE
-                if self._at_eol() and self._block_depth > 0:
-                    self._consume_eol()
-                    self._skip_newlines()
-                right = self._parse_layer_expr(30)
-                result = ast.BinaryOp(op='TOUCH ' + middle + ' EDGE',
-                                    left=left, right=right, **loc)
-                return self._maybe_trailing_modifiers(result, loc)
-        if self._at_val('EDGE'):
-            self._advance()
-            if self._at_eol() and self._block_depth > 0:
-                self._consume_eol()
-                self._skip_newlines()
-            right = self._parse_layer_expr(30)
-            result = ast.BinaryOp(op='TOUCH EDGE', left=left,
-                                right=right, **loc)
-            return self._maybe_trailing_modifiers(result, loc)
+        suffix = self._edge_suffix()
+        if suffix:
+            return self._led_spatial_edge(left, t, 'TOUCH' + suffix)
         right = self._parse_layer_expr(30)
         result = ast.BinaryOp(op='TOUCH', left=left,
-                            right=right, **loc)
-        return self._maybe_trailing_modifiers(result, loc)
+                            right=right, line=t.line, col=t.col)
+        return self._maybe_trailing_modifiers(result, t)
 
-    def _led_holes_donut(self, left, t, loc):
+    def _edge_suffix(self) -> str:
+        """Consume an [INSIDE|OUTSIDE] EDGE suffix; return it, or '' if absent."""
+        word = self._cur().upper
+        if word == 'EDGE':
+            self._advance()
+            return ' EDGE'
+        if word in ('INSIDE', 'OUTSIDE') and self._peek1().upper == 'EDGE':
+            self._advance()  # INSIDE/OUTSIDE
+            self._advance()  # EDGE
+            return ' ' + word + ' EDGE'
+        return ''
+
+    def _led_spatial_edge(self, left, t, op, bp=30):
+        """Right operand and trailing modifiers of a multi-word spatial op
+        (TOUCH EDGE, NOT INSIDE EDGE, OR EDGE, ...).  Inside a block the
+        right operand may start on the next line."""
+        self._skip_eol_in_block()
+        right = self._parse_layer_expr(bp)
+        result = ast.BinaryOp(op=op, left=left, right=right,
+                              line=t.line, col=t.col)
+        return self._maybe_trailing_modifiers(result, t)
+
+    def _led_holes_donut(self, left, t):
         """HOLES / DONUT as postfix: layer HOLES -> HOLES layer"""
-        upper = t.value.upper()
+        upper = t.upper
         self._advance()
-        modifiers = []
-        while not self._at_eol() and self._at(TT.IDENT):
-            mod_u = self._cur().value.upper()
-            if mod_u in _DRC_MODIFIERS:
-                modifiers.append(self._advance().value)
-            else:
-                break
+        modifiers = self._consume_modifiers(_DRC_MODIFIERS)
         return ast.DRCOp(op=upper, operands=[left],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=t.line, col=t.col)
 
-    def _led_measurement(self, left, t, loc):
+    def _led_measurement(self, left, t):
         """ANGLE/LENGTH/AREA/VERTEX as infix measurement: layer ANGLE == 45"""
-        upper = t.value.upper()
+        upper = t.upper
         self._advance()  # ANGLE/LENGTH/AREA/VERTEX
         constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                                TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
-        modifiers = []
-        while not self._at_eol() and self._at(TT.IDENT):
-            mod_u = self._cur().value.upper()
-            if mod_u in _DRC_MODIFIERS or mod_u in (
-                    'SINGULAR', 'ALSO', 'EVEN', 'ODD',
-                    'PRIMARY', 'MULTI', 'NODAL', 'GOOD'):
-                modifiers.append(self._advance().value)
-            else:
-                break
+        modifiers = self._consume_modifiers(_MEASUREMENT_MODS)
         return ast.DRCOp(op=upper, operands=[left],
-                         constraints=constraints, modifiers=modifiers, **loc)
+                         constraints=constraints, modifiers=modifiers, line=t.line, col=t.col)
 
-    def _led_convex(self, left, t, loc):
+    def _led_convex(self, left, t):
         """CONVEX EDGE as infix: layer CONVEX EDGE == 2"""
-        self._advance()  # CONVEX
+        current, advance = self._cur, self._advance
+        advance()  # CONVEX
         if self._at_val('EDGE'):
-            self._advance()  # EDGE
+            advance()  # EDGE
         operands = [left]
         # Consume optional modifiers like ANGLE1, ANGLE2, WITH LENGTH
         modifiers = []
         constraints = []
-        while not self._at_eol() and not self._at(TT.RPAREN):
-            if self._at(TT.IDENT):
-                mod_u = self._cur().value.upper()
+        while True:
+            cur = current()
+            if cur.type is _IDENT:
+                mod_u = cur.upper
                 if mod_u in ('ANGLE1', 'ANGLE2'):
-                    modifiers.append(self._advance().value)
-                    if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                                            TT.EQEQ, TT.BANGEQ):
+                    modifiers.append(advance().value)
+                    if current().type in _CMP_TYPES:
                         constraints.extend(self._parse_constraints())
                 elif mod_u == 'WITH':
                     # WITH LENGTH <= val etc.
-                    modifiers.append(self._advance().value)
-                    while not self._at_eol() and not self._at(TT.RPAREN):
-                        if self._at(TT.IDENT):
-                            modifiers.append(self._advance().value)
-                        elif self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                                                  TT.EQEQ, TT.BANGEQ):
+                    modifiers.append(advance().value)
+                    while True:
+                        cur = current()
+                        if cur.type is _IDENT:
+                            modifiers.append(advance().value)
+                        elif cur.type in _CMP_TYPES:
                             constraints.extend(self._parse_constraints())
                             break
                         else:
                             break
                 elif mod_u in _DRC_MODIFIERS:
-                    modifiers.append(self._advance().value)
+                    modifiers.append(advance().value)
                 else:
                     break
-            elif self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                                      TT.EQEQ, TT.BANGEQ):
+            elif cur.type in _CMP_TYPES:
                 constraints.extend(self._parse_constraints())
             else:
+                # end of line, ')' or anything else ends the modifiers
                 break
         return ast.DRCOp(op='CONVEX EDGE', operands=operands,
-                         constraints=constraints, modifiers=modifiers, **loc)
+                         constraints=constraints, modifiers=modifiers, line=t.line, col=t.col)
 
-    def _led_connected(self, left, t, loc):
+    def _led_connected(self, left, t):
         """CONNECTED as postfix modifier: layer1 AND layer2 CONNECTED"""
         self._advance()  # CONNECTED
         return ast.DRCOp(op='CONNECTED', operands=[left],
-                         constraints=[], modifiers=[], **loc)
+                         constraints=[], modifiers=[], line=t.line, col=t.col)
 
-    def _led_rectangle(self, left, t, loc):
+    def _led_rectangle(self, left, t):
         """RECTANGLE as postfix: layer RECTANGLE == val BY == val"""
         self._advance()  # RECTANGLE
         constraints = []
         modifiers = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                                TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         # BY == value (second dimension constraint)
         if self._at_val('BY'):
             self._advance()  # BY
-            constraints.append(ast.Constraint(op='BY', value=None, **loc))
-            if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                                    TT.EQEQ, TT.BANGEQ):
+            constraints.append(ast.Constraint(op='BY', value=None, line=t.line, col=t.col))
+            if self._cur().type in _CMP_TYPES:
                 constraints.extend(self._parse_constraints())
-        while not self._at_eol() and self._at(TT.IDENT):
-            mod_u = self._cur().value.upper()
-            if mod_u in _DRC_MODIFIERS or mod_u in ('ASPECT',):
+        while True:
+            mod_u = self._cur().upper  # None unless IDENT
+            if mod_u in _RECTANGLE_MODS:
                 modifiers.append(self._advance().value)
                 # ASPECT may be followed by a constraint: ASPECT == 1
-                if mod_u == 'ASPECT' and not self._at_eol() and \
-                        self._cur().type in (TT.LT, TT.GT_OP, TT.LE,
-                                             TT.GE, TT.EQEQ, TT.BANGEQ):
+                if mod_u == 'ASPECT' and self._cur().type in _CMP_TYPES:
                     constraints.extend(self._parse_constraints())
             else:
                 break
         return ast.DRCOp(op='RECTANGLE', operands=[left],
-                         constraints=constraints, modifiers=modifiers, **loc)
+                         constraints=constraints, modifiers=modifiers, line=t.line, col=t.col)
 
-    def _led_expand(self, left, t, loc):
+    def _led_expand(self, left, t):
         """EXPAND EDGE as postfix: (expr) EXPAND EDGE INSIDE BY val"""
-        self._advance()  # EXPAND
-        self._advance()  # EDGE
+        # _bp_if_edge_follows checked that EXPAND EDGE are both here
+        self.pos += 2
         modifiers = []
-        while not self._at_eol():
-            if self._at(TT.IDENT):
-                upper_cur = self._cur().value.upper()
-                if upper_cur in ('INSIDE', 'OUTSIDE'):
-                    modifiers.append(self._advance().value)
-                    if self._at_val('BY'):
-                        modifiers.append(self._advance().value)
-                        # bp=35 allows arithmetic but blocks OUTSIDE(30)
-                        if not self._at_eol():
-                            modifiers.append(self._parse_layer_expr(35))
-                else:
+        while True:
+            tok = self._cur()
+            if tok.type is _IDENT:
+                self.pos += 1
+                modifiers.append(tok.value)
+                if tok.upper in ('INSIDE', 'OUTSIDE') and self._at_val('BY'):
                     modifiers.append(self._advance().value)
-            elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                modifiers.append(str(self._advance().value))
+                    # bp=35 allows arithmetic but blocks OUTSIDE(30)
+                    if not self._at_eol():
+                        modifiers.append(self._parse_layer_expr(35))
+            elif tok.type is _INTEGER or tok.type is _FLOAT:
+                self.pos += 1
+                modifiers.append(tok.raw)
             else:
                 break
         return ast.DRCOp(op='EXPAND EDGE', operands=[left],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=t.line, col=t.col)
 
-    def _led_net(self, left, t, loc):
+    def _led_net(self, left, t):
         """NET as infix: layer NET INTERACT/AREA RATIO layer > value"""
-        self._advance()  # NET
+        current, advance = self._cur, self._advance
+        advance()  # NET
         # Build compound op name: NET INTERACT, NET AREA, NET AREA RATIO
         op_name = 'NET'
-        while self._at(TT.IDENT) and not self._at_eol():
-            nxt_u = self._cur().value.upper()
-            if nxt_u in ('INTERACT', 'AREA', 'RATIO'):
-                op_name += ' ' + self._advance().value.upper()
-            else:
-                break
+        while current().upper in _NET_OP_WORDS:
+            op_name += ' ' + advance().upper
         operands = [left]
-        while self._at(TT.IDENT) and not self._at_eol():
-            upper_cur = self._cur().value.upper()
-            if upper_cur in ('ACCUMULATE', 'RDB', 'PRINT', 'BY'):
+        parse_operand = self._parse_layer_expr
+        while True:
+            tok = current()
+            if tok.type is not _IDENT or tok.upper in _NET_STOP:
                 break
-            operands.append(self._parse_layer_expr(50))
+            operands.append(parse_operand(50))
         constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
+        if self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         modifiers = []
         self._parse_drc_modifiers(modifiers)
         self._parse_drc_multiline_continuation(modifiers)
         return ast.DRCOp(op=op_name, operands=operands,
-                         constraints=constraints, modifiers=modifiers, **loc)
+                         constraints=constraints, modifiers=modifiers, line=t.line, col=t.col)
 
-    def _led_size(self, left, t, loc):
+    def _led_size(self, left, t):
         """SIZE as infix: (expr) SIZE BY value modifiers"""
         # Reuse _parse_size_op but inject left as the operand
-        self._advance()  # SIZE
+        current, advance = self._cur, self._advance
+        parse_value = self._parse_layer_expr
+        advance()  # SIZE
         modifiers = []
         if self._at_val('BY'):
-            self._advance()
-            by_expr = self._parse_layer_expr(35)
+            advance()
+            by_expr = parse_value(35)
             modifiers.append(('BY', by_expr))
-        while not self._at_eol():
-            if self._at(TT.IDENT):
-                mod_u = self._cur().value.upper()
-                if mod_u in ('UNDEROVER', 'OVERUNDER', 'INSIDE', 'OUTSIDE',
-                             'GROW', 'SHRINK'):
-                    modifiers.append(self._advance().value)
-                elif mod_u in ('OF', 'STEP', 'LAYER', 'TRUNCATE'):
-                    modifiers.append(self._advance().value)
+        while True:
+            tok = current()
+            tt = tok.type
+            if tt is _IDENT:
+                mod_u = tok.upper
+                if mod_u in _SIZE_MODS:
+                    modifiers.append(advance().value)
+                elif mod_u in _SIZE_SUB_KEYWORDS:
+                    modifiers.append(advance().value)
                     if not self._at_eol():
-                        modifiers.append(self._parse_layer_expr(50))
+                        modifiers.append(parse_value(50))
                 else:
                     break
-            elif self._at(TT.INTEGER) or self._at(TT.FLOAT):
-                modifiers.append(self._parse_layer_expr(50))
-            elif self._at(TT.LPAREN):
-                modifiers.append(self._parse_layer_expr(50))
-            elif self._at(TT.STAR):
-                self._advance()
+            elif tt is _INTEGER or tt is _FLOAT or tt is _LPAREN:
+                modifiers.append(parse_value(50))
+            elif tt is _STAR:
+                advance()
                 modifiers.append('*')
             else:
                 break
         return ast.DRCOp(op='SIZE', operands=[left],
-                         constraints=[], modifiers=modifiers, **loc)
+                         constraints=[], modifiers=modifiers, line=t.line, col=t.col)
 
-    def _led_binary_op(self, left, t, loc):
+    def _led_binary_op(self, left, t):
         """Standard binary ops (AND, OR, NOT, INSIDE, OUTSIDE, etc.)"""
-        upper = t.value.upper()
+        upper = t.upper
         bp = _LAYER_BP.get(upper, 0)
         if not bp:
             return None
-        self._advance()
+        self.pos += 1  # t is the current token
+        # Word following the operator (None unless it is an IDENT)
+        nxt_u = self._cur().upper
         # INSIDE EDGE / OUTSIDE EDGE / TOUCH EDGE as two-word binary ops
-        if upper in ('INSIDE', 'OUTSIDE', 'OUT', 'TOUCH') and self._at(TT.IDENT) and self._cur().value.upper() == 'EDGE':
+        if upper in ('INSIDE', 'OUTSIDE', 'OUT', 'TOUCH') and nxt_u == 'EDGE':
             self._advance()  # EDGE
-            if self._at_eol() and self._block_depth > 0:
-                self._consume_eol()
-                self._skip_newlines()
-            right = self._parse_layer_expr(bp)
-            result = ast.BinaryOp(op=upper + ' EDGE', left=left,
-                                right=right, **loc)
-            return self._maybe_trailing_modifiers(result, loc)
+            return self._led_spatial_edge(left, t, upper + ' EDGE', bp)
         # INSIDE OF [LAYER] expr as compound binary op
-        if upper == 'INSIDE' and self._at(TT.IDENT) and self._cur().value.upper() == 'OF':
+        if upper == 'INSIDE' and nxt_u == 'OF':
             self._advance()  # OF
-            if self._at(TT.IDENT) and self._cur().value.upper() == 'LAYER':
+            if self._at(_IDENT) and self._cur().upper == 'LAYER':
                 self._advance()  # LAYER
             right = self._parse_layer_expr(bp)
             return ast.BinaryOp(op='INSIDE OF', left=left,
-                                right=right, **loc)
+                                right=right, line=t.line, col=t.col)
         # OR EDGE as two-word binary op
-        if upper == 'OR' and self._at(TT.IDENT) and self._cur().value.upper() == 'EDGE':
+        if upper == 'OR' and nxt_u == 'EDGE':
             self._advance()  # EDGE
             # Right operand may be on the next line (e.g. OR EDGE\n  (EXT ...))
-            if self._at_eol() and self._block_depth > 0:
-                self._consume_eol()
-                self._skip_newlines()
-            right = self._parse_layer_expr(bp)
-            result = ast.BinaryOp(op='OR EDGE', left=left,
-                                right=right, **loc)
-            return self._maybe_trailing_modifiers(result, loc)
-        # NOT TOUCH / NOT TOUCH EDGE as compound binary ops
-        if upper == 'NOT' and self._at(TT.IDENT) and self._cur().value.upper() == 'TOUCH':
-            self._advance()  # TOUCH
-            op_name = 'NOT TOUCH'
-            if self._at(TT.IDENT) and self._cur().value.upper() == 'EDGE':
-                self._advance()  # EDGE
-                op_name = 'NOT TOUCH EDGE'
-            if self._at_eol() and self._block_depth > 0:
-                self._consume_eol()
-                self._skip_newlines()
-            right = self._parse_layer_expr(bp)
-            result = ast.BinaryOp(op=op_name, left=left,
-                                right=right, **loc)
-            return self._maybe_trailing_modifiers(result, loc)
-        # NOT INSIDE / NOT INTERACT / NOT ENCLOSE / NOT CUT [EDGE] as compound binary ops
-        if upper == 'NOT' and self._at(TT.IDENT) and self._cur().value.upper() in (
-                'INSIDE', 'INTERACT', 'ENCLOSE', 'CUT'):
-            not_rhs = self._advance().value.upper()
-            op_name = 'NOT ' + not_rhs
+            return self._led_spatial_edge(left, t, 'OR EDGE', bp)
+        # NOT TOUCH / NOT INSIDE / NOT IN ... [EDGE] as compound binary ops
+        if upper == 'NOT' and nxt_u in _NOT_RHS:
+            self._advance()  # TOUCH/INSIDE/INTERACT/ENCLOSE/CUT/IN/OUT/OUTSIDE
+            op_name = 'NOT ' + nxt_u
             # NOT ENCLOSE RECTANGLE: compound DRC op (same pattern as ENCLOSE RECTANGLE)
-            if not_rhs == 'ENCLOSE' and self._at(TT.IDENT) and self._cur().value.upper() == 'RECTANGLE':
+            if nxt_u == 'ENCLOSE' and self._at_val('RECTANGLE'):
                 self._advance()  # RECTANGLE
-                operands = [left]
-                while not self._at_eol():
-                    t2 = self._cur()
-                    if t2.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-                        break
-                    if t2.type == TT.IDENT and t2.value.upper() in _DRC_MODIFIERS:
-                        break
-                    if t2.type == TT.IDENT and t2.value.upper() in ('ASPECT', 'BY'):
-                        break
-                    if t2.type in (TT.IDENT, TT.INTEGER, TT.FLOAT, TT.LPAREN, TT.LBRACKET):
-                        operands.append(self._parse_layer_expr(35))
-                    else:
-                        break
-                constraints = []
-                if not self._at_eol() and self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-                    constraints = self._parse_constraints()
-                modifiers = []
-                while not self._at_eol():
-                    t2 = self._cur()
-                    if t2.type == TT.IDENT:
-                        modifiers.append(self._advance().value)
-                    elif t2.type in (TT.INTEGER, TT.FLOAT):
-                        modifiers.append(str(self._advance().value))
-                    else:
-                        break
-                return ast.DRCOp(op='NOT ENCLOSE RECTANGLE', operands=operands,
-                                 constraints=constraints, modifiers=modifiers, **loc)
-            # NOT INSIDE EDGE / NOT ENCLOSE EDGE etc.
-            if self._at(TT.IDENT) and self._cur().value.upper() == 'EDGE':
-                self._advance()
-                op_name += ' EDGE'
-            if self._at_eol() and self._block_depth > 0:
-                self._consume_eol()
-                self._skip_newlines()
-            right = self._parse_layer_expr(bp)
-            result = ast.BinaryOp(op=op_name, left=left, right=right, **loc)
-            return self._maybe_trailing_modifiers(result, loc)
-        # NOT IN / NOT OUT / NOT OUTSIDE [EDGE] as compound binary ops
-        if upper == 'NOT' and self._at(TT.IDENT) and self._cur().value.upper() in ('IN', 'OUT', 'OUTSIDE'):
-            not_rhs = self._advance().value.upper()  # IN/OUT/OUTSIDE
-            op_name = 'NOT ' + not_rhs
-            # NOT OUT EDGE / NOT OUTSIDE EDGE
-            if not_rhs in ('OUT', 'OUTSIDE') and \
-                    self._at(TT.IDENT) and self._cur().value.upper() == 'EDGE':
+                return self._parse_enclose_rectangle(
+                    left, 'NOT ENCLOSE RECTANGLE', t)
+            # NOT INSIDE EDGE / NOT TOUCH EDGE etc.
+            if nxt_u in _NOT_EDGE_RHS and self._at_val('EDGE'):
                 self._advance()  # EDGE
                 op_name += ' EDGE'
-            if self._at_eol() and self._block_depth > 0:
-                self._consume_eol()
-                self._skip_newlines()
-            right = self._parse_layer_expr(bp)
-            result = ast.BinaryOp(op=op_name, left=left,
-                                right=right, **loc)
-            return self._maybe_trailing_modifiers(result, loc)
+            return self._led_spatial_edge(left, t, op_name, bp)
         # ENCLOSE RECTANGLE: compound DRC op
-        if upper == 'ENCLOSE' and self._at(TT.IDENT) and self._cur().value.upper() == 'RECTANGLE':
+        if upper == 'ENCLOSE' and nxt_u == 'RECTANGLE':
             self._advance()  # RECTANGLE
-            operands = [left]
-            while not self._at_eol():
-                t = self._cur()
-                if t.type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-                    break
-                if t.type == TT.IDENT and t.value.upper() in _DRC_MODIFIERS:
-                    break
-                if t.type == TT.IDENT and t.value.upper() in ('ASPECT', 'BY'):
-                    break
-                if t.type in (TT.IDENT, TT.INTEGER, TT.FLOAT, TT.LPAREN, TT.LBRACKET):
-                    # bp=35 allows arithmetic (+/-) but blocks spatial ops
-                    operands.append(self._parse_layer_expr(35))
-                else:
-                    break
-            constraints = []
-            if not self._at_eol() and self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ):
-                constraints = self._parse_constraints()
-            modifiers = []
-            while not self._at_eol():
-                t = self._cur()
-                if t.type == TT.IDENT:
-                    modifiers.append(self._advance().value)
-                elif t.type in (TT.INTEGER, TT.FLOAT):
-                    modifiers.append(str(self._advance().value))
-                else:
-                    break
-            return ast.DRCOp(op='ENCLOSE RECTANGLE', operands=operands,
-                             constraints=constraints, modifiers=modifiers, **loc)
+            return self._parse_enclose_rectangle(left, 'ENCLOSE RECTANGLE', t)
         # Infix OR/AND: right operand may be on the next line
-        if upper in ('OR', 'AND') and self._at_eol() and self._block_depth > 0:
-            self._consume_eol()
-            self._skip_newlines()
+        if upper in ('OR', 'AND'):
+            self._skip_eol_in_block()
         right = self._parse_layer_expr(bp)
         result = ast.BinaryOp(op=upper, left=left,
-                            right=right, **loc)
+                            right=right, line=t.line, col=t.col)
         # Infix OR/AND: chain additional operands on the same line
         # e.g. A OR B C D -> OR(OR(OR(A,B),C),D)
         if upper in ('OR', 'AND'):
-            while not self._at_eol() and not self._at(TT.RPAREN) and \
-                    not self._at(TT.RBRACKET) and self._can_start_layer_expr():
+            while not self._at_eol() and not self._at(_RPAREN) and \
+                    not self._at(_RBRACKET) and self._can_start_layer_expr():
                 extra = self._parse_layer_expr(bp)
                 result = ast.BinaryOp(op=upper, left=result,
-                                    right=extra, **loc)
+                                    right=extra, line=t.line, col=t.col)
         # Spatial ops can have trailing constraints + modifiers
         if upper in ('INTERACT', 'INSIDE', 'OUTSIDE', 'OUT',
                      'ENCLOSE', 'TOUCH', 'CUT'):
-            return self._maybe_trailing_modifiers(result, loc)
+            return self._maybe_trailing_modifiers(result, t)
         return result
 
-    # ------------------------------------------------------------------
-    # Trailing modifiers after compound binary ops (ENDPOINT ONLY, etc.)
-    # ------------------------------------------------------------------
-    def _maybe_trailing_modifiers(self, result, loc):
-        """Consume optional trailing constraints + modifiers after a binary op."""
+    def _parse_enclose_rectangle(self, left, op, t):
+        """[NOT] ENCLOSE RECTANGLE operands, constraints and modifiers."""
+        operands = [left]
+        while not self._at_eol():
+            tok = self._cur()
+            if tok.type in _CMP_TYPES:
+                break
+            if tok.type is _IDENT and tok.upper in _DRC_MODIFIERS:
+                break
+            if tok.type is _IDENT and tok.upper in ('ASPECT', 'BY'):
+                break
+            if tok.type in _RECT_OPERAND_TYPES:
+                # bp=35 allows arithmetic (+/-) but blocks spatial ops
+                operands.append(self._parse_layer_expr(35))
+            else:
+                break
         constraints = []
-        if self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                                TT.EQEQ, TT.BANGEQ):
+        if not self._at_eol() and self._cur().type in _CMP_TYPES:
             constraints = self._parse_constraints()
         modifiers = []
-        while not self._at_eol() and self._at(TT.IDENT):
-            mod_u = self._cur().value.upper()
-            if mod_u in _DRC_MODIFIERS or mod_u in (
-                    'SINGULAR', 'ALSO', 'EVEN', 'ODD',
-                    'PRIMARY', 'MULTI', 'NODAL', 'GOOD',
-                    'CONNECTED', 'NOT', 'MEASURE', 'ALL',
-                    'ANNOTATE', 'ENDPOINT', 'ONLY'):
+        while not self._at_eol():
+            tok = self._cur()
+            if tok.type is _IDENT:
                 modifiers.append(self._advance().value)
+            elif tok.type in _NUMBER_TYPES:
+                modifiers.append(self._advance().raw)
             else:
                 break
+        return ast.DRCOp(op=op, operands=operands,
+                         constraints=constraints, modifiers=modifiers, line=t.line, col=t.col)
+
+    def _consume_modifiers(self, words) -> list:
+        """Consume a run of keywords from the set *words*; return their spellings."""
+        modifiers = []
+        tokens = self.tokens
+        pos = self.pos
+        length = self.length
+        while pos < length:
+            t = tokens[pos]
+            # .upper is None for non-IDENT tokens, including NEWLINE and EOF
+            if t.upper not in words:
+                break
+            modifiers.append(t.value)
+            pos += 1
+        self.pos = pos
+        return modifiers
+
+    # ------------------------------------------------------------------
+    # Trailing modifiers after compound binary ops (ENDPOINT ONLY, etc.)
+    # ------------------------------------------------------------------
+    def _maybe_trailing_modifiers(self, result, t):
+        """Consume optional trailing constraints + modifiers after a binary op."""
+        constraints = []
+        if self._cur().type in _CMP_TYPES:
+            constraints = self._parse_constraints()
+        modifiers = self._consume_modifiers(_TRAILING_MODS)
         if constraints or modifiers:
             return ast.ConstrainedExpr(expr=result,
                                        constraints=constraints,
-                                       modifiers=modifiers, **loc)
+                                       modifiers=modifiers, line=t.line, col=t.col)
         return result
 
     # ------------------------------------------------------------------
     # Constraints: chain of < > <= >= == != with values
     # ------------------------------------------------------------------
-    def _parse_constraints(self):
+    def _parse_constraints(self) -> list:
         constraints = []
-        while self._cur().type in (TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                                    TT.EQEQ, TT.BANGEQ):
-            loc = self._loc()
-            op = self._advance().value
+        tokens = self.tokens
+        # Tokens already inspected are stepped over with pos += 1 rather
+        # than _advance(): each one is a real token, never the EOF stand-in.
+        # The stream is EOF-padded, so reads need no bounds check.  The
+        # local position is written back before any call that reads it.
+        pos = self.pos
+        while True:
+            t = tokens[pos]
+            if t.type not in _CMP_TYPES:
+                break
+            pos += 1  # operator
             val = None
-            if self._at(TT.INTEGER):
-                val = self._advance().value
-            elif self._at(TT.FLOAT):
-                val = self._advance().value
-            elif self._at(TT.MINUS):
-                self._advance()
-                if self._at(TT.INTEGER):
-                    val = -self._advance().value
-                elif self._at(TT.FLOAT):
-                    val = -self._advance().value
-            elif self._at(TT.IDENT):
-                val = self._advance().value
-            elif self._at(TT.LPAREN):
+            v = tokens[pos]
+            vt = v.type
+            if vt in _CONSTRAINT_VALUE_TYPES:
+                pos += 1
+                val = v.value
+            elif vt is _MINUS:
+                pos += 1
+                if tokens[pos].type in _NUMBER_TYPES:
+                    val = -tokens[pos].value
+                    pos += 1
+            elif vt is _LPAREN:
                 # Parenthesized expression as constraint value — parse at bp=10
                 # to avoid consuming the next chained constraint (bp=5 for comparisons)
-                self._advance()  # (
+                self.pos = pos + 1  # (
                 val = self._parse_layer_expr(0)
-                if self._at(TT.RPAREN):
-                    self._advance()  # )
-            constraints.append(ast.Constraint(op=op, value=val, **loc))
+                pos = self.pos
+                if tokens[pos].type is _RPAREN:
+                    pos += 1  # )
+            constraints.append(ast.Constraint(op=t.value, value=val,
+                                              line=t.line, col=t.col))
+        self.pos = pos
         return constraints
 
     # ------------------------------------------------------------------
     # Bracket expression: [layer_expr]
     # ------------------------------------------------------------------
     def _parse_bracket_expr(self):
-        loc = self._loc()
         self._advance()  # [
         expr = self._parse_layer_expr(0)
-        if self._at(TT.RBRACKET):
+        if self._at(_RBRACKET):
             self._advance()
         return expr
 
@@ -1450,21 +1457,34 @@ class ExpressionMixin:
         Used for multi-line bracket expressions in DRC ops where the Pratt
         parser cannot handle the complex arithmetic spanning multiple lines.
         """
-        self._advance()  # [
+        # The content is rebuilt from token spellings (normalizing spacing
+        # and dropping comments), so walk the token list by index rather
+        # than through _cur()/_advance() for every token.
+        tokens = self.tokens
+        length = self.length
+        pos = self.pos
+        if pos < length:
+            pos += 1  # [
         depth = 1
         parts = []
-        while depth > 0 and not self._at(TT.EOF):
-            t = self._cur()
-            if t.type == TT.LBRACKET:
+        append = parts.append
+        while pos < length:
+            t = tokens[pos]
+            tt = t.type
+            if tt is _EOF:
+                break
+            pos += 1
+            if tt is _LBRACKET:
                 depth += 1
-                parts.append('[')
-            elif t.type == TT.RBRACKET:
+                append('[')
+            elif tt is _RBRACKET:
                 depth -= 1
-                if depth > 0:
-                    parts.append(']')
-            elif t.type == TT.NEWLINE:
-                parts.append(' ')
+                if depth == 0:
+                    break
+                append(']')
+            elif tt is _NEWLINE:
+                append(' ')
             else:
-                parts.append(str(t.value))
-            self._advance()
+                append(t.raw)
+        self.pos = pos
         return ' '.join(parts).strip()
@@ -161,36 +161,28 @@ _KEYWORD_REGISTRY = {
 # Derived frozensets (backward-compatible with existing import sites)
 # ---------------------------------------------------------------------------
 
-_DIRECTIVE_HEADS = frozenset(
-    k for k, roles in _KEYWORD_REGISTRY.items() if 'directive_head' in roles
-)
-
-_BINARY_OPS = frozenset(
-    k for k, roles in _KEYWORD_REGISTRY.items() if 'binary_op' in roles
-)
-
-_UNARY_OPS = frozenset(
-    k for k, roles in _KEYWORD_REGISTRY.items() if 'unary_op' in roles
-)
-
-_DRC_OPS = frozenset(
-    k for k, roles in _KEYWORD_REGISTRY.items() if 'drc_op' in roles
-)
-
-_DRC_MODIFIERS = frozenset(
-    k for k, roles in _KEYWORD_REGISTRY.items() if 'drc_modifier' in roles
-)
-
-_EXPR_STARTERS = frozenset(
-    k for k, roles in _KEYWORD_REGISTRY.items() if 'expr_starter' in roles
-)
-
+# One pass over the registry sorts every keyword into its role lists.
 # _SVRF_KEYWORDS is the union of all categorized keywords plus those
 # tagged explicitly as 'svrf_keyword'.
-_SVRF_KEYWORDS = (
-    _DIRECTIVE_HEADS | _DRC_MODIFIERS | _EXPR_STARTERS
-    | frozenset(k for k, roles in _KEYWORD_REGISTRY.items() if 'svrf_keyword' in roles)
-)
+_svrf_roles = {'directive_head', 'drc_modifier', 'expr_starter', 'svrf_keyword'}
+_role_names = {role: [] for role in (
+    'directive_head', 'binary_op', 'unary_op', 'drc_op',
+    'drc_modifier', 'expr_starter', 'svrf_keyword')}
+_svrf_names = []
+for _name, _roles in _KEYWORD_REGISTRY.items():
+    for _role in _roles:
+        _role_names[_role].append(_name)
+    if not _svrf_roles.isdisjoint(_roles):
+        _svrf_names.append(_name)
+
+_DIRECTIVE_HEADS = frozenset(_role_names['directive_head'])
+_BINARY_OPS = frozenset(_role_names['binary_op'])
+_UNARY_OPS = frozenset(_role_names['unary_op'])
+_DRC_OPS = frozenset(_role_names['drc_op'])
+_DRC_MODIFIERS = frozenset(_role_names['drc_modifier'])
+_EXPR_STARTERS = frozenset(_role_names['expr_starter'])
+_SVRF_KEYWORDS = frozenset(_svrf_names)
+del _svrf_roles, _role_names, _svrf_names, _name, _roles, _role
 
 # Binding powers for layer binary operators (not derived from registry
 # because the values are numeric, not role tags).
@@ -1,8 +1,12 @@
 """Lexer for SVRF source files. Converts raw text into a token stream."""
 
-from .tokens import TokenType, Token
+import hashlib
+import re
+import sys
 
-TT = TokenType
+from .tokens import Token, TT
+
+_IDENT, _INTEGER, _FLOAT = TT.IDENT, TT.INTEGER, TT.FLOAT
 
 _PP_MAP = {
     'DEFINE': TT.PP_DEFINE,
@@ -17,6 +21,94 @@ _PP_MAP = {
     'UNDEFINE': TT.PP_UNDEFINE,
 }
 
+# Rest of an identifier: word characters (str.isalnum() or '_'), ':' and '.'
+# when followed by an alphanumeric (DRC:1, a.b), and a trailing wildcard
+# '?' (AA_?).
+_IDENT_TAIL_PATTERN = r'(?:\w|[:.](?=[^\W_]))*\??'
+
+# One alternation classifying the token at the current position, after
+# skipping blanks; _tokenize dispatches on the name of the group that
+# matched.  Line comments, newlines, ASCII identifiers and operators are
+# matched in full, and so are plain ASCII numbers: digits with at most one
+# fraction and no exponent, not followed by '.' or a word character (\w
+# covers every str.isdigit() character, so _scan_number would stop at the
+# same place).  Other numbers, strings, block comments, preprocessor
+# directives and '@' only have their start matched and are finished by the
+# _scan_* methods.  Any other character lands in 'other', which applies the
+# str.isdigit() / str.isalpha() rules for non-ASCII text.
+#
+# This is the stdlib backtracking engine, but no group can backtrack more
+# than one character: each alternative is decided by its first character
+# ('/' and '.' by the second), and the identifier tail has no overlapping
+# branches, so a scan stays linear in the input.  The parser has no
+# third-party dependencies, and RE2-style engines lack the lookaheads used
+# here, so there is no alternative backend.
+_TOKEN = re.compile(r"""
+    [ \t]*
+    (?:
+    (?P<ident>[A-Za-z_]""" + _IDENT_TAIL_PATTERN + r""")
+  | (?P<op>==|!=|<=|>=|&&|\|\||::|[-+*^%(){}\[\],;?~=!<>&|:]|/(?![/*]))
+  | (?P<nl>\n|\r\n?)
+  | (?P<plain_number>[0-9]+(?:\.[0-9]+)?(?![.\w]))
+  | (?P<number>[0-9]|\.[0-9])
+  | (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*)
+  | (?P<string>["'])
+  | (?P<pp>\#)
+  | (?P<at>@)
+  | (?P<env>\$\w*)
+  | (?P<other>.)
+  | (?P<end>\Z)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+# Identifier tail on its own, for names that start with digits or non-ASCII
+# letters
+_IDENT_TAIL = re.compile(_IDENT_TAIL_PATTERN)
+# End of an encrypted block: #ENDCRYPT, or any directive starting with #END
+_ENCRYPTED_END = re.compile(r'#END', re.IGNORECASE)
+# Text after '@', without leading blanks, up to the end of the line
+_COMMENT_TEXT = re.compile(r'[ \t]*([^\n\r]*)')
+
+# Operators and delimiters: spelling -> (type, spelling)
+_OPERATORS = {
+    '+': (TT.PLUS, '+'),
+    '-': (TT.MINUS, '-'),
+    '*': (TT.STAR, '*'),
+    '/': (TT.SLASH, '/'),
+    '^': (TT.CARET, '^'),
+    '%': (TT.PERCENT, '%'),
+    '(': (TT.LPAREN, '('),
+    ')': (TT.RPAREN, ')'),
+    '{': (TT.LBRACE, '{'),
+    '}': (TT.RBRACE, '}'),
+    '[': (TT.LBRACKET, '['),
+    ']': (TT.RBRACKET, ']'),
+    ',': (TT.COMMA, ','),
+    ';': (TT.SEMICOLON, ';'),
+    '?': (TT.QUESTION, '?'),
+    '~': (TT.IDENT, '~'),
+    '=': (TT.EQUALS, '='),
+    '==': (TT.EQEQ, '=='),
+    '!': (TT.BANG, '!'),
+    '!=': (TT.BANGEQ, '!='),
+    '<': (TT.LT, '<'),
+    '<=': (TT.LE, '<='),
+    '>': (TT.GT_OP, '>'),
+    '>=': (TT.GE, '>='),
+    '&': (TT.IDENT, '&'),
+    '&&': (TT.AMPAMP, '&&'),
+    '|': (TT.IDENT, '|'),
+    '||': (TT.PIPEPIPE, '||'),
+    ':': (TT.COLON, ':'),
+    '::': (TT.COLONCOLON, '::'),
+}
+
+# Lexers kept by Lexer.from_cache(), keyed by (filename, digest of the
+# text); least recently used first.
+_LEXER_CACHE = {}
+_LEXER_CACHE_SIZE = 16
+
 
 class Lexer:
     """Tokenizer for SVRF source text."""
@@ -26,9 +118,16 @@ class Lexer:
         self.filename = filename
         self.pos = 0
         self.line = 1
-        self.col = 1
+        # Offset of the first character of the current line.  Columns are
+        # derived from it when a token starts, so the scanners can step
+        # self.pos without per-character bookkeeping; only code that can
+        # pass over a '\n' has to keep line/_line_start up to date.
+        self._line_start = 0
         self.length = len(text)
         self._tokens = []
+        # Identifier spelling -> (interned spelling, interned uppercase form)
+        self._names = {}
+        self._after_newline = 0
         self._tokenize()
 
     # ------------------------------------------------------------------
@@ -37,149 +136,162 @@ class Lexer:
     def tokens(self):
         return self._tokens
 
+    @classmethod
+    def from_cache(cls, text: str, filename: str = "<input>"):
+        """Return a Lexer for *text*, reusing an earlier one for the same
+        filename and content.
+
+        Tokenizing is a pure function of the text, so a deck that is parsed
+        repeatedly in one process is only scanned once.  The cached token
+        list is shared between callers; the parser leaves it intact (its
+        prescan resets the per-token state it caches).
+        """
+        key = (filename,
+               hashlib.blake2b(text.encode('utf-8', 'surrogatepass')).digest())
+        lexer = _LEXER_CACHE.pop(key, None)
+        if lexer is None:
+            lexer = cls(text, filename)
+            if len(_LEXER_CACHE) >= _LEXER_CACHE_SIZE:
+                del _LEXER_CACHE[next(iter(_LEXER_CACHE))]
+        _LEXER_CACHE[key] = lexer
+        return lexer
+
     # ------------------------------------------------------------------
     # Core scanning helpers
     # ------------------------------------------------------------------
-    def _ch(self):
-        if self.pos < self.length:
-            return self.text[self.pos]
-        return '\0'
-
-    def _peek(self, offset=1):
-        p = self.pos + offset
-        if p < self.length:
-            return self.text[p]
-        return '\0'
-
-    def _advance(self):
-        ch = self.text[self.pos]
-        self.pos += 1
-        if ch == '\n':
-            self.line += 1
-            self.col = 1
-        else:
-            self.col += 1
-        return ch
-
-    def _match(self, expected):
-        if self.pos < self.length and self.text[self.pos] == expected:
-            self._advance()
-            return True
-        return False
-
-    def _emit(self, tt, value):
-        self._tokens.append(Token(tt, value, self._tok_line, self._tok_col))
+    def _skip_to(self, end):
+        """Jump to offset *end*, counting the newlines passed over."""
+        text = self.text
+        lines = text.count('\n', self.pos, end)
+        if lines:
+            self.line += lines
+            self._line_start = text.rindex('\n', self.pos, end) + 1
+        self.pos = end
+
+    def _emit(self, tt, value, raw=None):
+        self._tokens.append(Token(tt, value, self._tok_line, self._tok_col, raw))
 
     def _mark(self):
         self._tok_line = self.line
-        self._tok_col = self.col
+        self._tok_col = self.pos - self._line_start + 1
 
     # ------------------------------------------------------------------
     # Main tokenize loop
     # ------------------------------------------------------------------
     def _tokenize(self):
-        while self.pos < self.length:
-            self._mark()
-            ch = self._ch()
-
-            # Newline
-            if ch == '\n':
-                self._advance()
-                self._emit_newline()
-                continue
-
-            # Carriage return
-            if ch == '\r':
-                self._advance()
-                if self._ch() == '\n':
-                    self._advance()
+        text = self.text
+        length = self.length
+        match = _TOKEN.match
+        # Identifiers, operators and plain numbers make up most tokens; they
+        # are appended here directly rather than through _emit_name()/_emit().
+        append = self._tokens.append
+        names = self._names
+        while self.pos < length:
+            m = match(text, self.pos)
+            kind = m.lastgroup
+            start, end = m.span(kind)
+            # Inlined _mark() for the token start
+            self._tok_line = line = self.line
+            self._tok_col = col = start - self._line_start + 1
+            if kind == 'ident':
+                self.pos = end
+                name = text[start:end]
+                entry = names.get(name)
+                if entry is None:
+                    entry = self._intern_name(name)
+                append(Token(_IDENT, entry[0], line, col, None, entry[1]))
+            elif kind == 'op':
+                self.pos = end
+                tt, value = _OPERATORS[text[start:end]]
+                append(Token(tt, value, line, col))
+            elif kind == 'plain_number':
+                self.pos = end
+                spelling = text[start:end]
+                if '.' in spelling:
+                    append(Token(_FLOAT, float(spelling), line, col, spelling))
+                else:
+                    append(Token(_INTEGER, int(spelling), line, col, spelling))
+            elif kind == 'nl':
+                self.pos = end
+                if text[end - 1] == '\n':
+                    self.line += 1
+                    self._line_start = end
                 self._emit_newline()
-                continue
-
-            # Whitespace (not newline)
-            if ch in (' ', '\t'):
-                self._skip_whitespace()
-                continue
-
-            # Line comment //
-            if ch == '/' and self._peek() == '/':
-                self._skip_line_comment()
-                continue
-
-            # Block comment /* */
-            if ch == '/' and self._peek() == '*':
-                self._skip_block_comment()
-                continue
-
-            # Preprocessor directive #
-            if ch == '#':
-                self._scan_preprocessor()
-                continue
-
-            # String literals
-            if ch == '"' or ch == "'":
-                self._scan_string(ch)
-                continue
-
-            # Numbers
-            if ch.isdigit() or (ch == '.' and self._peek().isdigit()):
-                self._scan_number()
-                continue
-
-            # Identifiers
-            if ch.isalpha() or ch == '_':
-                self._scan_identifier()
-                continue
-
-            # Operators and delimiters
-            self._scan_operator()
+            elif kind == 'line_comment' or kind == 'end':
+                self.pos = end
+            elif kind == 'at':
+                self.pos = end
+                self._emit(TT.AT, '@')
+                self._scan_comment_text()
+            elif kind == 'env':
+                # Environment variable reference $VAR
+                self.pos = end
+                self._emit_name(text[start:end])
+            else:
+                # The remaining scanners start at the token's first character
+                self.pos = start
+                if kind == 'number':
+                    self._scan_number()
+                elif kind == 'block_comment':
+                    self._skip_block_comment()
+                elif kind == 'string':
+                    self._scan_string(text[start])
+                elif kind == 'pp':
+                    self._scan_preprocessor()
+                else:
+                    self._scan_other(text[start])
 
         self._mark()
         self._emit(TT.EOF, '')
 
+    def _scan_other(self, ch):
+        """Token starting with a character outside _TOKEN's ASCII classes."""
+        pos = self.pos
+        if ch.isdigit() or (ch == '.' and pos + 1 < self.length
+                            and self.text[pos + 1].isdigit()):
+            self._scan_number()
+        elif ch.isalpha():
+            self._scan_identifier()
+        else:
+            # Skip unknown characters
+            self.pos = pos + 1
+
     # ------------------------------------------------------------------
     # Newline handling
     # ------------------------------------------------------------------
     def _emit_newline(self):
-        if self._tokens and self._tokens[-1].type != TT.NEWLINE:
+        # Runs of line breaks collapse into one NEWLINE, and none is emitted
+        # before the first token.  _after_newline is the token count just
+        # after the last NEWLINE, so no token needs to be inspected.
+        count = len(self._tokens)
+        if count != self._after_newline:
             self._emit(TT.NEWLINE, '\n')
+            self._after_newline = count + 1
 
     # ------------------------------------------------------------------
-    # Whitespace and comments
+    # Comments
     # ------------------------------------------------------------------
-    def _skip_whitespace(self):
-        while self.pos < self.length and self._ch() in (' ', '\t'):
-            self._advance()
-
-    def _skip_line_comment(self):
-        while self.pos < self.length and self._ch() != '\n':
-            self._advance()
-
     def _skip_block_comment(self):
-        self._advance()  # /
-        self._advance()  # *
-        while self.pos < self.length:
-            if self._ch() == '*' and self._peek() == '/':
-                self._advance()
-                self._advance()
-                return
-            self._advance()
+        end = self.text.find('*/', self.pos + 2)  # after the opening /*
+        self._skip_to(self.length if end < 0 else end + 2)
 
     # ------------------------------------------------------------------
     # Preprocessor
     # ------------------------------------------------------------------
     def _scan_preprocessor(self):
-        self._advance()  # skip #
+        text = self.text
+        length = self.length
         # Read directive name
-        start = self.pos
-        while self.pos < self.length and self._ch().isalpha():
-            self._advance()
+        start = pos = self.pos + 1  # skip #
+        while pos < length and text[pos].isalpha():
+            pos += 1
+        self.pos = pos
         name = self.text[start:self.pos].upper()
 
         tt = _PP_MAP.get(name)
         if tt is None:
             # Unknown preprocessor directive, treat as identifier
-            self._emit(TT.IDENT, '#' + self.text[start:self.pos])
+            self._emit_name('#' + self.text[start:self.pos])
             return
 
         if tt == TT.PP_ENCRYPT:
@@ -200,209 +312,143 @@ class Lexer:
 
     def _scan_encrypted_block(self):
         """Capture everything until #ENDCRYPT or end of file as encrypted content."""
-        # Skip rest of current line
-        while self.pos < self.length and self._ch() != '\n':
-            self._advance()
-        if self.pos < self.length:
-            self._advance()  # skip newline
+        # Skip rest of current line, including the newline
+        end = self.text.find('\n', self.pos)
+        self._skip_to(self.length if end < 0 else end + 1)
 
+        text = self.text
         start = self.pos
-        while self.pos < self.length:
-            if self._ch() == '#':
-                # Check for #ENDCRYPT
-                rest = self.text[self.pos:self.pos + 10].upper()
-                if rest.startswith('#ENDCRYPT') or rest.startswith('#END'):
-                    break
-            self._advance()
-
-        content = self.text[start:self.pos]
+        end = _ENCRYPTED_END.search(text, start)
+        self._skip_to(self.length if end is None else end.start())
+
+        content = text[start:self.pos]
         if content.strip():
             self._mark()
             self._emit(TT.ENCRYPTED, content)
 
         # Scan #ENDCRYPT if present
-        if self.pos < self.length and self._ch() == '#':
+        if end is not None:
             self._mark()
-            self._advance()  # #
-            s = self.pos
-            while self.pos < self.length and self._ch().isalpha():
-                self._advance()
+            length = self.length
+            pos = self.pos + 1  # #
+            while pos < length and text[pos].isalpha():
+                pos += 1
+            self.pos = pos
             self._emit(TT.PP_ENDCRYPT, '#ENDCRYPT')
 
     # ------------------------------------------------------------------
     # String literals
     # ------------------------------------------------------------------
     def _scan_string(self, quote):
-        self._advance()  # opening quote
+        text = self.text
+        length = self.length
+        pos = self.pos + 1  # opening quote
         parts = []
-        while self.pos < self.length:
-            ch = self._ch()
+        while pos < length:
+            ch = text[pos]
             if ch == quote:
-                self._advance()
+                self.pos = pos + 1
                 self._emit(TT.STRING, ''.join(parts))
                 return
+            pos += 1
             if ch == '\\':
-                self._advance()
-                parts.append(self._advance() if self.pos < self.length else '\\')
+                if pos < length:
+                    ch = text[pos]
+                    pos += 1
+                    if ch == '\n':
+                        # Escaped newline: the string continues on the next line
+                        self.line += 1
+                        self._line_start = pos
+                parts.append(ch)
             elif ch == '\n':
                 # Unterminated string at newline - emit what we have
+                pos -= 1
                 break
             else:
-                parts.append(self._advance())
+                parts.append(ch)
+        self.pos = pos
         self._emit(TT.STRING, ''.join(parts))
 
     # ------------------------------------------------------------------
     # Number literals
     # ------------------------------------------------------------------
     def _scan_number(self):
-        start = self.pos
+        text = self.text
+        length = self.length
+        start = pos = self.pos
         has_dot = False
         has_exp = False
 
-        while self.pos < self.length:
-            ch = self._ch()
+        while pos < length:
+            ch = text[pos]
             if ch.isdigit():
-                self._advance()
+                pos += 1
             elif ch == '.' and not has_dot and not has_exp:
                 has_dot = True
-                self._advance()
-            elif ch in ('e', 'E') and not has_exp:
+                pos += 1
+            elif (ch == 'e' or ch == 'E') and not has_exp and \
+                    self._exponent_follows(pos):
                 has_exp = True
                 has_dot = True  # treat as float
-                self._advance()
-                if self.pos < self.length and self._ch() in ('+', '-'):
-                    self._advance()
+                pos += 1
+                if text[pos] == '+' or text[pos] == '-':
+                    pos += 1
             else:
                 break
+        self.pos = pos
 
-        text = self.text[start:self.pos]
+        if not has_dot and pos < length and (
+                text[pos].isalpha() or text[pos] == '_'):
+            # Digit-prefixed identifier: 15V_GATE_CHECK, 2xmn_DN_6_WINDOW
+            self._scan_identifier(start)
+            return
+
+        text = text[start:pos]
         if has_dot or has_exp:
-            self._emit(TT.FLOAT, float(text))
+            self._emit(TT.FLOAT, float(text), text)
         else:
-            self._emit(TT.INTEGER, int(text))
+            self._emit(TT.INTEGER, int(text), text)
 
-    # ------------------------------------------------------------------
-    # Identifiers
-    # ------------------------------------------------------------------
-    def _scan_identifier(self):
-        start = self.pos
-        while self.pos < self.length:
-            ch = self._ch()
-            if ch.isalnum() or ch == '_':
-                self._advance()
-            elif ch == ':' and self._peek().isalnum():
-                # Colon-identifiers like DRC:1
-                self._advance()
-            elif ch == '?' and self.pos > start:
-                # Wildcard suffix like AA_?
-                self._advance()
-                break
-            elif ch == '.' and self._peek().isalnum():
-                # Dotted identifiers
-                self._advance()
-            else:
-                break
-        text = self.text[start:self.pos]
-        self._emit(TT.IDENT, text)
+    def _exponent_follows(self, pos):
+        """True if the e/E at *pos* starts an exponent."""
+        text = self.text
+        pos += 1
+        if pos < self.length and (text[pos] == '+' or text[pos] == '-'):
+            pos += 1
+        return pos < self.length and text[pos].isdigit()
 
     # ------------------------------------------------------------------
-    # Operators and delimiters
+    # Identifiers
     # ------------------------------------------------------------------
-    def _scan_operator(self):
-        ch = self._advance()
-
-        if ch == '=':
-            if self._match('='):
-                self._emit(TT.EQEQ, '==')
-            else:
-                self._emit(TT.EQUALS, '=')
-        elif ch == '!':
-            if self._match('='):
-                self._emit(TT.BANGEQ, '!=')
-            else:
-                self._emit(TT.BANG, '!')
-        elif ch == '<':
-            if self._match('='):
-                self._emit(TT.LE, '<=')
-            else:
-                self._emit(TT.LT, '<')
-        elif ch == '>':
-            if self._match('='):
-                self._emit(TT.GE, '>=')
-            else:
-                self._emit(TT.GT_OP, '>')
-        elif ch == '&':
-            if self._match('&'):
-                self._emit(TT.AMPAMP, '&&')
-            else:
-                self._emit(TT.IDENT, '&')
-        elif ch == '|':
-            if self._match('|'):
-                self._emit(TT.PIPEPIPE, '||')
-            else:
-                self._emit(TT.IDENT, '|')
-        elif ch == '+':
-            self._emit(TT.PLUS, '+')
-        elif ch == '-':
-            self._emit(TT.MINUS, '-')
-        elif ch == '*':
-            self._emit(TT.STAR, '*')
-        elif ch == '/':
-            self._emit(TT.SLASH, '/')
-        elif ch == '^':
-            self._emit(TT.CARET, '^')
-        elif ch == '%':
-            self._emit(TT.PERCENT, '%')
-        elif ch == '(':
-            self._emit(TT.LPAREN, '(')
-        elif ch == ')':
-            self._emit(TT.RPAREN, ')')
-        elif ch == '{':
-            self._emit(TT.LBRACE, '{')
-        elif ch == '}':
-            self._emit(TT.RBRACE, '}')
-        elif ch == '[':
-            self._emit(TT.LBRACKET, '[')
-        elif ch == ']':
-            self._emit(TT.RBRACKET, ']')
-        elif ch == ',':
-            self._emit(TT.COMMA, ',')
-        elif ch == '@':
-            self._emit(TT.AT, '@')
-            self._scan_comment_text()
-        elif ch == ';':
-            self._emit(TT.SEMICOLON, ';')
-        elif ch == '?':
-            self._emit(TT.QUESTION, '?')
-        elif ch == ':':
-            if self._match(':'):
-                self._emit(TT.COLONCOLON, '::')
-            else:
-                self._emit(TT.COLON, ':')
-        elif ch == '$':
-            # Environment variable reference $VAR
+    def _scan_identifier(self, start=None):
+        text = self.text
+        if start is None:
             start = self.pos
-            while self.pos < self.length and (self._ch().isalnum() or self._ch() == '_'):
-                self._advance()
-            self._emit(TT.IDENT, '$' + self.text[start:self.pos])
-        elif ch == '~':
-            self._emit(TT.IDENT, '~')
-        else:
-            # Skip unknown characters
-            pass
+        self.pos = _IDENT_TAIL.match(text, self.pos).end()
+        self._emit_name(text[start:self.pos])
+
+    def _emit_name(self, name):
+        entry = self._names.get(name)
+        if entry is None:
+            entry = self._intern_name(name)
+        self._tokens.append(Token(TT.IDENT, entry[0], self._tok_line,
+                                  self._tok_col, None, entry[1]))
+
+    def _intern_name(self, name):
+        # Layer and keyword names repeat throughout a deck; interning shares
+        # one string object per distinct name across the token stream, and
+        # the cache saves re-uppercasing a name on every occurrence.
+        entry = self._names[name] = (sys.intern(name), sys.intern(name.upper()))
+        return entry
 
     # ------------------------------------------------------------------
     # Rule check comment text (after @)
     # ------------------------------------------------------------------
     def _scan_comment_text(self):
         """Capture the rest of the line after @ as raw COMMENT_TEXT."""
-        # Skip leading whitespace after @
-        while self.pos < self.length and self._ch() in (' ', '\t'):
-            self._advance()
-        start = self.pos
-        while self.pos < self.length and self._ch() not in ('\n', '\r'):
-            self._advance()
-        text = self.text[start:self.pos].rstrip()
+        m = _COMMENT_TEXT.match(self.text, self.pos)
+        self.pos = m.end()
+        text = m.group(1).rstrip()
         if text:
             self._mark()
             self._emit(TT.COMMENT_TEXT, text)
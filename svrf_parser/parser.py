@@ -10,4 +10,5 @@ from .property_block_parser import PropertyBlockMixin
 class Parser(StatementMixin, PropertyBlockMixin, DRCOpMixin,
              ExpressionMixin, ParserBase):
     """SVRF parser using recursive descent + Pratt parsing."""
-    pass
+
+    __slots__ = ()
@@ -1,13 +1,26 @@
 """Base class for the SVRF parser: error type, keyword sets, token stream helpers."""
 
-from .tokens import TokenType, Token
+from .tokens import TokenType, Token, TT
 from . import ast_nodes as ast
 from .keywords import (
     _DIRECTIVE_HEADS, _BINARY_OPS, _LAYER_BP, _UNARY_OPS,
     _DRC_OPS, _DRC_MODIFIERS, _EXPR_STARTERS, _SVRF_KEYWORDS,
 )
 
-TT = TokenType
+# Token-type groups shared by the parser mixins.  TokenType is an IntEnum,
+# so membership tests hash in C, and the sets are built once instead of
+# as a tuple of attribute loads on every test.
+_CMP_TYPES = frozenset((TT.LT, TT.GT_OP, TT.LE, TT.GE, TT.EQEQ, TT.BANGEQ))
+_NUMBER_TYPES = frozenset((TT.INTEGER, TT.FLOAT))
+# Modifier words after RECTANGLE (prefix and postfix forms)
+_RECTANGLE_MODS = _DRC_MODIFIERS | {'ASPECT'}
+# Stand-in returned by the lookahead helpers past the end of the stream.
+# One shared instance: the parser never mutates non-IDENT tokens.
+_EOF_TOKEN = Token(TT.EOF, '', 0, 0)
+# The parser's copy of the stream ends in this many _EOF_TOKENs, so the
+# current token and the _peek1/_peek2 lookahead can be read by plain
+# index with no bounds check.  pos itself never moves past length.
+_EOF_PAD = (_EOF_TOKEN,) * 3
 
 
 class SVRFParseError(Exception):
@@ -21,11 +34,61 @@ class SVRFParseError(Exception):
 class ParserBase:
     """Token stream management and shared utilities for the SVRF parser."""
 
-    def __init__(self, tokens):
-        self.tokens = tokens
+    # Typed parser state, stored in slots rather than an instance dict.
+    # The mixins and Parser declare empty __slots__ so the layout holds.
+    __slots__ = ('tokens', 'pos', 'length', 'warnings', 'suppressed_warnings',
+                 '_block_depth', '_known_layers')
+    tokens: list
+    pos: int
+    length: int
+    warnings: list
+    suppressed_warnings: int
+    _block_depth: int
+    _known_layers: set
+
+    # Warnings kept per parse.  A pathological input can produce one per
+    # token; past this many they are only counted in suppressed_warnings.
+    _MAX_WARNINGS = 1000
+
+    # Keyword -> role number stored on IDENT tokens by the prescan.
+    # Supplied by ExpressionMixin; see _layer_nud.
+    _NUD_ROLES = {}
+
+    # Method-name dispatch tables supplied by the mixins, and the same
+    # tables resolved to plain functions by __init_subclass__.
+    _NUD_HANDLERS = ()
+    _LED_DISPATCH = {}
+    _STMT_DISPATCH = {}
+    _STMT_TYPE_DISPATCH = {}
+    _STMT_TYPE_DEFAULT = None
+    _nud_funcs = ()
+    _led_funcs = {}
+    _stmt_funcs = {}
+    _stmt_type_funcs = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve handler names once per class, so the hot paths call
+        # handler(self, ...) without a getattr() on every token.
+        cls._nud_funcs = [name and getattr(cls, name)
+                          for name in cls._NUD_HANDLERS]
+        cls._led_funcs = {kw: getattr(cls, name)
+                          for kw, name in cls._LED_DISPATCH.items()}
+        cls._stmt_funcs = {kw: getattr(cls, name)
+                           for kw, name in cls._STMT_DISPATCH.items()}
+        if cls._STMT_TYPE_DEFAULT is not None:
+            cls._stmt_type_funcs = [
+                getattr(cls, cls._STMT_TYPE_DISPATCH.get(
+                    tt, cls._STMT_TYPE_DEFAULT))
+                for tt in range(max(TokenType) + 1)]
+
+    def __init__(self, tokens: list):
+        # length counts the real tokens only; see _EOF_PAD
+        self.tokens = [*tokens, *_EOF_PAD]
         self.pos = 0
         self.length = len(tokens)
         self.warnings = []
+        self.suppressed_warnings = 0
         self._block_depth = 0
         self._known_layers = self._prescan()
 
@@ -35,6 +98,11 @@ class ParserBase:
     def _prescan(self):
         """Lightweight scan of token stream to build symbol table.
 
+        Also tags every IDENT token with its expression role (see
+        ExpressionMixin._NUD_ROLES) so _layer_nud can branch on a small
+        int instead of re-hashing the keyword, and clears its cached
+        binding power in case the stream was parsed before.
+
         Recognizes:
           LAYER <name> <number>      -> layer definition
           <name> = ...               -> layer assignment
@@ -44,42 +112,54 @@ class ParserBase:
           Definitions inside #IFDEF/#IFNDEF blocks (both branches)
         """
         known = set()
-        i = 0
+        roles = self._NUD_ROLES
         toks = self.tokens
         length = self.length
-        while i < length:
-            t = toks[i]
-            if t.type == TT.IDENT:
-                upper = t.value.upper()
+        # One pass over every token: the types and the lookup are bound
+        # to locals once rather than fetched per token.
+        ident, equals, pp_define = TT.IDENT, TT.EQUALS, TT.PP_DEFINE
+        role_of = roles.get
+        for i, t in enumerate(toks[:length]):
+            tt = t.type
+            if tt is ident:
+                upper = t.upper
+                t.role = role_of(upper, 0)
+                t.bp = -1
                 # LAYER <name> <number>
                 if upper == 'LAYER' and i + 2 < length:
                     nxt = toks[i + 1]
                     nxt2 = toks[i + 2]
-                    if nxt.type == TT.IDENT and nxt2.type in (TT.INTEGER, TT.FLOAT):
-                        known.add(nxt.value.upper())
+                    if nxt.type is ident and nxt2.type in _NUMBER_TYPES:
+                        known.add(nxt.upper)
                 # <name> = ...  (layer assignment)
-                elif i + 1 < length and toks[i + 1].type == TT.EQUALS:
+                elif i + 1 < length and toks[i + 1].type is equals:
                     known.add(upper)
                 # VARIABLE <name>
                 elif upper == 'VARIABLE' and i + 1 < length:
                     nxt = toks[i + 1]
-                    if nxt.type == TT.IDENT:
-                        known.add(nxt.value.upper())
+                    if nxt.type is ident:
+                        known.add(nxt.upper)
                 # DMACRO <name>
                 elif upper == 'DMACRO' and i + 1 < length:
                     nxt = toks[i + 1]
-                    if nxt.type == TT.IDENT:
-                        known.add(nxt.value.upper())
-            elif t.type == TT.PP_DEFINE and i + 1 < length:
+                    if nxt.type is ident:
+                        known.add(nxt.upper)
+            elif tt is pp_define and i + 1 < length:
                 nxt = toks[i + 1]
-                if nxt.type == TT.IDENT:
-                    known.add(nxt.value.upper())
+                if nxt.type is ident:
+                    known.add(nxt.upper)
             # #IFDEF/#IFNDEF — continue scanning (both branches are collected
             # automatically since prescan is a flat linear scan that ignores
             # preprocessor nesting).
-            i += 1
         return known
 
+    def _warn(self, t, msg):
+        """Record warning *msg* at the location of token *t*."""
+        if len(self.warnings) < self._MAX_WARNINGS:
+            self.warnings.append(f"L{t.line}:{t.col}: {msg}")
+        else:
+            self.suppressed_warnings += 1
+
     def _register_symbol(self, name):
         """Incrementally register a newly discovered symbol during parsing."""
         self._known_layers.add(name.upper())
@@ -87,38 +167,43 @@ class ParserBase:
     # ------------------------------------------------------------------
     # Token stream helpers
     # ------------------------------------------------------------------
-    def _cur(self):
-        if self.pos < self.length:
-            return self.tokens[self.pos]
-        return Token(TT.EOF, '', 0, 0)
+    # The padded stream lets these index directly: pos <= length always.
+    def _cur(self) -> Token:
+        return self.tokens[self.pos]
 
-    def _peek(self, offset=1):
-        p = self.pos + offset
-        if p < self.length:
-            return self.tokens[p]
-        return Token(TT.EOF, '', 0, 0)
+    # Lookahead is only ever one or two tokens, so there is one fixed-offset
+    # helper for each rather than a general _peek(offset).
+    def _peek1(self) -> Token:
+        return self.tokens[self.pos + 1]
+
+    def _peek2(self) -> Token:
+        return self.tokens[self.pos + 2]
 
-    def _peek_skip_newlines(self, offset=1):
+    def _peek_skip_newlines(self, offset: int = 1) -> Token:
         """Peek at the next non-NEWLINE token without advancing."""
         p = self.pos + offset
         while p < self.length and self.tokens[p].type == TT.NEWLINE:
             p += 1
         if p < self.length:
             return self.tokens[p]
-        return Token(TT.EOF, '', 0, 0)
+        return _EOF_TOKEN
 
-    def _advance(self):
-        tok = self._cur()
-        if self.pos < self.length:
-            self.pos += 1
-        return tok
+    # _advance/_at/_at_val/_at_eol are called for nearly every token, so
+    # they index the stream directly instead of going through _cur().
+    def _advance(self) -> Token:
+        pos = self.pos
+        if pos < self.length:
+            self.pos = pos + 1
+            return self.tokens[pos]
+        return _EOF_TOKEN
 
-    def _at(self, tt):
-        return self._cur().type == tt
+    def _at(self, tt: TokenType) -> bool:
+        return self.tokens[self.pos].type == tt
 
-    def _at_val(self, val):
-        t = self._cur()
-        return t.type == TT.IDENT and t.value.upper() == val.upper()
+    def _at_val(self, val: str) -> bool:
+        """True if the current token is the keyword *val* (given in uppercase)."""
+        # .upper is None for every non-IDENT token
+        return self.tokens[self.pos].upper == val
 
     def _match(self, tt):
         if self._cur().type == tt:
@@ -127,11 +212,11 @@ class ParserBase:
 
     def _match_val(self, val):
         t = self._cur()
-        if t.type == TT.IDENT and t.value.upper() == val.upper():
+        if t.type == TT.IDENT and t.upper == val:
             return self._advance()
         return None
 
-    def _expect(self, tt):
+    def _expect(self, tt: TokenType) -> Token:
         tok = self._match(tt)
         if tok is None:
             c = self._cur()
@@ -141,20 +226,61 @@ class ParserBase:
         return tok
 
     def _skip_newlines(self):
-        while self._at(TT.NEWLINE):
-            self._advance()
+        tokens = self.tokens
+        length = self.length
+        pos = self.pos
+        newline = TT.NEWLINE
+        while pos < length and tokens[pos].type is newline:
+            pos += 1
+        self.pos = pos
 
-    def _at_eol(self):
-        return self._at(TT.NEWLINE) or self._at(TT.EOF)
+    def _at_eol(self) -> bool:
+        tt = self.tokens[self.pos].type
+        return tt is TT.NEWLINE or tt is TT.EOF
 
-    def _skip_to_eol(self):
-        while not self._at_eol():
-            self._advance()
+    def _rest_of_line(self) -> list:
+        """Consume the tokens before the end of the line and return their
+        source spellings."""
+        tokens = self.tokens
+        length = self.length
+        start = pos = self.pos
+        newline, eof = TT.NEWLINE, TT.EOF
+        while pos < length:
+            tt = tokens[pos].type
+            if tt is newline or tt is eof:
+                break
+            pos += 1
+        self.pos = pos
+        return [t.raw for t in tokens[start:pos]]
+
+    def _skip_line(self):
+        """Skip the rest of the line, including its NEWLINE if present."""
+        tokens = self.tokens
+        length = self.length
+        pos = self.pos
+        newline, eof = TT.NEWLINE, TT.EOF
+        while pos < length:
+            tt = tokens[pos].type
+            if tt is newline:
+                pos += 1
+                break
+            if tt is eof:
+                break
+            pos += 1
+        self.pos = pos
 
     def _consume_eol(self):
         if self._at(TT.NEWLINE):
             self._advance()
 
-    def _loc(self):
-        t = self._cur()
-        return {'line': t.line, 'col': t.col}
+    def _skip_eol_in_block(self):
+        """Inside a { } block, step onto the next line so an operand may
+        continue there; a no-op at top level or mid-line."""
+        if self._block_depth > 0 and self._at_eol():
+            self._consume_eol()
+            self._skip_newlines()
+
+    def _loc(self) -> tuple:
+        """(line, col) of the current token, for unpacking into node kwargs."""
+        t = self.tokens[self.pos]
+        return t.line, t.col
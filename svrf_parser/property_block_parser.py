@@ -1,19 +1,36 @@
 """Property block parsing mixin for the SVRF parser."""
 
-from .tokens import TokenType, Token
+from .tokens import Token, TT
 from . import ast_nodes as ast
+from .parser_base import SVRFParseError, _NUMBER_TYPES
 
-TT = TokenType
+# Tokens that end a property block body before its ']'
+_BODY_END_TYPES = frozenset((TT.PP_ENDIF, TT.PP_ELSE, TT.RBRACE))
+# Line-leading tokens continuing the previous line's expression
+_CONTINUATION_TYPES = frozenset((
+    TT.RPAREN, TT.QUESTION, TT.COLON, TT.STAR, TT.PLUS,
+    TT.SLASH, TT.PIPEPIPE, TT.AMPAMP))
+# Words starting a keyword statement (see _parse_prop_keyword_stmt)
+_KEYWORD_STMT_WORDS = frozenset((
+    'RESOLVE', 'ACTION', 'OUTPUT', 'ANCHOR', 'SELECT',
+    'STAMP', 'TEXT', 'LABEL', 'PRINT', 'EFFECTIVE', 'TOLERANCE'))
+# Tokens ending the raw text of a property block line
+_PROP_LINE_END_TYPES = frozenset((TT.NEWLINE, TT.EOF, TT.RBRACKET))
+# Tokens that can start an arithmetic expression
+_ARITH_START_TYPES = frozenset((
+    TT.IDENT, TT.INTEGER, TT.FLOAT, TT.STRING, TT.LPAREN, TT.MINUS, TT.BANG))
 
 
 class PropertyBlockMixin:
     """Mixin providing property block parsing for the SVRF parser."""
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------
     # Property block: [ PROPERTY props... body... ]
     # ------------------------------------------------------------------
     def _parse_property_block(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # [
         self._skip_newlines()
         properties = []
@@ -32,21 +49,30 @@ class PropertyBlockMixin:
             self._consume_eol()
         # Parse body until ] or a scope-ending token
         while not self._at(TT.EOF) and not self._at(TT.RBRACKET):
-            if self._cur().type in (TT.PP_ENDIF, TT.PP_ELSE, TT.RBRACE):
+            if self._cur().type in _BODY_END_TYPES:
                 break
             self._skip_newlines()
             if self._at(TT.RBRACKET) or self._at(TT.EOF):
                 break
-            if self._cur().type in (TT.PP_ENDIF, TT.PP_ELSE, TT.RBRACE):
+            if self._cur().type in _BODY_END_TYPES:
                 break
             saved = self.pos
-            stmt = self._parse_prop_statement()
+            try:
+                stmt = self._parse_prop_statement()
+            except RecursionError as e:
+                # Runaway nesting on the right of an assignment or IF:
+                # drop the rest of the line, as for a bare expression
+                self._warn(self.tokens[saved],
+                    f"Exception in property block statement parse: {e}")
+                self._rest_of_prop_line()
+                self._consume_eol()
+                stmt = None
             if stmt is not None:
                 body.append(stmt)
             if self.pos == saved:
                 _st = self._cur()
-                self.warnings.append(
-                    f"L{_st.line}:{_st.col}: Parser stuck in property block at "
+                self._warn(_st,
+                    "Parser stuck in property block at "
                     f"{_st.type.name} ({_st.value!r}), force advancing")
                 self._advance()
         if self._at(TT.RBRACKET):
@@ -54,26 +80,26 @@ class PropertyBlockMixin:
         # Capture trailing tokens after ] on the same line
         # (e.g. "] RDB report.rep M1 M2 BY LAYER")
         if not self._at_eol():
-            trail_loc = self._loc()
+            trail_line, trail_col = self._loc()
             keywords = []
             args = []
             while not self._at_eol():
                 t = self._cur()
                 if t.type == TT.IDENT:
                     keywords.append(self._advance().value)
-                elif t.type in (TT.INTEGER, TT.FLOAT):
+                elif t.type in _NUMBER_TYPES:
                     args.append(self._advance().value)
                 elif t.type == TT.STRING:
                     args.append(self._advance().value)
                 else:
                     # Operators and delimiters are valid in trailing content
                     # after property blocks (comparisons, parens, brackets, etc.)
-                    args.append(str(self._advance().value))
+                    args.append(self._advance().raw)
             if keywords or args:
                 body.append(ast.Directive(
-                    keywords=keywords, arguments=args, **trail_loc))
+                    keywords=keywords, arguments=args, line=trail_line, col=trail_col))
         self._consume_eol()
-        return ast.PropertyBlock(properties=properties, body=body, **loc)
+        return ast.PropertyBlock(properties=properties, body=body, line=line, col=col)
 
     def _parse_prop_statement(self):
         """Parse a statement inside a property block."""
@@ -93,41 +119,39 @@ class PropertyBlockMixin:
         if t.type == TT.RBRACKET:
             return None
         # IF expression
-        if t.type == TT.IDENT and t.value.upper() == 'IF':
+        if t.type == TT.IDENT and t.upper == 'IF':
             return self._parse_if_expr()
         # Assignment: ident = expr
-        if t.type == TT.IDENT and self._peek().type == TT.EQUALS:
+        if t.type == TT.IDENT and self._peek1().type == TT.EQUALS:
             return self._parse_prop_assignment()
         # Compound assignment: ident -= expr, ident += expr
-        if t.type == TT.IDENT and self._peek().type == TT.MINUS:
-            p2 = self._peek(2)
+        if t.type == TT.IDENT and self._peek1().type == TT.MINUS:
+            p2 = self._peek2()
             if p2.type == TT.EQUALS:
                 return self._parse_prop_compound_assignment('-=')
-        if t.type == TT.IDENT and self._peek().type == TT.PLUS:
-            p2 = self._peek(2)
+        if t.type == TT.IDENT and self._peek1().type == TT.PLUS:
+            p2 = self._peek2()
             if p2.type == TT.EQUALS:
                 return self._parse_prop_compound_assignment('+=')
         # Compound assignment starting with - : - = expr (shorthand for implicit var)
-        if t.type == TT.MINUS and self._peek().type == TT.EQUALS:
+        if t.type == TT.MINUS and self._peek1().type == TT.EQUALS:
             return self._parse_prop_compound_assignment('-=', implicit=True)
         # Compound assignment starting with + : + = expr (shorthand for implicit var)
-        if t.type == TT.PLUS and self._peek().type == TT.EQUALS:
+        if t.type == TT.PLUS and self._peek1().type == TT.EQUALS:
             return self._parse_prop_compound_assignment('+=', implicit=True)
         # Keyword statements: resolve, action, output, anchor, effective, tolerance, etc.
-        if t.type == TT.IDENT and t.value.lower() in (
-                'resolve', 'action', 'output', 'anchor', 'select',
-                'stamp', 'text', 'label', 'print', 'effective', 'tolerance'):
+        if t.upper in _KEYWORD_STMT_WORDS:
             return self._parse_prop_keyword_stmt()
         # String-keyed assignment: "AREA" = AREA(proc_layer)
-        if t.type == TT.STRING and self._peek().type == TT.EQUALS:
-            loc = self._loc()
+        if t.type == TT.STRING and self._peek1().type == TT.EQUALS:
+            line, col = self._loc()
             name = self._advance().value
             self._advance()  # =
             expr = self._parse_arith_expr(0)
             if self._at(TT.SEMICOLON):
                 self._advance()
             self._consume_eol()
-            return ast.LayerAssignment(name=name, expression=expr, **loc)
+            return ast.LayerAssignment(name=name, expression=expr, line=line, col=col)
         # Semicolon-terminated statement (e.g. "expr ;")
         if t.type == TT.SEMICOLON:
             self._advance()
@@ -135,46 +159,50 @@ class PropertyBlockMixin:
         # Continuation tokens from multiline expressions (ternary, parens, operators)
         # These appear at the start of a line when the previous line's expression
         # spans multiple lines. Consume the rest of the line as an expression.
-        if t.type in (TT.RPAREN, TT.QUESTION, TT.COLON, TT.STAR, TT.PLUS,
-                      TT.SLASH, TT.PIPEPIPE, TT.AMPAMP):
-            loc = self._loc()
-            parts = []
-            while not self._at_eol() and not self._at(TT.RBRACKET):
-                parts.append(str(self._advance().value))
+        if t.type in _CONTINUATION_TYPES:
+            line, col = t.line, t.col
+            parts = self._rest_of_prop_line()
             self._consume_eol()
             if parts:
-                return ast.Directive(keywords=[], arguments=parts, **loc)
+                return ast.Directive(keywords=[], arguments=parts, line=line, col=col)
             return None
         # Try to parse as arithmetic expression
-        if t.type in (TT.IDENT, TT.INTEGER, TT.FLOAT, TT.STRING,
-                       TT.LPAREN, TT.MINUS, TT.BANG):
-            loc = self._loc()
+        if t.type in _ARITH_START_TYPES:
             try:
                 expr = self._parse_arith_expr(0)
+            except (SVRFParseError, RecursionError):
+                pass
+            else:
                 # Consume optional semicolon
                 if self._at(TT.SEMICOLON):
                     self._advance()
                 self._consume_eol()
                 return expr
-            except Exception:
-                pass
         # Bare expression / skip – stop before ] so we don't consume the
         # closing bracket of the enclosing property block.
         skip_start = self._cur()
-        parts = []
-        while not self._at_eol() and not self._at(TT.RBRACKET):
-            parts.append(str(self._advance().value))
+        parts = self._rest_of_prop_line()
         self._consume_eol()
         if parts:
-            self.warnings.append(
-                f"L{skip_start.line}:{skip_start.col}: Skipped unrecognized "
+            self._warn(skip_start,
+                "Skipped unrecognized "
                 f"property block content: {' '.join(parts[:5])}"
                 f"{'...' if len(parts) > 5 else ''}")
         return None
 
+    def _rest_of_prop_line(self) -> list:
+        """Like _rest_of_line, but also stops before a ']' so the
+        enclosing property block keeps its closing bracket."""
+        tokens = self.tokens
+        start = pos = self.pos
+        while tokens[pos].type not in _PROP_LINE_END_TYPES:
+            pos += 1
+        self.pos = pos
+        return [t.raw for t in tokens[start:pos]]
+
     def _parse_prop_assignment(self):
         """Parse property assignment: name = arith_expr"""
-        loc = self._loc()
+        line, col = self._loc()
         name = self._advance().value
         self._advance()  # =
         expr = self._parse_arith_expr(0)
@@ -182,11 +210,11 @@ class PropertyBlockMixin:
         if self._at(TT.SEMICOLON):
             self._advance()
         self._consume_eol()
-        return ast.LayerAssignment(name=name, expression=expr, **loc)
+        return ast.LayerAssignment(name=name, expression=expr, line=line, col=col)
 
     def _parse_prop_compound_assignment(self, op, implicit=False):
         """Parse compound assignment: name -= expr or name += expr or - = expr."""
-        loc = self._loc()
+        line, col = self._loc()
         if implicit:
             name = ''
             self._advance()  # - or +
@@ -200,58 +228,39 @@ class PropertyBlockMixin:
         if self._at(TT.SEMICOLON):
             self._advance()
         self._consume_eol()
-        return ast.LayerAssignment(name=f"{name}{op}", expression=expr, **loc)
+        return ast.LayerAssignment(name=f"{name}{op}", expression=expr, line=line, col=col)
 
     def _parse_prop_keyword_stmt(self):
         """Parse keyword statement in property block (resolve, action, output, etc.)."""
-        loc = self._loc()
+        line, col = self._loc()
         keywords = []
         args = []
         while not self._at_eol() and not self._at(TT.RBRACKET) and not self._at(TT.SEMICOLON):
             t = self._cur()
             if t.type == TT.IDENT:
                 keywords.append(self._advance().value)
-            elif t.type in (TT.INTEGER, TT.FLOAT):
+            elif t.type in _NUMBER_TYPES:
                 args.append(self._advance().value)
             elif t.type == TT.STRING:
                 args.append(self._advance().value)
             else:
-                args.append(str(self._advance().value))
+                args.append(self._advance().raw)
         if self._at(TT.SEMICOLON):
             self._advance()
         self._consume_eol()
-        return ast.Directive(keywords=keywords, arguments=args, **loc)
+        return ast.Directive(keywords=keywords, arguments=args, line=line, col=col)
 
     # ------------------------------------------------------------------
     # IF / ELSE IF / ELSE inside property blocks
     # ------------------------------------------------------------------
     def _parse_if_expr(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # IF
         # Parse condition (may be in parens)
         cond = self._parse_arith_expr(0)
         # Expect {
         self._skip_newlines()
-        then_body = []
-        if self._at(TT.LBRACE):
-            self._advance()
-            self._skip_newlines()
-            while not self._at(TT.RBRACE) and not self._at(TT.EOF):
-                self._skip_newlines()
-                if self._at(TT.RBRACE) or self._at(TT.EOF):
-                    break
-                saved = self.pos
-                s = self._parse_prop_statement()
-                if s is not None:
-                    then_body.append(s)
-                if self.pos == saved:
-                    _st = self._cur()
-                    self.warnings.append(
-                        f"L{_st.line}:{_st.col}: Parser stuck in IF body at "
-                        f"{_st.type.name} ({_st.value!r}), force advancing")
-                    self._advance()
-            if self._at(TT.RBRACE):
-                self._advance()
+        then_body = self._parse_prop_brace_body('IF body')
         self._consume_eol()
         # ELSE IF / ELSE  (ELSE may be on same line as } or next line)
         elseifs = []
@@ -260,55 +269,50 @@ class PropertyBlockMixin:
         while self._at_val('ELSE'):
             self._advance()  # ELSE
             if self._at_val('IF'):
-                ei_loc = self._loc()
                 self._advance()  # IF
                 ei_cond = self._parse_arith_expr(0)
                 self._skip_newlines()
-                ei_body = []
-                if self._at(TT.LBRACE):
-                    self._advance()
-                    self._skip_newlines()
-                    while not self._at(TT.RBRACE) and not self._at(TT.EOF):
-                        self._skip_newlines()
-                        if self._at(TT.RBRACE) or self._at(TT.EOF):
-                            break
-                        saved = self.pos
-                        s = self._parse_prop_statement()
-                        if s is not None:
-                            ei_body.append(s)
-                        if self.pos == saved:
-                            _st = self._cur()
-                            self.warnings.append(
-                                f"L{_st.line}:{_st.col}: Parser stuck in ELSE IF body at "
-                                f"{_st.type.name} ({_st.value!r}), force advancing")
-                            self._advance()
-                    if self._at(TT.RBRACE):
-                        self._advance()
+                ei_body = self._parse_prop_brace_body('ELSE IF body')
                 self._consume_eol()
                 self._skip_newlines()
                 elseifs.append((ei_cond, ei_body))
             else:
                 self._skip_newlines()
-                if self._at(TT.LBRACE):
-                    self._advance()
-                    self._skip_newlines()
-                    while not self._at(TT.RBRACE) and not self._at(TT.EOF):
-                        self._skip_newlines()
-                        if self._at(TT.RBRACE) or self._at(TT.EOF):
-                            break
-                        saved = self.pos
-                        s = self._parse_prop_statement()
-                        if s is not None:
-                            else_body.append(s)
-                        if self.pos == saved:
-                            _st = self._cur()
-                            self.warnings.append(
-                                f"L{_st.line}:{_st.col}: Parser stuck in ELSE body at "
-                                f"{_st.type.name} ({_st.value!r}), force advancing")
-                            self._advance()
-                    if self._at(TT.RBRACE):
-                        self._advance()
+                else_body = self._parse_prop_brace_body('ELSE body')
                 self._consume_eol()
                 break
         return ast.IfExpr(condition=cond, then_body=then_body,
-                          elseifs=elseifs, else_body=else_body, **loc)
+                          elseifs=elseifs, else_body=else_body, line=line, col=col)
+
+    def _parse_prop_brace_body(self, where):
+        """Parse the ``{ ... }`` body of an IF/ELSE IF/ELSE branch.
+
+        Returns an empty list when no ``{`` follows.  *where* names the
+        branch in the warning for a statement that consumes nothing.
+        """
+        body = []
+        tokens = self.tokens
+        if tokens[self.pos].type is not TT.LBRACE:
+            return body
+        self.pos += 1
+        parse_statement = self._parse_prop_statement
+        newline = TT.NEWLINE
+        while True:
+            t = tokens[self.pos]
+            while t.type is newline:
+                self.pos += 1
+                t = tokens[self.pos]
+            if t.type is TT.RBRACE or t.type is TT.EOF:
+                break
+            saved = self.pos
+            s = parse_statement()
+            if s is not None:
+                body.append(s)
+            if self.pos == saved:
+                self._warn(t,
+                    f"Parser stuck in {where} at "
+                    f"{t.type.name} ({t.value!r}), force advancing")
+                self.pos += 1
+        if t.type is TT.RBRACE:
+            self.pos += 1
+        return body
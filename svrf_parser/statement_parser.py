@@ -1,172 +1,216 @@
 """Statement parsing mixin for the SVRF parser."""
 
-from .tokens import TokenType, Token
+from .tokens import Token, TT
 from . import ast_nodes as ast
-from .parser_base import _DIRECTIVE_HEADS
-
-TT = TokenType
+from .parser_base import _DIRECTIVE_HEADS, _NUMBER_TYPES
+
+# Preprocessor tokens ending a { } body (see _parse_block_body)
+_PP_SCOPE_END_TYPES = frozenset((TT.PP_ENDIF, TT.PP_ELSE))
+# Closing delimiters that may appear at statement level (see _parse_statement)
+_CLOSER_TYPES = frozenset((TT.RBRACE, TT.RBRACKET, TT.RPAREN, TT.COMMA))
+# Line-leading tokens continuing the previous line's expression
+_CONTINUATION_TYPES = frozenset((
+    TT.STAR, TT.PLUS, TT.SLASH, TT.LT, TT.GT_OP, TT.LE, TT.GE,
+    TT.EQEQ, TT.BANGEQ, TT.COLON, TT.SEMICOLON,
+    TT.FLOAT, TT.STRING, TT.MINUS, TT.BANG))
+
+# Directive arguments kept as their value (see _parse_directive)
+_DIRECTIVE_VALUE_TYPES = frozenset((TT.STRING, TT.INTEGER, TT.FLOAT, TT.IDENT))
+
+# Words that continue a generic directive even when spelled in lowercase
+# (see _parse_directive): directive heads plus their argument keywords.
+_DIRECTIVE_WORDS = _DIRECTIVE_HEADS | frozenset({
+    'SYSTEM', 'GDSII', 'OASIS', 'SPICE', 'PRIMARY', 'PATH',
+    'RESULTS', 'DATABASE', 'SUMMARY', 'REPORT', 'KEEP', 'CHECK',
+    'MAXIMUM', 'INCREMENTAL', 'MAGNIFY', 'PROCESS', 'BOX',
+    'RECORD', 'CLONE', 'ROTATED', 'PLACEMENTS', 'INPUT',
+    'EXCEPTION', 'SEVERITY', 'ALLOW', 'DUPLICATE', 'CELL',
+    'ERROR', 'DEPTH', 'BASE', 'ORDER', 'CASE', 'COMPARE',
+    'OPTION', 'NAME', 'STRICT', 'PREFER', 'PINS', 'RECOGNIZE',
+    'GATES', 'ABORT', 'SUPPLY', 'IGNORE', 'PORTS', 'REDUCE',
+    'PARALLEL', 'SERIES', 'SPLIT', 'FILTER', 'UNUSED',
+    'PROPERTY', 'GROUND', 'POWER', 'SPICE', 'MULTIPLIER',
+    'REPLICATE', 'DEVICES', 'SWAPPABLE', 'CAPACITOR',
+    'BIPOLAR', 'MOS', 'DIODES', 'CAPACITORS', 'RESISTORS',
+    'SOFTCHK', 'CONTACT', 'COLON', 'CONNECT',
+    'EXCLUDE', 'FALSE', 'NOTCH', 'NONSIMPLE', 'ACUTE',
+    'SKEW', 'OFFGRID', 'EMPTY', 'ALL', 'NAR',
+    'YES', 'NO', 'NONE', 'ON', 'TRUE',
+    'DENSITY', 'HIER', 'ASCII', 'HSPICE', 'LUMPED',
+    'DISTRIBUTED', 'DIRECTORY', 'QUERY', 'XRC', 'CCI',
+    'NETLIST', 'CAPACITANCE', 'RESISTANCE', 'LENGTH',
+    'FF', 'OHM', 'PRECISION', 'RESOLUTION', 'MAGNIFY',
+    'AUTO', 'MANUAL', 'MASK',
+})
 
 
 class StatementMixin:
     """Mixin providing statement-level parsing for the SVRF parser."""
 
+    __slots__ = ()
+
     # ------------------------------------------------------------------
     # Main entry point
     # ------------------------------------------------------------------
     def parse(self):
         stmts = self._parse_body(top_level=True)
-        return ast.Program(statements=stmts, **self._loc())
+        line, col = self._loc()
+        return ast.Program(statements=stmts, line=line, col=col)
 
     def _parse_body(self, top_level=False, stop_at=None):
         """Parse a sequence of statements.
         stop_at: set of token types or ident values that end the body.
         """
         stmts = []
-        while not self._at(TT.EOF):
-            self._skip_newlines()
-            if self._at(TT.EOF):
+        # Bound once: this loop runs for every statement in the deck
+        at = self._at
+        skip_newlines = self._skip_newlines
+        parse_statement = self._parse_statement
+        while not at(TT.EOF):
+            skip_newlines()
+            if at(TT.EOF):
                 break
             if stop_at and self._should_stop(stop_at):
                 break
             saved = self.pos
-            stmt = self._parse_statement()
+            stmt = parse_statement()
             if stmt is not None:
                 stmts.append(stmt)
             if self.pos == saved:
                 t = self._cur()
-                self.warnings.append(
-                    f"L{t.line}:{t.col}: Parser stuck at {t.type.name} "
+                self._warn(t,
+                    f"Parser stuck at {t.type.name} "
                     f"({t.value!r}), force advancing"
                 )
                 self._advance()
         return stmts
 
     def _should_stop(self, stop_at):
+        # A token type in stop_at, or an identifier whose uppercase spelling
+        # is (.upper is None for every other token type)
         t = self._cur()
-        if t.type in stop_at:
-            return True
-        if t.type == TT.IDENT and t.value.upper() in stop_at:
-            return True
-        # Check preprocessor tokens
-        if t.type in (TT.PP_ELSE, TT.PP_ENDIF, TT.PP_ENDCRYPT):
-            if t.type in stop_at:
-                return True
-        return False
+        return t.type in stop_at or t.upper in stop_at
 
     # ------------------------------------------------------------------
     # Top-level statement dispatch
     # ------------------------------------------------------------------
-    def _parse_statement(self):
-        t = self._cur()
-        tt = t.type
-
+    # Token type -> statement handler name.  ParserBase.__init_subclass__
+    # resolves it to a list of functions indexed by type, so a statement
+    # costs one list index instead of a chain of type comparisons; types
+    # not listed go to _parse_unknown_token.
+    _STMT_TYPE_DISPATCH = {
         # Preprocessor
-        if tt == TT.PP_DEFINE:
-            return self._parse_define()
-        if tt in (TT.PP_IFDEF, TT.PP_IFNDEF):
-            return self._parse_ifdef()
-        if tt == TT.PP_INCLUDE:
-            return self._parse_include()
-        if tt == TT.PP_UNDEFINE:
-            return self._parse_undefine()
-        if tt in (TT.PP_ENCRYPT, TT.PP_DECRYPT):
-            return self._parse_encrypted()
-        if tt == TT.PP_ELSE:
-            self._advance()
-            self._consume_eol()
-            return None  # handled by _parse_ifdef; orphaned at top level
-        if tt == TT.PP_ENDIF:
-            self._advance()
-            self._consume_eol()
-            return None  # handled by _parse_ifdef; orphaned at top level
-        if tt == TT.PP_ENDCRYPT:
-            self._advance()
-            self._consume_eol()
-            return None
-        if tt == TT.ENCRYPTED:
-            loc = self._loc()
-            content = self._advance().value
-            self._consume_eol()
-            return ast.EncryptedBlock(content=content, **loc)
-
+        TT.PP_DEFINE: '_parse_define',
+        TT.PP_IFDEF: '_parse_ifdef',
+        TT.PP_IFNDEF: '_parse_ifdef',
+        TT.PP_INCLUDE: '_parse_include',
+        TT.PP_UNDEFINE: '_parse_undefine',
+        TT.PP_ENCRYPT: '_parse_encrypted',
+        TT.PP_DECRYPT: '_parse_encrypted',
+        # #ELSE/#ENDIF are handled by _parse_ifdef; orphaned at top level
+        TT.PP_ELSE: '_skip_orphan_directive',
+        TT.PP_ENDIF: '_skip_orphan_directive',
+        TT.PP_ENDCRYPT: '_skip_orphan_directive',
+        TT.ENCRYPTED: '_parse_encrypted_content',
         # Newline / EOF
-        if tt == TT.NEWLINE:
-            self._advance()
-            return None
-        if tt == TT.EOF:
-            return None
-
+        TT.NEWLINE: '_skip_token',
+        TT.EOF: '_parse_nothing',
         # Closing delimiters at statement level — legitimate when #IFDEF/#ELSE
-        # splits a rule check block, property block, or parenthesized expression
-        # across preprocessor boundaries.
-        if tt in (TT.RBRACE, TT.RBRACKET, TT.RPAREN, TT.COMMA):
-            self._advance()
-            return None
-
+        # splits a rule check block, property block, or parenthesized
+        # expression across preprocessor boundaries.
+        **dict.fromkeys(_CLOSER_TYPES, '_skip_token'),
         # Identifier-based dispatch
-        if tt == TT.IDENT:
-            return self._dispatch_ident()
-
-        # Digit-prefixed names: INTEGER immediately followed by IDENT
-        # e.g. 125xmy4_S_3_DFM1 { ... } or 4t_para_gate { ... }
-        if tt == TT.INTEGER:
-            nxt = self._peek()
-            if nxt.type == TT.IDENT:
-                nxt2 = self._peek(2)
-                # digit-name { => rule check block
-                if nxt2 and (nxt2.type == TT.LBRACE or
-                    (nxt2.type == TT.NEWLINE and self._peek_skip_newlines(2).type == TT.LBRACE)):
-                    return self._parse_rule_check_block()
-                # digit-name = => assignment
-                if nxt2 and nxt2.type == TT.EQUALS:
-                    return self._parse_assignment()
-                # digit-name as bare expression (e.g. 18_15V_GATE NOT OD18)
-                return self._parse_bare_expression()
-
+        TT.IDENT: '_dispatch_ident',
         # @ description line (inside rule check blocks)
-        if tt == TT.AT:
-            return self._parse_at_description()
-
+        TT.AT: '_parse_at_description',
         # [ property block (inside DMACRO)
-        if tt == TT.LBRACKET:
-            return self._parse_property_block()
-
+        TT.LBRACKET: '_parse_property_block',
         # Parenthesized expression: e.g. (NW INTERACT NWDMY) AND TrGATE
         # or standalone (EXT ...) / (INT ...) at any level
-        if tt == TT.LPAREN:
-            return self._parse_bare_expression()
-
+        TT.LPAREN: '_parse_bare_expression',
+        # Number followed by a word: 18 NOT OD18, or a name spelled with a
+        # space after its leading digits
+        TT.INTEGER: '_parse_integer_statement',
         # Continuation tokens from multiline expressions (operators, numbers,
         # strings, etc. that belong to the previous line's expression).
-        # Consume the rest of the line silently.
-        if tt in (TT.STAR, TT.PLUS, TT.SLASH, TT.LT, TT.GT_OP, TT.LE, TT.GE,
-                  TT.EQEQ, TT.BANGEQ, TT.COLON, TT.SEMICOLON,
-                  TT.FLOAT, TT.STRING, TT.MINUS, TT.BANG):
-            self._skip_to_eol()
-            self._consume_eol()
-            return None
+        **dict.fromkeys(_CONTINUATION_TYPES, '_skip_continuation_line'),
+    }
+    _STMT_TYPE_DEFAULT = '_parse_unknown_token'
+
+    def _parse_statement(self):
+        return self._stmt_type_funcs[self.tokens[self.pos].type](self)
+
+    def _skip_token(self):
+        self._advance()
+        return None
+
+    def _skip_orphan_directive(self):
+        self._advance()
+        self._consume_eol()
+        return None
+
+    def _parse_nothing(self):
+        return None
+
+    def _parse_encrypted_content(self):
+        line, col = self._loc()
+        content = self._advance().value
+        self._consume_eol()
+        return ast.EncryptedBlock(content=content, line=line, col=col)
+
+    def _skip_continuation_line(self):
+        # Consume the rest of the line silently
+        self._skip_line()
+        return None
+
+    def _parse_integer_statement(self):
+        # The lexer joins digits only to an adjacent word, so "1 X" is still
+        # INTEGER + IDENT here; a lone number is not a statement.
+        if self._peek1().type is not TT.IDENT:
+            return self._parse_unknown_token()
+        nxt2 = self._peek2()
+        # digit name { => rule check block
+        if nxt2.type is TT.LBRACE or (
+                nxt2.type is TT.NEWLINE and
+                self._peek_skip_newlines(2).type is TT.LBRACE):
+            return self._parse_rule_check_block()
+        # digit name = => assignment
+        if nxt2.type is TT.EQUALS:
+            return self._parse_assignment()
+        return self._parse_bare_expression()
+
+    def _parse_statement_name(self):
+        """Consume a statement name; a number before it (1 X) is part of it."""
+        name = ''
+        if self._at(TT.INTEGER) and self._peek1().type is TT.IDENT:
+            name = self._advance().raw
+        return name + self._advance().value
 
-        # Unknown token — produce ErrorNode and skip to next statement boundary
+    def _parse_unknown_token(self):
+        """Record an ErrorNode and skip to the next statement boundary."""
         t = self._cur()
-        loc = self._loc()
-        skipped = []
-        while not self._at_eol():
-            skipped.append(str(self._advance().value))
-        skipped_text = ' '.join(skipped) if skipped else str(t.value)
+        line, col = self._loc()
+        skipped = self._rest_of_line()
+        skipped_text = ' '.join(skipped) if skipped else t.raw
         if not skipped:
             self._advance()
         self._consume_eol()
-        self.warnings.append(
-            f"L{t.line}:{t.col}: Skipped unknown token {t.type.name} ({t.value!r})"
+        self._warn(t,
+            f"Skipped unknown token {t.type.name} ({t.value!r})"
         )
         return ast.ErrorNode(
             message=f"Unrecognized token {t.type.name} ({t.value!r})",
-            skipped_text=skipped_text, **loc)
+            skipped_text=skipped_text, line=line, col=col)
 
     # ------------------------------------------------------------------
     # Identifier dispatch
     # ------------------------------------------------------------------
+    # Statement keyword -> handler name.  Directive heads default to
+    # _parse_directive; the explicit entries below take precedence.
     _STMT_DISPATCH = {
+        **dict.fromkeys(_DIRECTIVE_HEADS, '_parse_directive'),
+        'NET': '_parse_net_statement',
+        'TRACE': '_parse_trace',
         'LAYER': '_parse_layer',
         'VARIABLE': '_parse_variable',
         'CONNECT': '_parse_connect',
@@ -184,77 +228,74 @@ class StatementMixin:
     }
 
     def _dispatch_ident(self):
-        t = self._cur()
-        name = t.value
-        upper = name.upper()
-
-        nxt = self._peek()
+        upper = self._cur().upper
+        # One look at the next token's type decides the two composite forms
+        nxt_tt = self._peek1().type
 
         # Assignment: name = expression
-        if nxt.type == TT.EQUALS:
+        if nxt_tt is TT.EQUALS:
             return self._parse_assignment()
 
         # Rule check block: name { ... }  (the { may be on the next line)
         # Exclude control-flow keywords (ELSE, IF) which also use { }.
-        if upper not in ('ELSE', 'IF'):
-            if nxt.type == TT.LBRACE or (nxt.type == TT.NEWLINE and self._peek_skip_newlines().type == TT.LBRACE):
+        if (nxt_tt is TT.LBRACE
+                or (nxt_tt is TT.NEWLINE
+                    and self._peek_skip_newlines().type is TT.LBRACE)):
+            if upper != 'ELSE' and upper != 'IF':
                 return self._parse_rule_check_block()
 
-        # TRACE needs lookahead for PROPERTY
-        if upper == 'TRACE':
-            if self._peek().type == TT.IDENT and self._peek().value.upper() == 'PROPERTY':
-                return self._parse_trace_property()
-            return self._parse_directive()
+        # Dispatch table lookup: statement keywords and directive heads
+        handler = self._stmt_funcs.get(upper)
+        if handler is not None:
+            return handler(self)
 
-        # Dispatch table lookup
-        handler_name = self._STMT_DISPATCH.get(upper)
-        if handler_name:
-            return getattr(self, handler_name)()
+        # Bare expression fallback
+        return self._parse_bare_expression()
 
-        # Multi-word directives
+    def _parse_trace(self):
+        # TRACE needs lookahead for PROPERTY
+        nxt = self._peek1()
+        if nxt.type == TT.IDENT and nxt.upper == 'PROPERTY':
+            return self._parse_trace_property()
+        return self._parse_directive()
+
+    def _parse_net_statement(self):
         # NET AREA RATIO / NET INTERACT are DRC ops inside rule check blocks,
         # not directives — let them fall through to bare expression parsing.
-        if upper in _DIRECTIVE_HEADS:
-            if upper == 'NET' and self._block_depth > 0:
-                nxt = self._peek()
-                if nxt.type == TT.IDENT and nxt.value.upper() in ('AREA', 'INTERACT'):
-                    return self._parse_bare_expression()
-            return self._parse_directive()
-
-        # Bare expression fallback
-        return self._parse_bare_expression()
+        if self._block_depth > 0:
+            nxt = self._peek1()
+            if nxt.type == TT.IDENT and nxt.upper in ('AREA', 'INTERACT'):
+                return self._parse_bare_expression()
+        return self._parse_directive()
 
     # ------------------------------------------------------------------
     # Preprocessor
     # ------------------------------------------------------------------
     def _parse_define(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # #DEFINE
         name = ''
         value = None
         if self._at(TT.IDENT):
             name = self._advance().value
         # Rest of line is the value
-        parts = []
-        while not self._at_eol():
-            parts.append(str(self._advance().value))
+        parts = self._rest_of_line()
         value = ' '.join(parts) if parts else None
         self._consume_eol()
-        return ast.Define(name=name, value=value, **loc)
+        return ast.Define(name=name, value=value, line=line, col=col)
 
     def _parse_undefine(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # #UNDEFINE
         name = ''
         if self._at(TT.IDENT):
             name = self._advance().value
-        self._skip_to_eol()
-        self._consume_eol()
-        return ast.Directive(keywords=['#UNDEFINE'], arguments=[name], **loc)
+        self._skip_line()
+        return ast.Directive(keywords=['#UNDEFINE'], arguments=[name], line=line, col=col)
 
     def _parse_cmacro_invocation(self):
         """Parse standalone CMACRO invocation: CMACRO name arg1 arg2 ..."""
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # CMACRO
         keywords = ['CMACRO']
         args = []
@@ -262,41 +303,41 @@ class StatementMixin:
             t = self._cur()
             if t.type == TT.IDENT:
                 args.append(self._advance().value)
-            elif t.type in (TT.INTEGER, TT.FLOAT):
-                args.append(str(self._advance().value))
+            elif t.type in _NUMBER_TYPES:
+                args.append(self._advance().raw)
             elif t.type == TT.STRING:
                 args.append(self._advance().value)
             else:
-                self.warnings.append(
-                    f"L{t.line}:{t.col}: Unexpected token {t.type.name} "
+                self._warn(t,
+                    f"Unexpected token {t.type.name} "
                     f"({t.value!r}) in CMACRO invocation, skipping")
                 self._advance()
         self._consume_eol()
-        return ast.Directive(keywords=keywords, arguments=args, **loc)
+        return ast.Directive(keywords=keywords, arguments=args, line=line, col=col)
 
     def _parse_polygon(self):
         """Parse POLYGON statement: POLYGON x1 y1 x2 y2 name"""
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # POLYGON
         args = []
         while not self._at_eol():
             t = self._cur()
             if t.type == TT.IDENT:
                 args.append(self._advance().value)
-            elif t.type in (TT.INTEGER, TT.FLOAT):
-                args.append(str(self._advance().value))
+            elif t.type in _NUMBER_TYPES:
+                args.append(self._advance().raw)
             elif t.type == TT.STRING:
                 args.append(self._advance().value)
             else:
-                self.warnings.append(
-                    f"L{t.line}:{t.col}: Unexpected token {t.type.name} "
+                self._warn(t,
+                    f"Unexpected token {t.type.name} "
                     f"({t.value!r}) in POLYGON statement, skipping")
                 self._advance()
         self._consume_eol()
-        return ast.Directive(keywords=['POLYGON'], arguments=args, **loc)
+        return ast.Directive(keywords=['POLYGON'], arguments=args, line=line, col=col)
 
     def _parse_ifdef(self):
-        loc = self._loc()
+        line, col = self._loc()
         tok = self._advance()  # #IFDEF or #IFNDEF
         negated = tok.type == TT.PP_IFNDEF
         name = ''
@@ -304,9 +345,7 @@ class StatementMixin:
         if self._at(TT.IDENT):
             name = self._advance().value
         # Optional value on same line
-        parts = []
-        while not self._at_eol():
-            parts.append(str(self._advance().value))
+        parts = self._rest_of_line()
         value = ' '.join(parts) if parts else None
         self._consume_eol()
 
@@ -348,20 +387,19 @@ class StatementMixin:
                 self._advance()
 
         return ast.IfDef(name=name, value=value, negated=negated,
-                         then_body=then_body, else_body=else_body, **loc)
+                         then_body=then_body, else_body=else_body, line=line, col=col)
 
     def _parse_include(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # #INCLUDE
         path = ''
         if self._at(TT.STRING):
             path = self._advance().value
-        self._skip_to_eol()
-        self._consume_eol()
-        return ast.Include(path=path, **loc)
+        self._skip_line()
+        return ast.Include(path=path, line=line, col=col)
 
     def _parse_encrypted(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # #ENCRYPT or #DECRYPT
         self._consume_eol()
         content = ''
@@ -371,22 +409,22 @@ class StatementMixin:
         if self._at(TT.PP_ENDCRYPT):
             self._advance()
             self._consume_eol()
-        return ast.EncryptedBlock(content=content, **loc)
+        return ast.EncryptedBlock(content=content, line=line, col=col)
 
     # ------------------------------------------------------------------
     # LAYER
     # ------------------------------------------------------------------
     def _parse_layer(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # LAYER
 
         # LAYER MAP ...
-        if self._at(TT.IDENT) and self._cur().value.upper() == 'MAP':
+        if self._at(TT.IDENT) and self._cur().upper == 'MAP':
             self._advance()  # MAP
             gds_num = self._consume_int()
             map_type = 'DATATYPE'
             if self._at(TT.IDENT):
-                mt = self._cur().value.upper()
+                mt = self._cur().upper
                 if mt in ('DATATYPE', 'TEXTTYPE'):
                     map_type = mt
                     self._advance()
@@ -414,15 +452,14 @@ class StatementMixin:
                         break
             return ast.LayerMap(gds_num=gds_num, map_type=map_type,
                                 type_num=type_num, internal_num=internal_num,
-                                **loc)
+                                line=line, col=col)
 
         # LAYER IGNORE ...
-        if self._at(TT.IDENT) and self._cur().value.upper() == 'IGNORE':
+        if self._at(TT.IDENT) and self._cur().upper == 'IGNORE':
             self._advance()  # IGNORE
             num = self._consume_int()
-            self._skip_to_eol()
-            self._consume_eol()
-            return ast.LayerDef(name='IGNORE', numbers=[num], **loc)
+            self._skip_line()
+            return ast.LayerDef(name='IGNORE', numbers=[num], line=line, col=col)
 
         # LAYER name number [number...]
         name = ''
@@ -436,9 +473,8 @@ class StatementMixin:
                 nums.append(self._advance().value)
             else:
                 break
-        self._skip_to_eol()
-        self._consume_eol()
-        return ast.LayerDef(name=name, numbers=nums, **loc)
+        self._skip_line()
+        return ast.LayerDef(name=name, numbers=nums, line=line, col=col)
 
     def _consume_int(self):
         if self._at(TT.INTEGER):
@@ -451,36 +487,36 @@ class StatementMixin:
     # VARIABLE
     # ------------------------------------------------------------------
     def _parse_variable(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # VARIABLE
         name = ''
-        if self._at(TT.IDENT):
-            name = self._advance().value
-        elif self._at(TT.INTEGER) and self._peek().type == TT.IDENT:
-            # Handle names starting with digits (e.g. 2xmn_DN_6_WINDOW)
-            name = str(self._advance().value) + self._advance().value
+        if self._at(TT.IDENT) or self._at(TT.INTEGER) and \
+                self._peek1().type is TT.IDENT:
+            name = self._parse_statement_name()
         # Consume multiple string values: VARIABLE POWER_NAME "?VDD?" "?VCC?"
         if self._at(TT.STRING):
+            first = self._cur()
             parts = []
             while self._at(TT.STRING) and not self._at_eol():
                 parts.append(self._advance().value)
-            expr = ast.StringLiteral(value=' '.join(parts), **self._loc()) if parts else None
+            expr = ast.StringLiteral(value=' '.join(parts), line=first.line,
+                                     col=first.col) if parts else None
         else:
             expr = self._parse_line_expression()
         self._consume_eol()
-        return ast.VariableDef(name=name, expr=expr, **loc)
+        return ast.VariableDef(name=name, expr=expr, line=line, col=col)
 
     # ------------------------------------------------------------------
     # CONNECT / SCONNECT
     # ------------------------------------------------------------------
     def _parse_connect(self):
-        loc = self._loc()
+        line, col = self._loc()
         tok = self._advance()
-        soft = tok.value.upper() == 'SCONNECT'
+        soft = tok.upper == 'SCONNECT'
         layers = []
         via = None
         while not self._at_eol():
-            if self._at(TT.IDENT) and self._cur().value.upper() == 'BY':
+            if self._at(TT.IDENT) and self._cur().upper == 'BY':
                 self._advance()
                 if self._at(TT.IDENT):
                     via = self._advance().value
@@ -488,19 +524,18 @@ class StatementMixin:
             if self._at(TT.IDENT):
                 layers.append(self._advance().value)
             elif self._at(TT.INTEGER):
-                layers.append(str(self._advance().value))
+                layers.append(self._advance().raw)
             else:
                 break
-        self._skip_to_eol()
-        self._consume_eol()
+        self._skip_line()
         return ast.Connect(soft=soft, layers=layers,
-                           via_layer=via, **loc)
+                           via_layer=via, line=line, col=col)
 
     # ------------------------------------------------------------------
     # DEVICE
     # ------------------------------------------------------------------
     def _parse_device(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # DEVICE
         dev_type = None
         dev_name = None
@@ -527,7 +562,7 @@ class StatementMixin:
         cmacro = None
         cmacro_args = []
         while not self._at_eol():
-            if self._at(TT.IDENT) and self._cur().value.upper() == 'CMACRO':
+            if self._at(TT.IDENT) and self._cur().upper == 'CMACRO':
                 self._advance()
                 if self._at(TT.IDENT):
                     cmacro = self._advance().value
@@ -546,8 +581,8 @@ class StatementMixin:
                             cmacro_args.append(-self._advance().value)
                     else:
                         _st = self._cur()
-                        self.warnings.append(
-                            f"L{_st.line}:{_st.col}: Unexpected token {_st.type.name} "
+                        self._warn(_st,
+                            f"Unexpected token {_st.type.name} "
                             f"({_st.value!r}) in DEVICE CMACRO args, skipping")
                         self._advance()
                 break
@@ -574,20 +609,18 @@ class StatementMixin:
         self._consume_eol()
         return ast.Device(device_type=dev_type, device_name=dev_name,
                           seed_layer=seed, pins=pins, aux_layers=aux,
-                          cmacro=cmacro, cmacro_args=cmacro_args, **loc)
+                          cmacro=cmacro, cmacro_args=cmacro_args, line=line, col=col)
 
     # ------------------------------------------------------------------
     # DMACRO
     # ------------------------------------------------------------------
     def _parse_dmacro(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # DMACRO
         name = ''
-        # Handle digit-prefixed names: INTEGER + IDENT (e.g. 3T_MOS_PRO)
-        if self._at(TT.INTEGER) and self._peek().type == TT.IDENT:
-            name = str(self._advance().value)
-        if self._at(TT.IDENT):
-            name += self._advance().value
+        if self._at(TT.IDENT) or self._at(TT.INTEGER) and \
+                self._peek1().type is TT.IDENT:
+            name = self._parse_statement_name()
         params = []
         while not self._at_eol() and not self._at(TT.LBRACE):
             if self._at(TT.IDENT):
@@ -602,7 +635,7 @@ class StatementMixin:
             body = self._parse_block_body()
         else:
             self._consume_eol()
-        return ast.DMacro(name=name, params=params, body=body, **loc)
+        return ast.DMacro(name=name, params=params, body=body, line=line, col=col)
 
     def _parse_block_body(self):
         """Parse statements inside { } until closing brace."""
@@ -613,7 +646,7 @@ class StatementMixin:
             if self._at(TT.RBRACE) or self._at(TT.EOF):
                 break
             # Stop at preprocessor scope-ending tokens
-            if self._cur().type in (TT.PP_ENDIF, TT.PP_ELSE):
+            if self._cur().type in _PP_SCOPE_END_TYPES:
                 break
             saved = self.pos
             s = self._parse_statement()
@@ -621,8 +654,8 @@ class StatementMixin:
                 stmts.append(s)
             if self.pos == saved:
                 t = self._cur()
-                self.warnings.append(
-                    f"L{t.line}:{t.col}: Parser stuck in block body at "
+                self._warn(t,
+                    "Parser stuck in block body at "
                     f"{t.type.name} ({t.value!r}), force advancing")
                 self._advance()
         if self._at(TT.RBRACE):
@@ -635,7 +668,7 @@ class StatementMixin:
     # ATTACH, GROUP, TRACE PROPERTY
     # ------------------------------------------------------------------
     def _parse_attach(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # ATTACH
         layer = ''
         net = ''
@@ -644,13 +677,12 @@ class StatementMixin:
         if self._at(TT.IDENT):
             net = self._advance().value
         elif self._at(TT.INTEGER):
-            net = str(self._advance().value)
-        self._skip_to_eol()
-        self._consume_eol()
-        return ast.Attach(layer=layer, net=net, **loc)
+            net = self._advance().raw
+        self._skip_line()
+        return ast.Attach(layer=layer, net=net, line=line, col=col)
 
     def _parse_group(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # GROUP
         name = ''
         pattern = ''
@@ -658,12 +690,11 @@ class StatementMixin:
             name = self._advance().value
         if self._at(TT.IDENT):
             pattern = self._advance().value
-        self._skip_to_eol()
-        self._consume_eol()
-        return ast.Group(name=name, pattern=pattern, **loc)
+        self._skip_line()
+        return ast.Group(name=name, pattern=pattern, line=line, col=col)
 
     def _parse_trace_property(self):
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # TRACE
         self._advance()  # PROPERTY
         device = ''
@@ -681,73 +712,49 @@ class StatementMixin:
             if self._at(TT.IDENT):
                 args.append(self._advance().value)
             elif self._at(TT.INTEGER):
-                args.append(str(self._advance().value))
+                args.append(self._advance().raw)
             elif self._at(TT.FLOAT):
-                args.append(str(self._advance().value))
+                args.append(self._advance().raw)
             elif self._at(TT.STRING):
                 args.append(self._advance().value)
             else:
                 break
         self._consume_eol()
-        return ast.TraceProperty(device=device, args=args, **loc)
+        return ast.TraceProperty(device=device, args=args, line=line, col=col)
 
     # ------------------------------------------------------------------
     # Generic directive parser
     # ------------------------------------------------------------------
     def _parse_directive(self):
-        loc = self._loc()
+        line, col = self._loc()
         keywords = []
-        # Greedily consume uppercase identifiers as keywords
-        while self._at(TT.IDENT):
-            val = self._cur().value
-            upper = val.upper()
+        # Greedily consume uppercase identifiers as keywords, walking the
+        # token list by index
+        tokens = self.tokens
+        pos = self.pos
+        ident, equals = TT.IDENT, TT.EQUALS
+        while pos < self.length and tokens[pos].type is ident:
+            t = tokens[pos]
             # Stop if next is EQUALS (it's an assignment, not a keyword)
-            if self._peek().type == TT.EQUALS:
+            if pos + 1 < self.length and tokens[pos + 1].type is equals:
                 break
             # Stop if this looks like a non-keyword argument (lowercase layer name
             # after we already have keywords, and it's not a known directive word)
-            if keywords and upper not in _DIRECTIVE_HEADS and upper not in {
-                'SYSTEM', 'GDSII', 'OASIS', 'SPICE', 'PRIMARY', 'PATH',
-                'RESULTS', 'DATABASE', 'SUMMARY', 'REPORT', 'KEEP', 'CHECK',
-                'MAXIMUM', 'INCREMENTAL', 'MAGNIFY', 'PROCESS', 'BOX',
-                'RECORD', 'CLONE', 'ROTATED', 'PLACEMENTS', 'INPUT',
-                'EXCEPTION', 'SEVERITY', 'ALLOW', 'DUPLICATE', 'CELL',
-                'ERROR', 'DEPTH', 'BASE', 'ORDER', 'CASE', 'COMPARE',
-                'OPTION', 'NAME', 'STRICT', 'PREFER', 'PINS', 'RECOGNIZE',
-                'GATES', 'ABORT', 'SUPPLY', 'IGNORE', 'PORTS', 'REDUCE',
-                'PARALLEL', 'SERIES', 'SPLIT', 'FILTER', 'UNUSED',
-                'PROPERTY', 'GROUND', 'POWER', 'SPICE', 'MULTIPLIER',
-                'REPLICATE', 'DEVICES', 'SWAPPABLE', 'CAPACITOR',
-                'BIPOLAR', 'MOS', 'DIODES', 'CAPACITORS', 'RESISTORS',
-                'SOFTCHK', 'CONTACT', 'COLON', 'CONNECT',
-                'EXCLUDE', 'FALSE', 'NOTCH', 'NONSIMPLE', 'ACUTE',
-                'SKEW', 'OFFGRID', 'EMPTY', 'ALL', 'NAR',
-                'YES', 'NO', 'NONE', 'ON', 'TRUE',
-                'DENSITY', 'HIER', 'ASCII', 'HSPICE', 'LUMPED',
-                'DISTRIBUTED', 'DIRECTORY', 'QUERY', 'XRC', 'CCI',
-                'NETLIST', 'CAPACITANCE', 'RESISTANCE', 'LENGTH',
-                'FF', 'OHM', 'PRECISION', 'RESOLUTION', 'MAGNIFY',
-                'AUTO', 'MANUAL', 'MASK',
-            } and not upper.isupper():
+            upper = t.upper
+            if keywords and upper not in _DIRECTIVE_WORDS and not upper.isupper():
                 break
-            keywords.append(self._advance().value)
+            keywords.append(t.value)
+            pos += 1
+        self.pos = pos
         # Collect remaining tokens on the line as arguments
         arguments = []
         while not self._at_eol():
             t = self._cur()
-            if t.type == TT.STRING:
-                arguments.append(self._advance().value)
-            elif t.type == TT.INTEGER:
-                arguments.append(self._advance().value)
-            elif t.type == TT.FLOAT:
-                arguments.append(self._advance().value)
-            elif t.type == TT.IDENT:
+            if t.type in _DIRECTIVE_VALUE_TYPES:
                 arguments.append(self._advance().value)
             elif t.type == TT.MINUS:
                 self._advance()
-                if self._at(TT.INTEGER):
-                    arguments.append(-self._advance().value)
-                elif self._at(TT.FLOAT):
+                if self._cur().type in _NUMBER_TYPES:
                     arguments.append(-self._advance().value)
                 else:
                     arguments.append('-')
@@ -755,24 +762,20 @@ class StatementMixin:
                 # Property block
                 pb = self._parse_property_block()
                 return ast.Directive(keywords=keywords, arguments=arguments,
-                                     property_block=pb, **loc)
+                                     property_block=pb, line=line, col=col)
             else:
                 # Operators and delimiters are valid in directive arguments
                 # (e.g. > for redirect, () for grouping, comparisons, etc.)
-                arguments.append(str(self._advance().value))
+                arguments.append(self._advance().raw)
         self._consume_eol()
-        return ast.Directive(keywords=keywords, arguments=arguments, **loc)
+        return ast.Directive(keywords=keywords, arguments=arguments, line=line, col=col)
 
     # ------------------------------------------------------------------
     # Layer assignment: name = expression
     # ------------------------------------------------------------------
     def _parse_assignment(self):
-        loc = self._loc()
-        # Handle digit-prefixed names: INTEGER + IDENT
-        name = ''
-        if self._at(TT.INTEGER) and self._peek().type == TT.IDENT:
-            name = str(self._advance().value)
-        name += self._advance().value  # name
+        line, col = self._loc()
+        name = self._parse_statement_name()
         self._advance()  # =
         # Expression may start on the next line
         if self._at_eol():
@@ -780,18 +783,14 @@ class StatementMixin:
             self._skip_newlines()
         expr = self._parse_layer_expr(0)
         self._consume_eol()
-        return ast.LayerAssignment(name=name, expression=expr, **loc)
+        return ast.LayerAssignment(name=name, expression=expr, line=line, col=col)
 
     # ------------------------------------------------------------------
     # Rule check block: name { @desc body... }
     # ------------------------------------------------------------------
     def _parse_rule_check_block(self):
-        loc = self._loc()
-        # Handle digit-prefixed names: INTEGER + IDENT
-        name = ''
-        if self._at(TT.INTEGER) and self._peek().type == TT.IDENT:
-            name = str(self._advance().value)
-        name += self._advance().value  # IDENT name
+        line, col = self._loc()
+        name = self._parse_statement_name()
         self._skip_newlines()         # { may be on the next line
         self._advance()               # {
         self._skip_newlines()
@@ -799,7 +798,7 @@ class StatementMixin:
         if self._at(TT.AT):
             desc = self._parse_description_block()
         body = self._parse_block_body()
-        return ast.RuleCheckBlock(name=name, description=desc, body=body, **loc)
+        return ast.RuleCheckBlock(name=name, description=desc, body=body, line=line, col=col)
 
     # ------------------------------------------------------------------
     # @ description lines → list of segment lists
@@ -808,7 +807,7 @@ class StatementMixin:
     # lightweight scan for ^VARNAME references in the raw text.
     # ------------------------------------------------------------------
     @staticmethod
-    def _split_comment_segments(text, loc):
+    def _split_comment_segments(text, line, col):
         """Split raw comment text into str and VarRef segments.
 
         Per the SVRF manual, ^VARNAME dereferences a variable.
@@ -828,7 +827,7 @@ class StatementMixin:
                 # Variable reference ^VARNAME
                 if m.start() > last:
                     segments.append(text[last:m.start()])
-                segments.append(ast.VarRef(name=m.group(3), **loc))
+                segments.append(ast.VarRef(name=m.group(3), line=line, col=col))
                 last = m.end()
         if last < len(text):
             segments.append(text[last:])
@@ -843,11 +842,11 @@ class StatementMixin:
 
     def _parse_at_description(self):
         """Parse one @ line into a list of segments (str | VarRef)."""
-        loc = self._loc()
+        line, col = self._loc()
         self._advance()  # @
         if self._at(TT.COMMENT_TEXT):
             raw = self._advance().value
-            segments = self._split_comment_segments(raw, loc)
+            segments = self._split_comment_segments(raw, line, col)
         else:
             segments = ['']
         self._consume_eol()
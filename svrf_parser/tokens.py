@@ -1,9 +1,13 @@
 """Token types and Token class for the SVRF lexer."""
 
-from enum import Enum, auto
+import sys
+from enum import IntEnum, auto
+from types import SimpleNamespace
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    """Token kinds.  An IntEnum so parser tables can be lists indexed by type."""
+
     # Literals
     IDENT = auto()
     INTEGER = auto()
@@ -61,14 +65,47 @@ class TokenType(Enum):
     COMMENT_TEXT = auto()  # raw text after @ in rule check descriptions
 
 
+# Member lookups on an Enum class go through the EnumType metaclass and cost
+# several times a plain attribute load, and the lexer and parser fetch
+# TT.<name> for nearly every comparison.  TT holds the same members on a
+# plain namespace object: TT.NEWLINE is TokenType.NEWLINE, only cheaper to
+# look up.
+TT = SimpleNamespace(**TokenType.__members__)
+
+
 class Token:
-    __slots__ = ('type', 'value', 'line', 'col')
+    __slots__ = ('type', 'value', 'line', 'col', 'raw', 'role', 'upper', 'bp')
+    type: TokenType
+    value: object       # str, or int/float for numeric literals
+    line: int
+    col: int
+    raw: str
+    role: int
+    upper: str          # None for non-IDENT tokens
+    bp: int
 
-    def __init__(self, type: TokenType, value, line: int, col: int):
+    def __init__(self, type: TokenType, value, line: int, col: int,
+                 raw: str = None, upper: str = None):
         self.type = type
         self.value = value
         self.line = line
         self.col = col
+        # Source spelling of the token.  Only differs from ``value`` for
+        # numeric literals, whose value is the converted int/float.
+        self.raw = value if raw is None else raw
+        # Parser-assigned classification of IDENT tokens (0 = plain name),
+        # filled in by the parser's prescan pass.
+        self.role = 0
+        # Cached layer-expression binding power of an IDENT token (-1 until
+        # the parser first asks for it).
+        self.bp = -1
+        # Uppercased spelling of IDENT tokens (keywords are case-insensitive);
+        # None for every other token type.  Interned, so keyword-set probes
+        # against the (interned) keyword literals match by identity.  The
+        # lexer passes it in from its per-name cache.
+        if upper is None and type is TokenType.IDENT:
+            upper = sys.intern(value.upper())
+        self.upper = upper
 
     def __repr__(self):
         return f"Token({self.type.name}, {self.value!r}, L{self.line}:{self.col})"
@@ -70,10 +70,10 @@ def run_tests():
         t0 = 0
         try:
             t0 = time.time()
-            tree, warnings = parse_file_with_diagnostics(path)
+            tree, warnings, suppressed = parse_file_with_diagnostics(path)
             elapsed = time.time() - t0
             n_stmts = len(tree.statements) if tree else 0
-            n_warnings = len(warnings)
+            n_warnings = len(warnings) + suppressed
 
             # Calculate SVRF node ratio
             svrf_count = sum(
@@ -38,7 +38,7 @@ def parse_snippet():
 
 @pytest.fixture
 def parse_snippet_with_warnings():
-    """Parse SVRF text and return (Program, warnings)."""
+    """Parse SVRF text and return (Program, warnings, suppressed)."""
     def _parse(text):
         return parse_with_diagnostics(text, filename="<test>")
     return _parse
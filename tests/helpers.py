@@ -114,7 +114,7 @@ def count_node_types(tree: Program) -> Counter:
 
 def collect_warnings(text: str) -> list:
     """Parse text and return only the warnings list."""
-    _, warnings = parse_with_diagnostics(text, filename="<test>")
+    _, warnings, _ = parse_with_diagnostics(text, filename="<test>")
     return warnings
 
 
@@ -44,6 +44,14 @@ class TestUnaryBoolOps:
         node = parse_expr("COPY M1")
         assert_node_type(node, UnaryOp, op="COPY")
 
+    def test_prefix_chain(self):
+        node = parse_expr("COPY NOT !M1 AND M2")
+        assert_node_type(node, BinaryOp, op="AND")
+        assert_node_type(node.left, UnaryOp, op="COPY")
+        assert_node_type(node.left.operand, UnaryOp, op="NOT")
+        assert_node_type(node.left.operand.operand, UnaryOp, op="NOT")
+        assert_node_type(node.left.operand.operand.operand, LayerRef, name="M1")
+
 
 class TestPrefixOr:
     def test_prefix_or(self):
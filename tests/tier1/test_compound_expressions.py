@@ -5,6 +5,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from tests.helpers import parse_expr, parse_one, assert_node_type, collect_warnings
+from svrf_parser import parse_with_diagnostics, validate_svrf
 from svrf_parser.ast_nodes import *
 
 
@@ -90,6 +91,31 @@ class TestNegativeCases:
         warnings = collect_warnings("X = (A AND B")
         # Should parse without exception (may produce warnings)
 
+    def test_warnings_capped(self):
+        """Warnings past the cap are counted, not stored."""
+        _, warnings, suppressed = parse_with_diagnostics("CMACRO X" + " )" * 1005)
+        assert len(warnings) == 1000
+        assert warnings[0] == "L1:10: Unexpected token RPAREN (')') in CMACRO invocation, skipping"
+        assert warnings[-1].startswith("L1:")
+        assert suppressed == 5
+        result = validate_svrf("LAYER M1 1\nCMACRO X" + " )" * 1005)
+        assert len(result.warnings) == 1000
+        assert result.suppressed_warnings == 5
+
+    def test_deep_bare_expression_recovers(self):
+        """Runaway nesting on a bare line is skipped with a warning."""
+        warnings = collect_warnings("(" * 3000 + "A" + ")" * 3000)
+        assert any("Exception in bare expression parse" in w
+                   for w in warnings)
+
+    def test_deep_property_expression_recovers(self):
+        """Runaway nesting inside a property block is skipped with a warning."""
+        deep = "(" * 1000 + "x" + ")" * 1000
+        for line in (deep, "y = " + deep, "y = " + "a ? " * 1000 + "b" + " : c" * 1000):
+            warnings = collect_warnings(
+                "DMACRO M a {\n[ PROPERTY p\n " + line + "\n]\n}\n")
+            assert len(warnings) == 1
+
     def test_empty_assignment(self):
         """Empty assignment should not crash."""
         warnings = collect_warnings("X =")
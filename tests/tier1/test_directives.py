@@ -52,6 +52,31 @@ class TestVariable:
         node = parse_one("VARIABLE WIDTH 0.1")
         assert_node_type(node, VariableDef, name="WIDTH")
 
+    def test_variable_spaced_digit_name(self):
+        node = parse_one("VARIABLE 1 L 0.5")
+        assert_node_type(node, VariableDef, name="1L")
+        assert_node_type(node.expr, NumberLiteral, value=0.5)
+
+    def test_variable_func_call_args(self):
+        node = parse_one("VARIABLE W MAX(A, 2,\n B + 1)")
+        call = node.expr
+        assert_node_type(call, FuncCall, name="MAX")
+        assert_node_type(call.args[0], LayerRef, name="A")
+        assert_node_type(call.args[1], NumberLiteral, value=2)
+        assert_node_type(call.args[2], BinaryOp, op="+")
+
+    def test_variable_arith_precedence(self):
+        node = parse_one("VARIABLE W A - B - C * D ^ E ^ F")
+        # ((A - B) - (C * ((D ^ E) ^ F))): every binary op is left-assoc
+        expr = node.expr
+        assert_node_type(expr, BinaryOp, op="-")
+        assert_node_type(expr.left, BinaryOp, op="-")
+        assert_node_type(expr.right, BinaryOp, op="*")
+        power = expr.right.right
+        assert_node_type(power, BinaryOp, op="^")
+        assert_node_type(power.left, BinaryOp, op="^")
+        assert_node_type(power.right, LayerRef, name="F")
+
 
 class TestRdbDirective:
     def test_rdb_basic(self):
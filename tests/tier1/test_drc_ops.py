@@ -15,6 +15,10 @@ class TestDRCBasic:
         assert len(node.operands) >= 1
         assert len(node.constraints) >= 1
 
+    def test_operand_location(self):
+        node = parse_expr("INT M1 < 0.1")
+        assert (node.operands[0].line, node.operands[0].col) == (1, 14)
+
     def test_int_two_layers(self):
         node = parse_expr("INT M1 M2 < 0.1")
         assert_node_type(node, DRCOp, op="INT")
@@ -36,6 +40,14 @@ class TestDRCBasic:
         node = parse_expr("DENSITY M1 < 0.5 > 0.1")
         assert_node_type(node, DRCOp, op="DENSITY")
 
+    def test_numeric_modifier_keeps_spelling(self):
+        node = parse_expr("DENSITY M1 < 0.5 WINDOW 0.50 STEP 1e-3")
+        assert node.modifiers == ["WINDOW", "0.50", "STEP", "1e-3"]
+
+    def test_signed_modifier(self):
+        node = parse_expr("DENSITY M1 < 0.5 WINDOW -1.5 STEP - X")
+        assert node.modifiers == ["WINDOW", "-1.5", "STEP", "-", "X"]
+
 
 class TestDRCModifiers:
     def test_drc_with_modifiers(self):
@@ -47,6 +59,12 @@ class TestDRCModifiers:
         node = parse_expr("INT [M1 AND M2] < 0.1")
         assert_node_type(node, DRCOp, op="INT")
 
+    def test_drc_bracket_operand_nested(self):
+        node = parse_expr("INT [AREA(M1) > [2]] M2 < 0.1")
+        assert_node_type(node, DRCOp, op="INT")
+        assert node.operands[0].value == "AREA ( M1 ) > [ 2 ]"
+        assert len(node.operands) == 2
+
 
 class TestOffgrid:
     def test_offgrid_basic(self):
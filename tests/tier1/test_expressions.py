@@ -19,6 +19,12 @@ class TestConstraints:
         assert_node_type(node, ConstrainedExpr)
         assert node.constraints[0].op == "!="
 
+    def test_constraint_value_kinds(self):
+        node = parse_expr("INT M1 > -0.1 < (W+1)")
+        assert_node_type(node, DRCOp)
+        assert node.constraints[0].value == -0.1
+        assert isinstance(node.constraints[1].value, BinaryOp)
+
 
 class TestWithExpr:
     def test_with_width(self):
@@ -53,3 +59,17 @@ class TestMiscExpr:
         node = parse_expr("-0.5")
         assert_node_type(node, NumberLiteral)
         assert node.value == -0.5
+
+
+class TestExpressionNodes:
+    def test_no_instance_dict(self):
+        node = parse_expr("(M1 AND M2) > 0.1")
+        assert not hasattr(node, "__dict__")
+        assert not hasattr(node.expr, "__dict__")
+
+    def test_empty_list_fields_kept(self):
+        # Empty lists from the parser are stored as-is, not replaced
+        modifiers = []
+        node = DRCOp(op="INT", modifiers=modifiers)
+        assert node.modifiers is modifiers
+        assert DRCOp(op="INT").constraints == []
@@ -0,0 +1,25 @@
+"""Tier 1 unit tests: Lexer cache."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from svrf_parser import Lexer, Parser
+from svrf_parser.ast_nodes import *
+
+
+class TestLexerCache:
+    def test_same_text_reuses_tokens(self):
+        text = "LAYER M1 10\nINT M1 < 0.1\n"
+        first = Lexer.from_cache(text, "<cache>")
+        second = Lexer.from_cache(text, "<cache>")
+        assert second is first
+        assert Lexer.from_cache(text + "\n", "<cache>") is not first
+
+    def test_cached_tokens_parse_twice(self):
+        text = "LAYER M1 10\nM2 = M1 AND M1\n"
+        for _ in range(2):
+            tokens = Lexer.from_cache(text, "<cache>").tokens()
+            tree = Parser(tokens).parse()
+            assert isinstance(tree.statements[1], LayerAssignment)
+            assert isinstance(tree.statements[1].expression, BinaryOp)
@@ -23,3 +23,14 @@ class TestIfExpr:
         node = parse_one(text)
         assert_node_type(node, DMacro)
         assert len(node.body) >= 1
+
+    def test_if_elseif_else_bodies(self):
+        text = ("[PROPERTY p\nIF (a > 1) {\n  p = 1\n} ELSE IF (a > 0) {\n"
+                "  p = 2\n}\nELSE {\n  p = 3\n  p = 4\n}\n]")
+        node = parse_one(text)
+        if_expr = node.body[0]
+        assert_node_type(if_expr, IfExpr)
+        assert len(if_expr.then_body) == 1
+        assert len(if_expr.elseifs) == 1
+        assert len(if_expr.elseifs[0][1]) == 1
+        assert len(if_expr.else_body) == 2
@@ -39,3 +39,19 @@ class TestRuleCheckBlock:
         node = parse_one(text)
         assert_node_type(node, RuleCheckBlock, name="check1")
         assert len(node.body) >= 2
+
+    def test_digit_prefix_name(self):
+        text = "4t_para_gate {\n  EXT 15V_GATE < 0.2\n}"
+        node = parse_one(text)
+        assert_node_type(node, RuleCheckBlock, name="4t_para_gate")
+        assert node.body[0].operands[0].name == "15V_GATE"
+
+    def test_number_led_statement(self):
+        text = "check1 {\n  18 NOT OD18\n}"
+        node = parse_one(text)
+        assert_node_type(node.body[0], BinaryOp, op="NOT")
+        assert_node_type(node.body[0].left, NumberLiteral, value=18)
+
+    def test_spaced_digit_prefix_name(self):
+        node = parse_one("4 t_gate {\n  EXT M1 < 0.2\n}")
+        assert_node_type(node, RuleCheckBlock, name="4t_gate")
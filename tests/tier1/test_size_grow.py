@@ -26,6 +26,14 @@ class TestSizeOps:
         node = parse_expr("SIZE M1 BY 0.1 INSIDE OF M2")
         assert_node_type(node, DRCOp, op="SIZE")
 
+    def test_size_modifier_arguments(self):
+        node = parse_expr("SIZE M1 BY 0.1 BEVEL 2 STEP 0.05 UNDEROVER")
+        mods = node.modifiers
+        assert mods[1:3] == ["BEVEL", 2]
+        assert mods[3] == "STEP"
+        assert_node_type(mods[4], NumberLiteral, value=0.05)
+        assert mods[5:] == ["UNDEROVER"]
+
 
 class TestGrowShrink:
     def test_grow_basic(self):
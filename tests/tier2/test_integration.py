@@ -48,20 +48,20 @@ class TestSampleParsing:
     @pytest.mark.parametrize("sample_path", _ALL_SAMPLES, ids=_SAMPLE_IDS)
     def test_parses_without_exception(self, sample_path):
         text = sample_path.read_text(encoding='utf-8', errors='replace')
-        tree, warnings = parse_with_diagnostics(text, filename=str(sample_path))
+        tree, warnings, _ = parse_with_diagnostics(text, filename=str(sample_path))
         assert tree is not None
 
     @pytest.mark.parametrize("sample_path", _ALL_SAMPLES, ids=_SAMPLE_IDS)
     def test_has_statements(self, sample_path):
         text = sample_path.read_text(encoding='utf-8', errors='replace')
-        tree, _ = parse_with_diagnostics(text, filename=str(sample_path))
+        tree, _, _ = parse_with_diagnostics(text, filename=str(sample_path))
         assert len(tree.statements) > 0
 
     @pytest.mark.parametrize("sample_path", _ALL_SAMPLES, ids=_SAMPLE_IDS)
     def test_svrf_node_ratio(self, sample_path):
         """At least 20% of top-level statements should be SVRF constructs."""
         text = sample_path.read_text(encoding='utf-8', errors='replace')
-        tree, _ = parse_with_diagnostics(text, filename=str(sample_path))
+        tree, _, _ = parse_with_diagnostics(text, filename=str(sample_path))
         total = len(tree.statements)
         svrf_count = sum(
             1 for s in tree.statements if isinstance(s, _SVRF_NODE_TYPES)